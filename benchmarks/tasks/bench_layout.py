@@ -0,0 +1,116 @@
+"""
+Benchmark for applying Task layouts to a TaskWindow.
+
+Measures the time taken by ``TaskWindow.activate_task`` when switching between
+two tasks with many dock panes, and by ``TaskWindow.set_window_layout`` when
+re-applying the window's own layout.
+
+Note: Run it with
+$ ETS_TOOLKIT='qt4' python bench_layout.py [number of panes]
+"""
+# Standard library imports.
+import sys
+import timeit
+
+# Enthought library imports.
+from pyface.api import GUI
+from pyface.tasks.api import DockPane, PaneItem, Tabbed, Task, TaskLayout, \
+    TaskPane, TaskWindow, VSplitter
+from traits.api import Int
+
+
+class BenchmarkTask(Task):
+    """ A task with a configurable number of empty dock panes.
+    """
+
+    #### 'BenchmarkTask' interface ############################################
+
+    # The number of dock panes to create.
+    n_panes = Int(20)
+
+    ###########################################################################
+    # 'Task' interface.
+    ###########################################################################
+
+    def create_central_pane(self):
+        return TaskPane()
+
+    def create_dock_panes(self):
+        return [ DockPane(id=self._pane_id(i), name='Pane %i' % i)
+                 for i in range(self.n_panes) ]
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _default_layout_default(self):
+        # Alternate between split and tabbed groups of four panes, spread
+        # over the left and right dock areas.
+        groups = []
+        for start in range(0, self.n_panes, 4):
+            items = [ PaneItem(self._pane_id(i))
+                      for i in range(start, min(start + 4, self.n_panes)) ]
+            if (start // 4) % 2:
+                groups.append(Tabbed(*items))
+            else:
+                groups.append(VSplitter(*items))
+        half = (len(groups) + 1) // 2
+        left = VSplitter(*groups[:half]) if groups[:half] else None
+        right = VSplitter(*groups[half:]) if groups[half:] else None
+        return TaskLayout(left=left, right=right)
+
+    def _pane_id(self, index):
+        return '%s.pane_%i' % (self.id, index)
+
+
+def create_window(n_panes):
+    """ Create and open a TaskWindow with two tasks of 'n_panes' dock panes.
+    """
+    window = TaskWindow(size=(1024, 768))
+    for i in range(2):
+        window.add_task(BenchmarkTask(id='benchmark.task_%i' % i,
+                                      n_panes=n_panes))
+    window.open()
+    return window
+
+
+def benchmark(n_panes=20, repeat=5, number=10):
+    """ Returns the best times, in seconds, of activating a task and of setting
+    a window layout.
+    """
+    gui = GUI()
+    window = create_window(n_panes)
+    tasks = window.tasks
+
+    def activate_tasks():
+        for task in tasks:
+            window.activate_task(task)
+        gui.process_events()
+
+    window_layout = window.get_window_layout()
+
+    def set_window_layout():
+        window.set_window_layout(window_layout)
+        gui.process_events()
+
+    try:
+        times = {
+            'activate_task': min(timeit.repeat(
+                activate_tasks, repeat=repeat, number=number)) /
+                (number * len(tasks)),
+            'set_window_layout': min(timeit.repeat(
+                set_window_layout, repeat=repeat, number=number)) / number,
+        }
+    finally:
+        window.close()
+    return times
+
+
+def main(argv):
+    n_panes = int(argv[1]) if len(argv) > 1 else 20
+    for name, seconds in sorted(benchmark(n_panes).items()):
+        print('%s (%i panes): %.2f ms' % (name, n_panes, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
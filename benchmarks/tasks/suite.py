@@ -0,0 +1,245 @@
+"""
+Performance benchmark suite for the Tasks framework.
+
+Each benchmark is timed repeatedly; the best time per operation is
+recorded. Results are written as JSON and compared against the regression
+thresholds in ``thresholds.json`` (seconds per operation). The exit status is
+non-zero if any benchmark exceeds its threshold.
+
+The benchmarks run offscreen where the Qt platform supports it.
+
+Note: Run it with
+$ ETS_TOOLKIT='qt4' python suite.py [-o results.json] [-t thresholds.json]
+                                    [benchmark names...]
+"""
+# Standard library imports.
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from timeit import default_timer
+
+# Render offscreen unless another platform has been requested. This must
+# happen before Qt is imported.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Enthought library imports.
+from pyface.api import GUI
+from pyface.tasks.api import Editor, SplitEditorAreaPane, Task, TaskWindow
+from traits.api import Instance
+
+# Local imports.
+from bench_layout import BenchmarkTask, create_window
+
+# The default location of the regression thresholds.
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               'thresholds.json')
+
+# The registered benchmarks, in order of registration.
+BENCHMARKS = []
+
+###############################################################################
+# Benchmark registration.
+###############################################################################
+
+def benchmark(name, number=10, repeat=3):
+    """ Registers a benchmark.
+
+    The decorated function receives a GUI and returns a tuple of form
+    (operation, count, teardown), where 'operation' is the callable to time,
+    'count' is the number of operations it performs per call, and 'teardown'
+    is a callable that releases its resources (or None). If 'operation'
+    returns a number, it is used as the time taken by the call, so that
+    operations can exclude their own preparation from the measurement.
+    """
+    def decorator(setup):
+        BENCHMARKS.append((name, setup, number, repeat))
+        return setup
+    return decorator
+
+###############################################################################
+# Benchmarks.
+###############################################################################
+
+N_PANES = 20
+N_EDITORS = 200
+
+
+@benchmark('task_window.add_task', number=5)
+def add_task(gui):
+    window = create_window(N_PANES)
+    ids = itertools.count()
+
+    def operation():
+        # The added tasks have their own ids so that they do not clash with
+        # the window's tasks, and each is removed again (untimed) so that
+        # every call adds a task to the same window.
+        task = BenchmarkTask(id='benchmark.added_%i' % next(ids),
+                             n_panes=N_PANES)
+
+        start = default_timer()
+        window.add_task(task)
+        gui.process_events()
+        elapsed = default_timer() - start
+
+        window.remove_task(task)
+        gui.process_events()
+        return elapsed
+
+    return operation, 1, window.close
+
+
+@benchmark('task_window.activate_task')
+def activate_task(gui):
+    window = create_window(N_PANES)
+    tasks = window.tasks
+
+    def operation():
+        for task in reversed(tasks):
+            window.activate_task(task)
+        gui.process_events()
+
+    return operation, len(tasks), window.close
+
+
+@benchmark('task_window.remove_task', number=1, repeat=5)
+def remove_task(gui):
+    window = create_window(N_PANES)
+    task = BenchmarkTask(id='benchmark.removed_task', n_panes=N_PANES)
+
+    def operation():
+        window.add_task(task)
+        window.activate_task(task)
+        gui.process_events()
+
+        start = default_timer()
+        window.remove_task(task)
+        gui.process_events()
+        return default_timer() - start
+
+    return operation, 1, window.close
+
+
+@benchmark('task_window.window_layout_round_trip')
+def window_layout_round_trip(gui):
+    window = create_window(N_PANES)
+
+    def operation():
+        window.set_window_layout(window.get_window_layout())
+        gui.process_events()
+
+    return operation, 1, window.close
+
+
+@benchmark('split_editor_area_pane.add_remove_editor', number=1, repeat=3)
+def add_remove_editors(gui):
+    window = TaskWindow(size=(1024, 768))
+    task = EditorAreaTask()
+    window.add_task(task)
+    window.open()
+    editor_area = task.editor_area
+
+    def operation():
+        editors = [ Editor(name='Editor %i' % i) for i in range(N_EDITORS) ]
+        for editor in editors:
+            editor_area.add_editor(editor)
+        gui.process_events()
+        for editor in editors:
+            editor_area.remove_editor(editor)
+        gui.process_events()
+
+    return operation, 2 * N_EDITORS, window.close
+
+
+class EditorAreaTask(Task):
+    """ A task with a SplitEditorAreaPane as its central pane.
+    """
+
+    id = 'benchmark.editor_area_task'
+
+    editor_area = Instance(SplitEditorAreaPane, ())
+
+    def create_central_pane(self):
+        return self.editor_area
+
+###############################################################################
+# Runner.
+###############################################################################
+
+def run(names=None):
+    """ Runs the benchmarks with the given names (or all of them), returning
+    a dictionary of the best times in seconds per operation.
+    """
+    gui = GUI()
+    results = {}
+    for name, setup, number, repeat in BENCHMARKS:
+        if names and name not in names:
+            continue
+        operation, count, teardown = setup(gui)
+        try:
+            times = [ _time(operation, number) for i in range(repeat) ]
+        finally:
+            if teardown is not None:
+                teardown()
+            gui.process_events()
+        results[name] = min(times) / (number * count)
+    return results
+
+
+def check(results, thresholds):
+    """ Returns the names of the benchmarks that exceed their thresholds.
+    """
+    return sorted(name for name, seconds in results.items()
+                  if name in thresholds and seconds > thresholds[name])
+
+
+def _time(operation, number):
+    """ Returns the total time taken by 'number' calls of an operation.
+    """
+    total = 0.0
+    for i in range(number):
+        start = default_timer()
+        measured = operation()
+        elapsed = default_timer() - start
+        total += elapsed if measured is None else measured
+    return total
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Tasks benchmark suite.')
+    parser.add_argument('names', nargs='*',
+                        help='the benchmarks to run (default: all)')
+    parser.add_argument('-o', '--output', default='benchmark_results.json',
+                        help='the file to which to write the results')
+    parser.add_argument('-t', '--thresholds', default=THRESHOLDS_PATH,
+                        help='the file containing the regression thresholds')
+    args = parser.parse_args(argv[1:])
+
+    with open(args.thresholds) as f:
+        thresholds = json.load(f)
+
+    results = run(args.names)
+    failures = check(results, thresholds)
+
+    report = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+        'thresholds': thresholds,
+        'failures': failures,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    for name in sorted(results):
+        status = 'FAIL' if name in failures else 'ok'
+        print('%-45s %10.3f ms  %s' % (name, results[name] * 1000, status))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,127 @@
+"""
+Benchmark for the lazily populated Qt Tree.
+
+Measures, for a tree whose root has millions of children, the time taken to
+construct the Tree (which lists the root's children once), to paint it for the
+first time, to fetch the next batch of children (``fetchMore``), and to scroll
+to the end (which fetches every child). Painting and fetching a batch should
+not depend on the number of children, and the other times should grow in
+proportion to it.
+
+The benchmark runs offscreen where the Qt platform supports it.
+
+Note: Run it with
+$ ETS_TOOLKIT='qt4' python bench_tree.py [number of children...]
+"""
+# Standard library imports.
+import os
+import sys
+from timeit import default_timer
+
+# Render offscreen unless another platform has been requested. This must
+# happen before Qt is imported.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Enthought library imports.
+from pyface.api import GUI
+from pyface.qt import QtCore
+from pyface.tree.tree_model import TreeModel
+from pyface.ui.qt4.tree.tree import Tree
+from traits.api import Int
+
+
+class LazyChildren(object):
+    """ A sequence of integer nodes that are only created when asked for.
+    """
+
+    def __init__(self, n):
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.n
+        if not 0 <= index < self.n:
+            raise IndexError(index)
+        return index
+
+
+class LazyTreeModel(TreeModel):
+    """ A tree model whose root has a configurable number of (leaf) children.
+    """
+
+    #### 'LazyTreeModel' interface ############################################
+
+    # The number of children of the root.
+    n_children = Int(1000000)
+
+    ###########################################################################
+    # 'TreeModel' interface.
+    ###########################################################################
+
+    def has_children(self, node):
+        return node == self.root
+
+    def get_children(self, node):
+        if node == self.root:
+            return LazyChildren(self.n_children)
+        return []
+
+
+def benchmark(n_children=1000000, batch_size=1000):
+    """ Returns the times, in seconds, of constructing the tree, painting it
+    for the first time, fetching a batch of children and scrolling to the end.
+    """
+    gui = GUI()
+    model = LazyTreeModel(root='root', n_children=n_children)
+    times = {}
+
+    start = default_timer()
+    tree = Tree(None, model=model, show_root=False, batch_size=batch_size)
+    times['construction'] = default_timer() - start
+
+    try:
+        control = tree.control
+        item_model = control.model()
+        root = QtCore.QModelIndex()
+        control.resize(400, 600)
+
+        start = default_timer()
+        control.show()
+        control.viewport().repaint()
+        gui.process_events()
+        times['first_paint'] = default_timer() - start
+
+        start = default_timer()
+        item_model.fetchMore(root)
+        times['fetch_more'] = default_timer() - start
+
+        # The view fetches the next batch whenever it is scrolled to the last
+        # fetched child.
+        start = default_timer()
+        while item_model.canFetchMore(root):
+            control.scrollToBottom()
+            gui.process_events()
+        times['scroll_to_end'] = default_timer() - start
+
+        if item_model.rowCount(root) != n_children:
+            raise RuntimeError('Only %i of %i children were fetched.' %
+                               (item_model.rowCount(root), n_children))
+    finally:
+        tree.destroy()
+        gui.process_events()
+    return times
+
+
+def main(argv):
+    counts = [ int(arg) for arg in argv[1:] ] or [10000, 100000, 1000000]
+    for n_children in counts:
+        for name, seconds in sorted(benchmark(n_children).items()):
+            print('%s (%i children): %.2f ms' % (name, n_children,
+                                                 seconds * 1000))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
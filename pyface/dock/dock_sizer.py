@@ -118,6 +118,9 @@ SPLIT_HBOTTOM = 5
 # Empty clipping area:
 no_clip = ( 0, 0, 0, 0 )
 
+# Size of the cells of the hit-testing index (in pixels):
+HitCellSize = 32
+
 # Valid sequence types:
 SequenceType = ( list, tuple )
 
@@ -215,6 +218,24 @@ def clear_window ( window ):
     dc.SetPen( wx.TRANSPARENT_PEN )
     dc.DrawRectangle( 0, 0, dx, dy )
 
+#-------------------------------------------------------------------------------
+#  Returns the parts of the drawing environment that a cached rendering of a
+#  tab or splitter depends on:
+#-------------------------------------------------------------------------------
+
+def render_key ( font = None ):
+    """ Returns a tuple describing a font (if specified) and the system colours
+        used to draw tabs and splitters, for use as part of the key of a
+        cached rendering.
+    """
+    font_desc = None
+    if (font is not None) and font.Ok():
+        font_desc = font.GetNativeFontInfoDesc()
+
+    return ( font_desc,
+             wx.SystemSettings_GetColour( wx.SYS_COLOUR_BTNSHADOW ).Get(),
+             wx.SystemSettings_GetColour( wx.SYS_COLOUR_BTNHIGHLIGHT ).Get() )
+
 #-------------------------------------------------------------------------------
 #  Gets a temporary device context for a specified window to draw in:
 #-------------------------------------------------------------------------------
@@ -820,6 +841,38 @@ class DockItem ( HasPrivateTraits ):
         """
         x0, y0, dx, dy = self.drag_bounds
 
+        self._is_tab   = True
+        self.tab_state = state
+
+        mode = self.feature_mode
+        if mode == FEATURE_PRE_NORMAL:
+            mode = self.set_feature_mode( False )
+
+        # Only render the tab if something that affects its appearance has
+        # changed since it was last drawn in this state:
+        # (the key holds on to the image itself, so that a new image can never
+        # be mistaken for an old one that happened to have the same id):
+        image = self.get_image()
+        font  = dc.GetFont()
+        key   = ( dx, dy, self.tab_theme, self.tab_name, mode, image,
+                  self.closeable, self.get_bg_color().Get(),
+                  render_key( font ) )
+        bitmap, text_dy = self._cached_bitmap( state, key, dx, dy, font,
+            lambda bdc: self._render_tab( bdc, dc, state, mode, image ) )
+
+        # Copy the rendered tab to the display:
+        dc.DrawBitmap( bitmap, x0, y0, False )
+
+    #---------------------------------------------------------------------------
+    #  Renders a notebook tab into a buffer:
+    #---------------------------------------------------------------------------
+
+    def _render_tab ( self, bdc, dc, state, mode, image ):
+        """ Renders a notebook tab into a buffer, returning the height of its
+            label text.
+        """
+        dx, dy = self.drag_bounds[2:]
+
         tab_color = self.get_bg_color()
         if state == TabActive:
             pass
@@ -830,11 +883,8 @@ class DockItem ( HasPrivateTraits ):
             r,g,b = tab_color.Get()
             tab_color.Set(min(255, r+20), min(255, g+20), min(255, b+20))
 
-        self._is_tab   = True
-        self.tab_state = state
-        theme          = self.tab_theme
-        slice          = theme.image_slice
-        bdc            = BufferDC( dc, dx, dy )
+        theme = self.tab_theme
+        slice = theme.image_slice
 
         self.fill_bg_color(bdc, 0, 0, dx, dy)
 
@@ -882,10 +932,6 @@ class DockItem ( HasPrivateTraits ):
                     text_dy) / 2))
         x = ox + slice.xleft + tc.left
 
-        mode = self.feature_mode
-        if mode == FEATURE_PRE_NORMAL:
-            mode = self.set_feature_mode( False )
-
         # Draw the feature 'trigger' icon (if necessary):
         if mode != FEATURE_NONE:
             if mode not in FEATURES_VISIBLE:
@@ -894,7 +940,6 @@ class DockItem ( HasPrivateTraits ):
             x += (DockImages._tab_feature_width + 3)
 
         # Draw the image (if necessary):
-        image = self.get_image()
         if image is not None:
             bdc.DrawBitmap( image, x, y, True )
             x += (image.GetWidth() + 3)
@@ -906,8 +951,46 @@ class DockItem ( HasPrivateTraits ):
         if self.closeable:
             bdc.DrawBitmap( DockImages._close_tab, x + tdx + 5, y + 2, True )
 
-        # Copy the buffer to the display:
-        bdc.copy( x0, y0 )
+        return text_dy
+
+    #---------------------------------------------------------------------------
+    #  Returns a cached rendering of the item:
+    #---------------------------------------------------------------------------
+
+    def _cached_bitmap ( self, slot, key, dx, dy, font, render ):
+        """ Returns a tuple of the form: ( bitmap, result ), where 'bitmap' is
+            a 'dx' by 'dy' bitmap drawn by calling 'render( dc )' on a memory
+            DC, and 'result' is the value it returned. The bitmap is reused
+            for as long as the key for the specified slot stays the same.
+        """
+        bitmaps = self._bitmaps
+        if bitmaps is None:
+            bitmaps = self._bitmaps = {}
+
+        cached = bitmaps.get( slot )
+        if (cached is not None) and (cached[0] == key):
+            return cached[1:]
+
+        bitmap = wx.EmptyBitmap( dx, dy )
+        bdc    = wx.MemoryDC()
+        bdc.SelectObject( bitmap )
+        if font is not None:
+            bdc.SetFont( font )
+        result = render( bdc )
+        bdc.SelectObject( wx.NullBitmap )
+
+        bitmaps[ slot ] = ( key, bitmap, result )
+
+        return ( bitmap, result )
+
+    #---------------------------------------------------------------------------
+    #  Discards any cached renderings of the item:
+    #---------------------------------------------------------------------------
+
+    def reset_bitmaps ( self ):
+        """ Discards any cached renderings of the item.
+        """
+        self._bitmaps = None
 
     #---------------------------------------------------------------------------
     #  Draws a fixed drag bar:
@@ -1188,6 +1271,50 @@ class DockItem ( HasPrivateTraits ):
                     self.set_feature_mode( False )
                 self._redraw_control()
 
+    #---------------------------------------------------------------------------
+    #  Discards the hit-testing index of the tree containing the item:
+    #---------------------------------------------------------------------------
+
+    def reset_hit_index ( self ):
+        """ Discards the hit-testing index of the tree containing the item (it
+            is rebuilt the next time it is needed).
+        """
+        item = self
+        while item.parent is not None:
+            item = item.parent
+        item._hit_index = None
+
+    #---------------------------------------------------------------------------
+    #  Marks the item as needing to be laid out again:
+    #---------------------------------------------------------------------------
+
+    def invalidate_layout ( self ):
+        """ Marks the item as needing to be laid out again the next time the
+            dirty parts of its DockWindow are updated (see
+            DockSizer.UpdateLayout).
+        """
+        root = self
+        while root.parent is not None:
+            root = root.parent
+
+        if root._dirty_groups is None:
+            root._dirty_groups = []
+        root._dirty_groups.append( self )
+
+    #---------------------------------------------------------------------------
+    #  Handles the 'bounds' or 'drag_bounds' traits being changed:
+    #---------------------------------------------------------------------------
+
+    def _bounds_changed ( self ):
+        """ Handles the 'bounds' trait being changed.
+        """
+        self.reset_hit_index()
+
+    def _drag_bounds_changed ( self ):
+        """ Handles the 'drag_bounds' trait being changed.
+        """
+        self.reset_hit_index()
+
 #-------------------------------------------------------------------------------
 #  'DockSplitter' class:
 #-------------------------------------------------------------------------------
@@ -1227,40 +1354,51 @@ class DockSplitter ( DockItem ):
         else:
             x, y, dx, dy = self.bounds
 
-        image    = DockImages.get_splitter_image( self.state )
+        state    = self.state
+        image    = DockImages.get_splitter_image( state )
         idx, idy = image.GetWidth(), image.GetHeight()
 
-        self.fill_bg_color( dc, x, y, dx, dy )
+        # Only render the splitter if its appearance has changed since it was
+        # last drawn (moving it does not change its appearance):
+        key       = ( state, self.style, dx, dy, self.get_bg_color().Get(),
+                      render_key() )
+        bitmap, _ = self._cached_bitmap( 'splitter', key, dx, dy, None,
+                        lambda bdc: self._render( bdc, image, dx, dy ) )
+        dc.DrawBitmap( bitmap, x, y, False )
 
+        # Set the hittable area for changing the cursor to be the size of the
+        # image:
         if self.style == 'horizontal':
-            # Draw a line the same color as the system button shadow, which
-            # should be a darkish color in the users color scheme
-            pen = wx.Pen(wx.SystemSettings_GetColour(wx.SYS_COLOUR_BTNSHADOW))
-            dc.SetPen(pen)
-            dc.DrawLine(x+idx+1,y+dy/2,x+dx-2,y+dy/2)
-
-            iy = y+2
-            ix = x
-
-            # sets the hittable area for changing the cursor to be the height of
-            # the image
             dx = idx
         else:
-            # Draw a line the same color as the system button shadow, which
-            # should be a darkish color in the users color scheme
-            pen = wx.Pen(wx.SystemSettings_GetColour(wx.SYS_COLOUR_BTNSHADOW))
-            dc.SetPen(pen)
-            dc.DrawLine(x+dx/2,y+idy+1,x+dx/2,y+dy-2)
+            dy = idy
 
-            iy = y
-            ix = x + 2
+        self._hot_spot = ( x, y, dx, dy )
 
-            # sets the hittable area for changing the cursor to be the width of
-            # the image
-            dy = idy
+    #---------------------------------------------------------------------------
+    #  Renders the contents of the splitter into a buffer:
+    #---------------------------------------------------------------------------
+
+    def _render ( self, dc, image, dx, dy ):
+        """ Renders the contents of the splitter into a buffer.
+        """
+        idx, idy = image.GetWidth(), image.GetHeight()
+
+        self.fill_bg_color( dc, 0, 0, dx, dy )
+
+        # Draw a line the same color as the system button shadow, which
+        # should be a darkish color in the users color scheme
+        pen = wx.Pen(wx.SystemSettings_GetColour(wx.SYS_COLOUR_BTNSHADOW))
+        dc.SetPen(pen)
+
+        if self.style == 'horizontal':
+            dc.DrawLine(idx+1,dy/2,dx-2,dy/2)
+            ix, iy = 0, 2
+        else:
+            dc.DrawLine(dx/2,idy+1,dx/2,dy-2)
+            ix, iy = 2, 0
 
         dc.DrawBitmap( image, ix, iy, True )
-        self._hot_spot = ( x, y, dx, dy )
 
     #---------------------------------------------------------------------------
     #  Gets the cursor to use when the mouse is over the splitter bar:
@@ -1883,10 +2021,23 @@ class DockControl ( DockItem ):
     #---------------------------------------------------------------------------
 
     def _layout ( self, layout = True ):
-        """ Forces the containing DockWindow to be laid out.
+        """ Forces the part of the containing DockWindow affected by the
+            control to be laid out.
         """
         if layout and (self.control is not None):
-            do_later( self.control.GetParent().owner.update_layout )
+            self.invalidate_layout()
+            do_later( self.control.GetParent().owner.update_layout, self )
+
+    #---------------------------------------------------------------------------
+    #  Marks the control as needing to be laid out again:
+    #---------------------------------------------------------------------------
+
+    def invalidate_layout ( self ):
+        """ Marks the control as needing to be laid out again. A control is
+            always laid out by its containing region.
+        """
+        if self.parent is not None:
+            self.parent.invalidate_layout()
 
     #---------------------------------------------------------------------------
     #  Handles the 'activated' event being fired:
@@ -1916,6 +2067,7 @@ class DockControl ( DockItem ):
         """ Handles the 'control' trait being changed.
         """
         self._tab_width = None
+        self.reset_bitmaps()
 
         if old is not None:
             old._dock_control = None
@@ -1932,6 +2084,7 @@ class DockControl ( DockItem ):
         """ Handles the 'name' trait being changed.
         """
         self._tab_width = self._tab_name = None
+        self.reset_bitmaps()
 
     #---------------------------------------------------------------------------
     #  Handles the 'style' trait being changed:
@@ -1951,6 +2104,7 @@ class DockControl ( DockItem ):
         """ Handles the 'image' trait being changed.
         """
         self._image = None
+        self.reset_bitmaps()
 
     #---------------------------------------------------------------------------
     #  Handles the 'visible' trait being changed:
@@ -1959,6 +2113,7 @@ class DockControl ( DockItem ):
     def _visible_changed ( self ):
         """ Handles the 'visible' trait being changed.
         """
+        self.reset_hit_index()
         if self.parent is not None:
             self.parent.show_hide( self )
 
@@ -2201,6 +2356,86 @@ class DockGroup ( DockItem ):
             return None
         return self.contents[0].get_image()
 
+    #---------------------------------------------------------------------------
+    #  Returns whether the group can be laid out without its parent:
+    #---------------------------------------------------------------------------
+
+    def can_layout_alone ( self ):
+        """ Returns whether the group can be laid out again within its current
+            bounds without also laying out its parent.
+        """
+        parent = self.parent
+        if parent is None:
+            return False
+
+        # If the group has been shown or hidden since it was last laid out,
+        # the space allocated to its siblings changes:
+        if self.visible != (self._visible is True):
+            return False
+
+        # A fixed layout section allocates space based on the minimum size of
+        # each item, and a notebook's tabs depend on the names of its items:
+        if isinstance( parent, DockSection ):
+            return parent.resizable
+
+        return not parent.is_notebook
+
+    #---------------------------------------------------------------------------
+    #  Handles the contents of the group being modified:
+    #---------------------------------------------------------------------------
+
+    def contents_modified ( self ):
+        """ Handles the contents of the group being modified. During a
+            structure change (see DockSizer.BeginStructureChange), this is
+            deferred until the change ends.
+        """
+        sizer = self.structure_change_sizer()
+        if sizer is not None:
+            sizer._changed_groups.append( self )
+        else:
+            self.calc_min( True )
+            self.modified = True
+
+    #---------------------------------------------------------------------------
+    #  Updates the visibility of the contents of the group:
+    #---------------------------------------------------------------------------
+
+    def update_visibility ( self ):
+        """ Sets the correct visibility for all contained items. During a
+            structure change (see DockSizer.BeginStructureChange), this is
+            deferred until the change ends.
+        """
+        sizer = self.structure_change_sizer()
+        if sizer is not None:
+            sizer._visibility_groups.append( self )
+        else:
+            self._set_visibility()
+
+    #---------------------------------------------------------------------------
+    #  Returns the DockSizer changing the structure of the group's tree:
+    #---------------------------------------------------------------------------
+
+    def structure_change_sizer ( self ):
+        """ Returns the DockSizer whose structure change (if any) includes the
+            tree containing the group, or None.
+        """
+        root = self
+        while root.parent is not None:
+            root = root.parent
+
+        return root._structure_change
+
+    #---------------------------------------------------------------------------
+    #  Discards any cached renderings of the group and its contents:
+    #---------------------------------------------------------------------------
+
+    def reset_bitmaps ( self ):
+        """ Discards any cached renderings of the group and its contents.
+        """
+        super( DockGroup, self ).reset_bitmaps()
+        for item in self.contents:
+            item.reset_bitmaps()
+
     #---------------------------------------------------------------------------
     #  Gets the cursor to use when the mouse is over the item:
     #---------------------------------------------------------------------------
@@ -2395,7 +2630,7 @@ class DockRegion ( DockGroup ):
             item.set_drag_bounds( *drag_bounds )
 
         # Make sure all of the contained controls have the right visiblity:
-        self._set_visibility()
+        self.update_visibility()
 
     #---------------------------------------------------------------------------
     #  Adds a new control before or after a specified control:
@@ -2606,7 +2841,6 @@ class DockRegion ( DockGroup ):
 
         # If we are in 'notebook mode' check to see if the point is in the
         # empty region outside of any tabs:
-        lx, ty, dx, dy = self.bounds
         if self.is_notebook:
             item             = contents[-1]
             ix, iy, idx, idy = item.drag_bounds
@@ -2615,8 +2849,20 @@ class DockRegion ( DockGroup ):
                                  tab_bounds = ( ix + idx, iy, tdx, idy ),
                                  region     = self )
 
-        # Otherwise, figure out which edge the point is closest to, and
-        # return a DockInfo object describing that edge:
+        # Otherwise, return a DockInfo object for the closest edge:
+        return self.edge_dock_info( x, y )
+
+    #---------------------------------------------------------------------------
+    #  Gets the DockInfo object for the edge closest to a window position:
+    #---------------------------------------------------------------------------
+
+    def edge_dock_info ( self, x, y ):
+        """ Gets the DockInfo object for the edge of the region closest to a
+            specified window position (which must be inside the region).
+        """
+        # Figure out which edge the point is closest to, and return a DockInfo
+        # object describing that edge:
+        lx, ty, dx, dy = self.bounds
         left   = x  - lx
         right  = lx + dx - 1 - x
         top    = y  - ty
@@ -2740,7 +2986,9 @@ class DockRegion ( DockGroup ):
     def set_visibility ( self, visible ):
         """ Sets the visibility of the region.
         """
-        self._visible = visible
+        if visible != self._visible:
+            self._visible = visible
+            self.reset_hit_index()
         active        = self.active
         for i, item in enumerate( self.contents ):
             item.set_visibility( visible and (i == active) )
@@ -2760,7 +3008,8 @@ class DockRegion ( DockGroup ):
                 self.make_active_tab_visible()
                 window = control.control.GetParent()
                 if layout:
-                    do_later( window.owner.update_layout )
+                    self.invalidate_layout()
+                    do_later( window.owner.update_layout, self )
                 else:
                     window.RefreshRect( wx.Rect( *self.bounds ) )
             else:
@@ -2851,7 +3100,7 @@ class DockRegion ( DockGroup ):
     #---------------------------------------------------------------------------
 
     def _active_changed ( self, old, new ):
-        self._set_visibility()
+        self.update_visibility()
 
         # Set the correct tab state for each tab:
         for i, item in enumerate( self.contents ):
@@ -2881,19 +3130,28 @@ class DockRegion ( DockGroup ):
         """ Handles the 'contents' trait being changed.
         """
         self._is_notebook = None
+        self.reset_hit_index()
         for item in self.contents:
             item.parent = self
-        self.calc_min( True )
-        self.modified = True
+        self.contents_modified()
 
     def _contents_items_changed ( self, event ):
         """ Handles the 'contents' trait being changed.
         """
         self._is_notebook = None
+        self.reset_hit_index()
         for item in event.added:
             item.parent = self
-        self.calc_min( True )
-        self.modified = True
+        self.contents_modified()
+
+    #---------------------------------------------------------------------------
+    #  Handles the 'tab_scroll_index' trait being changed:
+    #---------------------------------------------------------------------------
+
+    def _tab_scroll_index_changed ( self ):
+        """ Handles the 'tab_scroll_index' trait being changed.
+        """
+        self.reset_hit_index()
 
     #---------------------------------------------------------------------------
     #  Set the proper visiblity for all contained controls:
@@ -3154,7 +3412,7 @@ class DockSection ( DockGroup ):
         self.splitters = splitters
 
         # Set the visibility for all contained items:
-        self._set_visibility()
+        self.update_visibility()
 
     #---------------------------------------------------------------------------
     #  Layout the contents of the section based on the specified bounds:
@@ -3266,7 +3524,7 @@ class DockSection ( DockGroup ):
         self.splitters = splitters
 
         # Set the visibility for all contained items:
-        self._set_visibility()
+        self.update_visibility()
 
     #---------------------------------------------------------------------------
     #  Layout the contents of the section based on the specified bounds using
@@ -3309,7 +3567,7 @@ class DockSection ( DockGroup ):
                 y += idy + 3
 
         # Set the visibility for all contained items:
-        self._set_visibility()
+        self.update_visibility()
 
     #---------------------------------------------------------------------------
     #  Draws the contents of the section:
@@ -3381,8 +3639,19 @@ class DockSection ( DockGroup ):
         if not force:
             return None
 
-        # Otherwise, figure out which edge the point is closest to, and
-        # return a DockInfo object describing that edge:
+        # Otherwise, return a DockInfo object for the closest edge:
+        return self.edge_dock_info( x, y )
+
+    #---------------------------------------------------------------------------
+    #  Gets the DockInfo object for the edge closest to a window position:
+    #---------------------------------------------------------------------------
+
+    def edge_dock_info ( self, x, y ):
+        """ Gets the DockInfo object for the edge of the section closest to a
+            specified window position.
+        """
+        # Figure out which edge the point is closest to, and return a DockInfo
+        # object describing that edge:
         lx, ty, dx, dy = self.bounds
         left   = lx - x
         right  = x - lx - dx + 1
@@ -3486,7 +3755,9 @@ class DockSection ( DockGroup ):
     def set_visibility ( self, visible ):
         """ Sets the visibility of the group.
         """
-        self._visible = visible
+        if visible != self._visible:
+            self._visible = visible
+            self.reset_hit_index()
         for item in self.contents:
             item.set_visibility( visible )
 
@@ -3580,6 +3851,18 @@ class DockSection ( DockGroup ):
         for item in self.contents:
             item.set_visibility( item.visible )
 
+    #---------------------------------------------------------------------------
+    #  Discards any cached renderings of the section:
+    #---------------------------------------------------------------------------
+
+    def reset_bitmaps ( self ):
+        """ Discards any cached renderings of the section, its contents and its
+            splitters.
+        """
+        super( DockSection, self ).reset_bitmaps()
+        for splitter in self.splitters:
+            splitter.reset_bitmaps()
+
     #---------------------------------------------------------------------------
     #  Handles the 'contents' trait being changed:
     #---------------------------------------------------------------------------
@@ -3587,18 +3870,18 @@ class DockSection ( DockGroup ):
     def _contents_changed ( self ):
         """ Handles the 'contents' trait being changed.
         """
+        self.reset_hit_index()
         for item in self.contents:
             item.parent = self
-        self.calc_min( True )
-        self.modified = True
+        self.contents_modified()
 
     def _contents_items_changed ( self, event ):
         """ Handles the 'contents' trait being changed.
         """
+        self.reset_hit_index()
         for item in event.added:
             item.parent = self
-        self.calc_min( True )
-        self.modified = True
+        self.contents_modified()
 
     #---------------------------------------------------------------------------
     #  Handles the 'splitters' trait being changed:
@@ -3607,12 +3890,14 @@ class DockSection ( DockGroup ):
     def _splitters_changed ( self ):
         """ Handles the 'splitters' trait being changed.
         """
+        self.reset_hit_index()
         for item in self.splitters:
             item.parent = self
 
     def _splitters_items_changed ( self, event ):
         """ Handles the 'splitters' trait being changed.
         """
+        self.reset_hit_index()
         for item in event.added:
             item.parent = self
 
@@ -3787,6 +4072,246 @@ class SetStructureHandler ( object ):
             if dock_control.control is not None:
                 dock_control.control.Show( False )
 
+#-------------------------------------------------------------------------------
+#  'DockHitIndex' class:
+#-------------------------------------------------------------------------------
+
+class DockHitIndex ( object ):
+    """ A flat spatial index of the hit-testing bounds of a dock tree.
+
+        The index records, in the order in which the recursive 'object_at' and
+        'dock_info_at' methods would test them, the bounds of every splitter,
+        drag bar, tab and region (clipped to the bounds of the enclosing
+        region), together with the result of a hit. The entries are bucketed
+        into a grid of cells so that a hit test only looks at the few entries
+        that overlap the cell containing the point. The first entry containing
+        the point that produces a result is the answer the recursive methods
+        would have given.
+    """
+
+    #---------------------------------------------------------------------------
+    #  Initializes the object:
+    #---------------------------------------------------------------------------
+
+    def __init__ ( self, section ):
+        # Lists of ( bounds, result ) tuples for 'object_at' (where 'result'
+        # is the object) and 'dock_info_at' (where 'result' is a callable of
+        # the form: result( x, y, tdx, is_control ) returning a DockInfo or
+        # None):
+        self._objects = []
+        self._infos   = []
+        self._add_section( section, None )
+
+        self._object_cells = self._cells_for( self._objects )
+        self._info_cells   = self._cells_for( self._infos )
+
+    #---------------------------------------------------------------------------
+    #  Returns the object at a specified window position:
+    #---------------------------------------------------------------------------
+
+    def object_at ( self, x, y ):
+        """ Returns the object at a specified window position (or None).
+        """
+        entries = self._objects
+        for i in self._object_cells.get( ( x // HitCellSize,
+                                           y // HitCellSize ), () ):
+            bounds, object = entries[i]
+            bx, by, bdx, bdy = bounds
+            if (bx <= x < (bx + bdx)) and (by <= y < (by + bdy)):
+                return object
+
+        return None
+
+    #---------------------------------------------------------------------------
+    #  Gets the DockInfo object for a specified window position:
+    #---------------------------------------------------------------------------
+
+    def dock_info_at ( self, x, y, tdx, is_control ):
+        """ Gets the DockInfo object for a specified window position (or None).
+        """
+        entries = self._infos
+        for i in self._info_cells.get( ( x // HitCellSize,
+                                         y // HitCellSize ), () ):
+            bounds, result = entries[i]
+            bx, by, bdx, bdy = bounds
+            if (bx <= x < (bx + bdx)) and (by <= y < (by + bdy)):
+                info = result( x, y, tdx, is_control )
+                if info is not None:
+                    return info
+
+        return None
+
+    #---------------------------------------------------------------------------
+    #  Adds the entries for a section:
+    #---------------------------------------------------------------------------
+
+    def _add_section ( self, section, clip ):
+        self._add_info( section.drag_bounds, clip,
+                        _bound_dock_info_at( section ) )
+
+        if section._visible is False:
+            return
+
+        for splitter in section.splitters:
+            self._add_object( splitter.bounds, clip, splitter )
+            self._add_info( splitter.bounds, clip, _splitter_dock_info )
+
+        for item in section.visible_contents:
+            self._add_group( item, clip )
+
+    #---------------------------------------------------------------------------
+    #  Adds the entries for a region:
+    #---------------------------------------------------------------------------
+
+    def _add_region ( self, region, clip ):
+        self._add_info( region.drag_bounds, clip,
+                        _bound_dock_info_at( region ) )
+
+        if region._visible is False:
+            return
+
+        clip     = _intersect( region.bounds, clip )
+        contents = region.visible_contents
+        if region.is_notebook and (region.tab_scroll_index >= 0):
+            cx, cy, cdx, cdy = region._tab_clip_bounds
+            self._add_object( ( cx + cdx, cy + 2,
+                                DockImages._tab_scroller_dx,
+                                DockImages._tab_scroller_dy ), clip, region )
+
+        for item in contents:
+            self._add_object( item.drag_bounds, clip, item )
+            if isinstance( item, DockGroup ):
+                self._add_group( item, clip )
+            else:
+                self._add_info( item.drag_bounds, clip,
+                                _bound_dock_info_at( item ) )
+
+        # The empty part of the tab bar to the right of the last tab:
+        if region.is_notebook:
+            ix, iy, idx, idy = contents[-1].drag_bounds
+            bx, by, bdx, bdy = region.bounds
+            self._add_info( ( ix + idx + 1, iy, bx + bdx - ix - idx - 1, idy ),
+                            clip, _empty_tab_dock_info( region, ix + idx ) )
+
+        # Anything else in the region docks to its closest edge:
+        self._add_info( region.bounds, clip, _edge_dock_info( region ) )
+
+    #---------------------------------------------------------------------------
+    #  Adds the entries for a section or a region:
+    #---------------------------------------------------------------------------
+
+    def _add_group ( self, group, clip ):
+        if isinstance( group, DockSection ):
+            self._add_section( group, clip )
+        else:
+            self._add_region( group, clip )
+
+    #---------------------------------------------------------------------------
+    #  Adds an entry:
+    #---------------------------------------------------------------------------
+
+    def _add_object ( self, bounds, clip, object ):
+        bounds = _intersect( bounds, clip )
+        if (bounds[2] > 0) and (bounds[3] > 0):
+            self._objects.append( ( bounds, object ) )
+
+    def _add_info ( self, bounds, clip, result ):
+        bounds = _intersect( bounds, clip )
+        if (bounds[2] > 0) and (bounds[3] > 0):
+            self._infos.append( ( bounds, result ) )
+
+    #---------------------------------------------------------------------------
+    #  Returns a mapping from grid cells to the entries that overlap them:
+    #---------------------------------------------------------------------------
+
+    def _cells_for ( self, entries ):
+        cells = {}
+        for i, ( bounds, result ) in enumerate( entries ):
+            x, y, dx, dy = [ int( v ) for v in bounds ]
+            for cx in range( x // HitCellSize,
+                             ((x + dx - 1) // HitCellSize) + 1 ):
+                for cy in range( y // HitCellSize,
+                                 ((y + dy - 1) // HitCellSize) + 1 ):
+                    cells.setdefault( ( cx, cy ), [] ).append( i )
+
+        return cells
+
+#-------------------------------------------------------------------------------
+#  Helper functions for the DockHitIndex class:
+#-------------------------------------------------------------------------------
+
+def _intersect ( bounds, clip ):
+    """ Returns the intersection of two bounds (clip may be None).
+    """
+    if clip is None:
+        return bounds
+
+    x,  y,  dx,  dy  = bounds
+    cx, cy, cdx, cdy = clip
+    x0, y0 = max( x, cx ), max( y, cy )
+
+    return ( x0, y0, min( x + dx, cx + cdx ) - x0,
+                     min( y + dy, cy + cdy ) - y0 )
+
+def _bound_dock_info_at ( item ):
+    """ Returns the drag bar or tab DockInfo function for an item.
+    """
+    return lambda x, y, tdx, is_control: DockItem.dock_info_at(
+                                             item, x, y, tdx, is_control )
+
+def _splitter_dock_info ( x, y, tdx, is_control ):
+    """ Returns the DockInfo for a splitter.
+    """
+    return DockInfo( kind = DOCK_SPLITTER )
+
+def _empty_tab_dock_info ( region, tx ):
+    """ Returns the DockInfo function for the empty part of a tab bar.
+    """
+    def dock_info ( x, y, tdx, is_control ):
+        ix, iy, idx, idy = region.visible_contents[-1].drag_bounds
+        return DockInfo( kind       = DOCK_TAB,
+                         tab_bounds = ( tx, iy, tdx, idy ),
+                         region     = region )
+
+    return dock_info
+
+def _edge_dock_info ( region ):
+    """ Returns the DockInfo function for the edges of a region.
+    """
+    return lambda x, y, tdx, is_control: region.edge_dock_info( x, y )
+
+#-------------------------------------------------------------------------------
+#  Helper functions for the DockSizer class:
+#-------------------------------------------------------------------------------
+
+def _unique ( groups ):
+    """ Returns the groups without duplicates (in their original order).
+    """
+    seen   = set()
+    result = []
+    for group in groups:
+        if id( group ) not in seen:
+            seen.add( id( group ) )
+            result.append( group )
+
+    return result
+
+def _outermost ( groups ):
+    """ Returns the groups that are not contained in any of the other groups.
+    """
+    groups = _unique( groups )
+    ids    = set( [ id( group ) for group in groups ] )
+    result = []
+    for group in groups:
+        parent = group.parent
+        while (parent is not None) and (id( parent ) not in ids):
+            parent = parent.parent
+
+        if parent is None:
+            result.append( group )
+
+    return result
+
 #-------------------------------------------------------------------------------
 #  'DockSizer' class:
 #-------------------------------------------------------------------------------
@@ -3805,6 +4330,12 @@ class DockSizer ( wx.PySizer ):
 
         # Finish initializing the sizer itself:
         self._contents = self._structure = self._max_structure = None
+
+        # The state of the current structure change (see
+        # BeginStructureChange):
+        self._changed_groups = self._visibility_groups = None
+        self._structure_roots = None
+        self._structure_change_depth = 0
         if contents is not None:
             self.SetContents( contents )
 
@@ -3832,8 +4363,75 @@ class DockSizer ( wx.PySizer ):
 
         x,   y = self.GetPositionTuple()
         dx, dy = self.GetSizeTuple()
+        self._contents._dirty_groups = None
         self._contents.recalc_sizes( x, y, dx, dy )
 
+    #---------------------------------------------------------------------------
+    #  Lays out the parts of the contents that have been marked as needing it:
+    #---------------------------------------------------------------------------
+
+    def UpdateLayout ( self, window ):
+        """ Lays out again only the groups of the contents that have been
+            marked as needing it (see DockItem.invalidate_layout), and
+            refreshes only their bounds within the window. Returns False
+            (without changing anything) if the whole sizer needs to be laid out
+            again instead.
+        """
+        contents = self._contents
+        if contents is None:
+            return False
+
+        dirty = contents._dirty_groups
+        if not dirty:
+            return True
+
+        groups = []
+        for group in dirty:
+            # Ignore any group that is no longer part of the contents:
+            root = group
+            while root.parent is not None:
+                root = root.parent
+
+            if root is not contents:
+                continue
+
+            # Find the smallest enclosing group that can be laid out on its
+            # own:
+            while (group is not contents) and (not group.can_layout_alone()):
+                group = group.parent
+
+            if group is contents:
+                return False
+
+            groups.append( group )
+
+        contents._dirty_groups = None
+
+        # Only lay out the outermost groups (laying out a group lays out all
+        # of its contents):
+        ids       = set( [ id( group ) for group in groups ] )
+        outermost = []
+        for group in groups:
+            parent = group.parent
+            while (parent is not None) and (id( parent ) not in ids):
+                parent = parent.parent
+
+            if (parent is None) and (group not in outermost):
+                outermost.append( group )
+
+        window.Freeze()
+        try:
+            for group in outermost:
+                group.calc_min()
+                group.recalc_sizes( *group.bounds )
+        finally:
+            window.Thaw()
+
+        for group in outermost:
+            window.RefreshRect( wx.Rect( *group.bounds ) )
+
+        return True
+
     #---------------------------------------------------------------------------
     #  Returns the current sizer contents:
     #---------------------------------------------------------------------------
@@ -3867,6 +4465,10 @@ class DockSizer ( wx.PySizer ):
         if control is not None:
             self._contents.dock_window = control.GetParent().owner
 
+        # Any hit-testing index built while the contents were part of
+        # another tree is no longer valid:
+        self._contents.reset_hit_index()
+
         # If no saved structure exists yet, save the current one:
         if self._structure is None:
             self._structure = self.GetStructure()
@@ -3931,6 +4533,15 @@ class DockSizer ( wx.PySizer ):
         if (section is None) or (not isinstance( structure, DockGroup )):
             return
 
+        self.BeginStructureChange()
+        try:
+            self._set_structure( section, structure, handler )
+        finally:
+            self.EndStructureChange()
+
+    def _set_structure ( self, section, structure, handler ):
+        self._add_structure_root( structure )
+
         # Make sure that DockSections, which have a separate layout algorithm
         # for the first layout, are set as initialized.
         structure.initialized = True
@@ -4000,6 +4611,75 @@ class DockSizer ( wx.PySizer ):
         if self._structure is not None:
             self.SetStructure( window, self._structure )
 
+    #---------------------------------------------------------------------------
+    #  Begins a structure change:
+    #---------------------------------------------------------------------------
+
+    def BeginStructureChange ( self ):
+        """ Begins a structure change. Until the matching
+            'EndStructureChange' call, groups in the contents of the sizer (or
+            in a structure being applied to it) whose contents change defer
+            updating their minimum size, 'modified' state and the visibility
+            of their contents, so that a bulk edit of the dock tree does that
+            work only once per group. Structure changes can be nested.
+        """
+        if self._structure_change_depth == 0:
+            self._changed_groups    = []
+            self._visibility_groups = []
+            self._structure_roots   = []
+            self._add_structure_root( self._contents )
+        self._structure_change_depth += 1
+
+    #---------------------------------------------------------------------------
+    #  Ends a structure change:
+    #---------------------------------------------------------------------------
+
+    def EndStructureChange ( self, window = None ):
+        """ Ends a structure change. When the outermost change ends, each group
+            whose contents changed is updated once, and if a window is
+            specified, it is laid out and refreshed.
+        """
+        self._structure_change_depth -= 1
+        if self._structure_change_depth > 0:
+            return
+
+        for root in self._structure_roots:
+            root._structure_change = None
+
+        changed_groups    = self._changed_groups
+        visibility_groups = self._visibility_groups
+        self._changed_groups = self._visibility_groups = None
+        self._structure_roots = None
+
+        # Update each changed group once (the minimum size of a group includes
+        # that of its contents, so only the outermost groups need it):
+        for group in _unique( changed_groups ):
+            group.modified = True
+
+        for group in _outermost( changed_groups ):
+            group.calc_min( True )
+
+        # Setting the visibility of a group also sets it for all of the groups
+        # it contains:
+        for group in _outermost( visibility_groups ):
+            group._set_visibility()
+
+        if window is not None:
+            window.Layout()
+            window.Refresh()
+
+    #---------------------------------------------------------------------------
+    #  Adds the root of a tree to the current structure change:
+    #---------------------------------------------------------------------------
+
+    def _add_structure_root ( self, root ):
+        """ Adds the root of a tree to the current structure change, so that
+            changes to the groups in the tree are deferred until it ends.
+        """
+        if (root is not None) and (root._structure_change is not self):
+            root._structure_change = self
+            self._structure_roots.append( root )
+
     #---------------------------------------------------------------------------
     #  Toggles the current 'lock' setting of the contents:
     #---------------------------------------------------------------------------
@@ -4029,6 +4709,14 @@ class DockSizer ( wx.PySizer ):
     def ObjectAt ( self, x, y, force = False ):
         """ Returns the object at a specified window position.
         """
+        index = self._get_hit_index()
+        if index is not None:
+            object = index.object_at( x, y )
+            if (object is None) and force and self._contents.is_at( x, y ):
+                object = self._contents
+
+            return object
+
         if self._contents is not None:
             return self._contents.object_at( x, y, force )
 
@@ -4041,11 +4729,38 @@ class DockSizer ( wx.PySizer ):
     def DockInfoAt ( self, x, y, size, is_control ):
         """ Gets a DockInfo object at a specified x, y position.
         """
+        index = self._get_hit_index()
+        if index is not None:
+            info = index.dock_info_at( x, y, size, is_control )
+            if (info is None) and (self._contents._visible is not False):
+                info = self._contents.edge_dock_info( x, y )
+
+            return info
+
         if self._contents is not None:
             return self._contents.dock_info_at( x, y, size, is_control, True )
 
         return no_dock_info
 
+    #---------------------------------------------------------------------------
+    #  Returns the hit-testing index for the contents:
+    #---------------------------------------------------------------------------
+
+    def _get_hit_index ( self ):
+        """ Returns the hit-testing index for the contents (or None if the
+            contents cannot be indexed). The index is rebuilt whenever the
+            layout of the contents has changed since it was last used.
+        """
+        contents = self._contents
+        if not isinstance( contents, DockSection ):
+            return None
+
+        index = contents._hit_index
+        if index is None:
+            index = contents._hit_index = DockHitIndex( contents )
+
+        return index
+
     #---------------------------------------------------------------------------
     #  Minimizes/Maximizes a specified DockControl:
     #---------------------------------------------------------------------------
@@ -28,6 +28,7 @@
 #  Imports:
 #-------------------------------------------------------------------------------
 
+import logging
 import shelve
 import os
 import wx
@@ -35,6 +36,9 @@ import sys
 
 from pyface.api import SystemMetrics
 
+from pyface.state_store \
+    import get_state_store
+
 from traits.api \
     import HasPrivateTraits, Instance, Tuple, Property, Any, Str, List, false
 
@@ -74,6 +78,9 @@ from idock_ui_provider \
 
 is_mac = (sys.platform == 'darwin')
 
+# Logging:
+logger = logging.getLogger( __name__ )
+
 #-------------------------------------------------------------------------------
 #  Global data:
 #-------------------------------------------------------------------------------
@@ -81,6 +88,9 @@ is_mac = (sys.platform == 'darwin')
 # Dictionary of cursors in use:
 cursor_map = {}
 
+# The DockWindow UI preference database (opened on first use):
+_dw_db = None
+
 #-------------------------------------------------------------------------------
 #  DockWindow context menu:
 #-------------------------------------------------------------------------------
@@ -318,6 +328,9 @@ class DockWindow ( HasPrivateTraits ):
         wx.EVT_MOTION(       control, self._mouse_move )
         wx.EVT_LEAVE_WINDOW( control, self._mouse_leave )
 
+        # Set up the handler for the system colours changing:
+        wx.EVT_SYS_COLOUR_CHANGED( control, self._sys_colour_changed )
+
         control.SetDropTarget( PythonDropTarget( self ) )
 
         # Initialize the window background color:
@@ -388,14 +401,21 @@ class DockWindow ( HasPrivateTraits ):
     #  Updates the layout of the window:
     #---------------------------------------------------------------------------
 
-    def update_layout ( self ):
-        """ Updates the layout of the window.
+    def update_layout ( self, item = None ):
+        """ Updates the layout of the window. If 'item' is specified, only the
+            parts of the window that have been marked as needing to be laid out
+            again (using 'invalidate_layout') are updated, if possible.
         """
         # There are cases where a layout has been scheduled for a DockWindow,
         # but then the DockWindow is destroyed, which will cause the calls
         # below to fail. So we catch the 'PyDeadObjectError' exception and
         # ignore it:
         try:
+            sizer = self.sizer
+            if ((item is not None) and (sizer is not None) and
+                sizer.UpdateLayout( self.control )):
+                return
+
             self.control.Layout()
             self.control.Refresh()
         except wx.PyDeadObjectError:
@@ -472,6 +492,7 @@ class DockWindow ( HasPrivateTraits ):
             wx.EVT_RIGHT_UP(         control, None )
             wx.EVT_MOTION(           control, None )
             wx.EVT_LEAVE_WINDOW(     control, None )
+            wx.EVT_SYS_COLOUR_CHANGED( control, None )
 
     #---------------------------------------------------------------------------
     #  Handles repainting the window:
@@ -507,6 +528,23 @@ class DockWindow ( HasPrivateTraits ):
                     return True
         return False
 
+    #---------------------------------------------------------------------------
+    #  Handles the system colours being changed:
+    #---------------------------------------------------------------------------
+
+    def _sys_colour_changed ( self, event ):
+        """ Handles the system colours being changed.
+        """
+        # The cached renderings of the tabs and splitters use the old colours:
+        sizer = self.sizer
+        if isinstance( sizer, DockSizer ):
+            contents = sizer.GetContents()
+            if contents is not None:
+                contents.reset_bitmaps()
+
+        self.control.Refresh()
+        event.Skip()
+
     #---------------------------------------------------------------------------
     #  Handles the window being resized:
     #---------------------------------------------------------------------------
@@ -803,8 +841,14 @@ class DockWindow ( HasPrivateTraits ):
     def on_restore_layout ( self, name ):
         """ Handles the user requesting a specified layout to be restored.
         """
-        self.sizer.SetStructure( self.control, self._get_layout( name ) )
-        self.update_layout()
+        # Apply the whole layout as a single structure change, so that the
+        # window is only laid out once:
+        sizer = self.sizer
+        sizer.BeginStructureChange()
+        try:
+            sizer.SetStructure( self.control, self._get_layout( name ) )
+        finally:
+            sizer.EndStructureChange( self.control )
 
     #---------------------------------------------------------------------------
     #  Handles the user reqesting a specified layout to be deleted:
@@ -882,9 +926,9 @@ class DockWindow ( HasPrivateTraits ):
         if id != '':
             db = self._get_dw_db()
             if db is not None:
-                layouts = db.get( id )
-                db.close()
-                return layouts
+                layouts = dict( db.items( _dw_namespace( id ) ) )
+                if len( layouts ) > 0:
+                    return layouts
 
         return None
 
@@ -895,9 +939,11 @@ class DockWindow ( HasPrivateTraits ):
     def _get_layout_names ( self ):
         """ Gets the names of all current layouts defined for the DockWindow.
         """
-        layouts = self._get_layouts()
-        if layouts is not None:
-            return layouts.keys()
+        id = self.id
+        if id != '':
+            db = self._get_dw_db()
+            if db is not None:
+                return db.keys( _dw_namespace( id ) )
 
         return []
 
@@ -908,9 +954,11 @@ class DockWindow ( HasPrivateTraits ):
     def _get_layout ( self, name ):
         """ Gets the layout data for a specified layout name.
         """
-        layouts = self._get_layouts()
-        if layouts is not None:
-            return layouts.get( name )
+        id = self.id
+        if id != '':
+            db = self._get_dw_db()
+            if db is not None:
+                return db.get( _dw_namespace( id ), name )
 
         return None
 
@@ -923,13 +971,9 @@ class DockWindow ( HasPrivateTraits ):
         """
         id = self.id
         if id != '':
-            db = self._get_dw_db( mode = 'c' )
+            db = self._get_dw_db()
             if db is not None:
-                layouts = db.get( id )
-                if layouts is not None:
-                    del layouts[ name ]
-                    db[ id ] = layouts
-                db.close()
+                db.delete( _dw_namespace( id ), name )
 
     #---------------------------------------------------------------------------
     #  Sets the layout data for a specified layout name:
@@ -940,25 +984,32 @@ class DockWindow ( HasPrivateTraits ):
         """
         id = self.id
         if id != '':
-            db = self._get_dw_db( mode = 'c' )
+            db = self._get_dw_db()
             if db is not None:
-                layouts = db.get( id )
-                if layouts is None:
-                    layouts = {}
-                layouts[ name ] = layout
-                db[ id ] = layouts
-                db.close()
+                db.set( _dw_namespace( id ), name, layout )
 
     #---------------------------------------------------------------------------
     #  Gets a reference to the DockWindow UI preference database:
     #---------------------------------------------------------------------------
 
-    def _get_dw_db ( self, mode = 'r' ):
-        try:
-            return shelve.open( os.path.join( traits_home(), 'dock_window' ),
-                                flag = mode, protocol = -1 )
-        except:
-            return None
+    def _get_dw_db ( self ):
+        """ Gets a reference to the DockWindow UI preference database (a state
+            store whose connection stays open for the session).
+        """
+        global _dw_db
+
+        if _dw_db is None:
+            try:
+                db = get_state_store( os.path.join( traits_home(),
+                                                    'dock_window.db' ) )
+                _migrate_dw_db( db )
+                _dw_db = db
+            except:
+                logger.exception( 'Could not open the DockWindow layout '
+                                  'database' )
+                return None
+
+        return _dw_db
 
     #---------------------------------------------------------------------------
     #  Returns the 'Features' sub_menu:
@@ -1291,3 +1342,38 @@ class ControlInfo ( HasPrivateTraits ):
                         kind    = 'modal',
                         buttons = [ 'OK', 'Cancel' ] )
 
+#-------------------------------------------------------------------------------
+#  Returns the preference database namespace for a DockWindow's layouts:
+#-------------------------------------------------------------------------------
+
+def _dw_namespace ( id ):
+    """ Returns the preference database namespace in which the layouts of the
+        DockWindow with the specified id are kept (keyed by layout name).
+    """
+    return 'dock_window.layouts:' + id
+
+#-------------------------------------------------------------------------------
+#  Moves the layouts saved by older versions into the preference database:
+#-------------------------------------------------------------------------------
+
+def _migrate_dw_db ( db ):
+    """ Moves the layouts saved by older versions (in a 'shelve' database)
+        into the preference database. This is only ever done once.
+    """
+    if db.get( 'dock_window', 'migrated', False ):
+        return
+
+    try:
+        old_db = shelve.open( os.path.join( traits_home(), 'dock_window' ),
+                              flag = 'r', protocol = -1 )
+    except:
+        old_db = None
+
+    with db.transaction():
+        if old_db is not None:
+            for id in old_db.keys():
+                for name, layout in old_db[ id ].items():
+                    db.set( _dw_namespace( id ), name, layout )
+            old_db.close()
+
+        db.set( 'dock_window', 'migrated', True )
@@ -0,0 +1,212 @@
+""" Tests for the hit-testing index of the dock sizer. """
+
+import random
+import unittest
+
+try:
+    from pyface.dock.dock_sizer import DockControl, DockHitIndex, \
+        DockImages, DockRegion, DockSection, DockSplitter
+except ImportError:
+    wx_available = False
+else:
+    wx_available = True
+
+
+# The width of the splitters between the items of a section.
+SPLITTER_SIZE = 6
+
+# The height of a tab or drag bar.
+TAB_SIZE = 20
+
+
+class LayoutFactory(object):
+    """ Builds random dock layouts, with their bounds already set (as they
+    would be after a layout).
+    """
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+
+    def section(self, bounds, depth=0):
+        """ Returns a section of (nested) regions and sections filling the
+        bounds.
+        """
+        rng = self.rng
+        x, y, dx, dy = bounds
+        is_row = rng.random() < 0.5
+        length = dx if is_row else dy
+
+        # Cut the section into items separated by splitters.
+        n = rng.randint(1, min(4, max(1, length // 40)))
+        cuts = sorted(rng.sample(range(20, length - 20, 4 * SPLITTER_SIZE),
+                                 n - 1))
+
+        contents = []
+        splitters = []
+        start = 0
+        for cut in cuts + [length]:
+            end = cut - (SPLITTER_SIZE if cut < length else 0)
+            if is_row:
+                item_bounds = (x + start, y, end - start, dy)
+            else:
+                item_bounds = (x, y + start, dx, end - start)
+
+            if (depth < 3) and (rng.random() < 0.4):
+                contents.append(self.section(item_bounds, depth + 1))
+            else:
+                contents.append(self.region(item_bounds, depth + 1))
+
+            if cut < length:
+                if is_row:
+                    splitter_bounds = (x + end, y, SPLITTER_SIZE, dy)
+                else:
+                    splitter_bounds = (x, y + end, dx, SPLITTER_SIZE)
+                splitters.append(DockSplitter(
+                    bounds=splitter_bounds,
+                    style='vertical' if is_row else 'horizontal',
+                    index=len(splitters)
+                ))
+
+            start = cut
+
+        section = DockSection(is_row=is_row, bounds=bounds)
+        section.contents = contents
+        section.splitters = splitters
+
+        # A section may have been hidden (or not laid out yet).
+        section._visible = rng.choice([True, True, True, None, False])
+
+        return section
+
+    def region(self, bounds, depth=0):
+        """ Returns a region (possibly a notebook, possibly containing a
+        section) filling the bounds.
+        """
+        rng = self.rng
+        x, y, dx, dy = bounds
+
+        contents = []
+        for i in range(rng.randint(1, 4)):
+            if (depth < 3) and (dy > 60) and (rng.random() < 0.1):
+                item = self.section((x, y + TAB_SIZE, dx, dy - TAB_SIZE),
+                                    depth + 1)
+            else:
+                item = DockControl(
+                    name='control %d' % i,
+                    style=rng.choice(['horizontal', 'vertical', 'tab',
+                                      'fixed']),
+                    visible=rng.random() < 0.8
+                )
+            contents.append(item)
+
+        # Make sure that the region is visible.
+        if not [item for item in contents if item.visible]:
+            contents[0].visible = True
+
+        region = DockRegion(bounds=bounds)
+        region.contents = contents
+
+        # Tabs (or drag bars) along the top of the region, which may overlap
+        # each other and spill outside of the region.
+        visible = region.visible_contents
+        tx = x
+        for item in visible:
+            tdx = rng.randint(10, 80)
+            if region.is_notebook:
+                item._is_tab = True
+                item.drag_bounds = self.jitter((tx, y, tdx, TAB_SIZE))
+            else:
+                item._is_tab = False
+                item.drag_bounds = self.jitter((x, y, dx, TAB_SIZE))
+            tx += tdx
+
+        if region.is_notebook and (rng.random() < 0.3):
+            region._tab_clip_bounds = (x, y, max(0, dx - 40), TAB_SIZE)
+            region.tab_scroll_index = rng.randint(0, 2)
+
+        region._visible = rng.choice([True, True, True, None, False])
+
+        return region
+
+    def jitter(self, bounds):
+        """ Returns the bounds moved and resized a little at random.
+        """
+        rng = self.rng
+        x, y, dx, dy = bounds
+        return (x + rng.randint(-8, 8), y + rng.randint(-4, 4),
+                max(0, dx + rng.randint(-8, 8)), dy)
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+class DockHitIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # The bounds of the tab scroller depend on the size of its images.
+        DockImages.init()
+
+    # The index must give the same answers as the recursive 'object_at' and
+    # 'dock_info_at' methods of the section, which scan the whole tree for the
+    # first hit.
+
+    def _info_key(self, info):
+        """ Returns the parts of a DockInfo that determine where to dock. """
+        if info is None:
+            return None
+
+        return (info.kind, info.bounds, info.tab_bounds, info.region,
+                info.control)
+
+    def _check(self, seed):
+        factory = LayoutFactory(seed)
+        rng = factory.rng
+        bounds = (rng.randint(0, 50), rng.randint(0, 50),
+                  rng.randint(50, 800), rng.randint(50, 600))
+        section = factory.section(bounds)
+        index = DockHitIndex(section)
+
+        x, y, dx, dy = bounds
+        for i in range(500):
+            px = rng.randint(x - 20, x + dx + 20)
+            py = rng.randint(y - 20, y + dy + 20)
+            tdx = rng.choice([0, 20, 64])
+            is_control = rng.random() < 0.5
+
+            self.assertIs(index.object_at(px, py),
+                          section.object_at(px, py),
+                          'object at %r (seed %d)' % ((px, py), seed))
+            self.assertEqual(
+                self._info_key(index.dock_info_at(px, py, tdx, is_control)),
+                self._info_key(section.dock_info_at(px, py, tdx,
+                                                    is_control)),
+                'dock info at %r (seed %d)' % ((px, py), seed)
+            )
+
+    def test_single_region(self):
+        """ Does the index agree with a scan of a lone region?
+        """
+        region = DockRegion(bounds=(0, 0, 100, 100))
+        region.contents = [DockControl(name='a', style='tab')]
+        region.contents[0].drag_bounds = (0, 0, 40, TAB_SIZE)
+        section = DockSection(bounds=(0, 0, 100, 100))
+        section.contents = [region]
+        index = DockHitIndex(section)
+
+        for px in range(-5, 105, 5):
+            for py in range(-5, 105, 5):
+                self.assertIs(index.object_at(px, py),
+                              section.object_at(px, py))
+                self.assertEqual(
+                    self._info_key(index.dock_info_at(px, py, 20, False)),
+                    self._info_key(section.dock_info_at(px, py, 20, False))
+                )
+
+    def test_random_layouts(self):
+        """ Does the index agree with a scan of random layouts (with nested
+        splitters, tab groups and overlapping drag bounds)?
+        """
+        for seed in range(100):
+            self._check(seed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+""" Tests for the dock sizer. """
+
+import unittest
+
+try:
+    from pyface.dock.dock_sizer import DockControl, DockRegion, DockSection, \
+        DockSizer, DockSplitter
+except ImportError:
+    wx_available = False
+else:
+    wx_available = True
+
+
+if wx_available:
+
+    class RecordingControl(DockControl):
+        """ A control that records the changes to its visibility. """
+
+        def set_visibility(self, visible):
+            if self._visibility is None:
+                self._visibility = []
+            self._visibility.append(visible)
+
+    class CountingRegion(DockRegion):
+        """ A region that counts how often its minimum size is computed. """
+
+        def calc_min(self, use_size=False):
+            self._calc_min_count = (self._calc_min_count or 0) + 1
+            return super(CountingRegion, self).calc_min(use_size)
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+class DockSizerStructureChangeTestCase(unittest.TestCase):
+
+    def _make_sizer(self):
+        a = RecordingControl(name='a', style='tab')
+        b = RecordingControl(name='b', style='tab')
+        region = CountingRegion(contents=[a, b])
+        sizer = DockSizer(DockSection(contents=[region]))
+        region._calc_min_count = 0
+        a._visibility = b._visibility = None
+
+        return sizer, region, a, b
+
+    def test_changes_are_deferred(self):
+        """ Are the changes to a group applied once when the change ends?
+        """
+        sizer, region, a, b = self._make_sizer()
+
+        sizer.BeginStructureChange()
+        region.contents.append(RecordingControl(name='c', style='tab'))
+        region.contents.remove(a)
+        region.active = 1
+        region.active = 0
+        self.assertEqual(region._calc_min_count, 0)
+        self.assertIsNone(b._visibility)
+
+        sizer.EndStructureChange()
+        self.assertEqual(region._calc_min_count, 1)
+        self.assertEqual(b._visibility, [True])
+
+        # Once the change has ended, changes are applied immediately.
+        region.active = 1
+        self.assertEqual(b._visibility, [True, False])
+
+    def test_nested_changes(self):
+        """ Are the changes applied only when the outermost change ends?
+        """
+        sizer, region, a, b = self._make_sizer()
+
+        sizer.BeginStructureChange()
+        sizer.BeginStructureChange()
+        region.active = 1
+        sizer.EndStructureChange()
+        self.assertIsNone(b._visibility)
+
+        sizer.EndStructureChange()
+        self.assertEqual(b._visibility, [True])
+
+    def test_changes_are_per_sizer(self):
+        """ Are the changes to the contents of another sizer applied
+        immediately?
+        """
+        sizer, region, a, b = self._make_sizer()
+        other_sizer, other_region, c, d = self._make_sizer()
+
+        sizer.BeginStructureChange()
+        self.assertIs(region.structure_change_sizer(), sizer)
+        self.assertIsNone(other_region.structure_change_sizer())
+
+        other_region.active = 1
+        self.assertEqual(d._visibility, [True])
+        other_region.contents.remove(c)
+        self.assertEqual(other_region._calc_min_count, 1)
+
+        sizer.EndStructureChange()
+        self.assertIsNone(region.structure_change_sizer())
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+class DockSizerResetBitmapsTestCase(unittest.TestCase):
+
+    def test_reset_bitmaps(self):
+        """ Are the cached renderings of all tabs and splitters discarded?
+        """
+        a = DockControl(name='a', style='tab')
+        b = DockControl(name='b', style='tab')
+        inner = DockSection(contents=[DockRegion(contents=[b])])
+        region = DockRegion(contents=[a, inner])
+        section = DockSection(contents=[region, DockRegion()])
+        splitter = DockSplitter()
+        section.splitters = [splitter]
+        for item in (a, b, inner, region, splitter):
+            item._bitmaps = {}
+
+        section.reset_bitmaps()
+        for item in (a, b, inner, region, splitter):
+            self.assertIsNone(item._bitmaps)
+
+
+if __name__ == '__main__':
+    unittest.main()
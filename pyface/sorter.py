@@ -34,19 +34,49 @@ class Sorter(HasTraits):
 
         Returns the list that was sorted IN PLACE (for convenience).
 
+        Nodes are sorted by their 'sort_key', unless a subclass overrides
+        'compare' (but not 'sort_key'), in which case the comparison is used.
+
         """
 
-        # This creates a comparison function with the names 'widget' and
-        # 'parent' bound to the corresponding arguments to this method.
-        def comparator(node_a, node_b):
-            """ Comparator. """
+        if _overrides(self, 'compare') and not _overrides(self, 'sort_key'):
+            # This creates a comparison function with the names 'widget' and
+            # 'parent' bound to the corresponding arguments to this method.
+            def comparator(node_a, node_b):
+                """ Comparator. """
+
+                return self.compare(widget, parent, node_a, node_b)
+
+            nodes.sort(comparator)
+
+        else:
+            # The key of each node is only computed once (rather than once
+            # per comparison).
+            def key(node):
+                """ Key function. """
 
-            return self.compare(widget, parent, node_a, node_b)
+                return self.sort_key(widget, parent, node)
 
-        nodes.sort(comparator)
+            nodes.sort(key=key)
 
         return nodes
 
+    def sort_key(self, widget, parent, node):
+        """ Returns the key that a node is sorted by.
+
+        'widget' is the widget that we are sorting nodes for.
+        'parent' is the parent node.
+        'node'   is the node to return the key for.
+
+        By default the key is the node's category followed by its label text,
+        which orders nodes in the same way as 'compare'.
+
+        """
+
+        return (
+            self.category(widget, parent, node), widget.model.get_text(node)
+        )
+
     def compare(self, widget, parent, node_a, node_b):
         """ Returns the result of comparing two nodes.
 
@@ -106,4 +136,14 @@ class Sorter(HasTraits):
 
         return False
 
+
+def _overrides(sorter, name):
+    """ Returns True if a sorter's class overrides a Sorter method. """
+
+    method = getattr(type(sorter), name)
+    base_method = getattr(Sorter, name)
+
+    return getattr(method, '__func__', method) is not \
+        getattr(base_method, '__func__', base_method)
+
 #### EOF ######################################################################
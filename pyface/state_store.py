@@ -0,0 +1,256 @@
+""" A transactional key/value store for persisted user interface state. """
+
+
+# Standard library imports.
+import cPickle
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Enthought library imports.
+from traits.api import Any, HasTraits, Int, Str
+
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+# The schema of the store. Each value is identified by a namespace (e.g. the
+# kind of state, or the Id of a window) and a key within that namespace. The
+# primary key provides the index used by all lookups.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    namespace TEXT NOT NULL,
+    key       TEXT NOT NULL,
+    value     BLOB NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class StateStore(HasTraits):
+    """ A transactional key/value store for persisted user interface state.
+
+    The store is an SQLite database. Its connection is opened on first use
+    and kept open until the store is closed, so reading or writing a single
+    value is a single indexed query. Values are pickled.
+
+    A store can be used from any thread. Each call commits immediately,
+    unless it is made inside a 'transaction' block, in which case the whole
+    block is committed (or rolled back) at once.
+
+    """
+
+    #### 'StateStore' interface ###############################################
+
+    # The name of the database file (or ':memory:' for a store that is not
+    # persisted).
+    filename = Str(':memory:')
+
+    # The pickle protocol used to serialize values.
+    protocol = Int(cPickle.HIGHEST_PROTOCOL)
+
+    #### Private interface ####################################################
+
+    # The connection to the database (None until it is first used).
+    _connection = Any
+
+    # Serializes access to the connection.
+    _lock = Any
+
+    # The nesting depth of the current transaction.
+    _depth = Int(0)
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """ Creates a new store. """
+
+        super(StateStore, self).__init__(**traits)
+
+        self._lock = threading.RLock()
+
+        return
+
+    ###########################################################################
+    # 'StateStore' interface.
+    ###########################################################################
+
+    def get(self, namespace, key, default=None):
+        """ Return the value of a key (or the default if it has no value). """
+
+        with self._lock:
+            row = self._execute(
+                'SELECT value FROM state WHERE namespace = ? AND key = ?',
+                (namespace, key)
+            ).fetchone()
+
+        if row is None:
+            return default
+
+        return cPickle.loads(bytes(row[0]))
+
+    def set(self, namespace, key, value):
+        """ Set the value of a key. """
+
+        data = sqlite3.Binary(cPickle.dumps(value, self.protocol))
+
+        with self.transaction():
+            self._execute(
+                'INSERT OR REPLACE INTO state VALUES (?, ?, ?)',
+                (namespace, key, data)
+            )
+
+        return
+
+    def delete(self, namespace, key):
+        """ Delete a key (it is not an error if the key has no value). """
+
+        with self.transaction():
+            self._execute(
+                'DELETE FROM state WHERE namespace = ? AND key = ?',
+                (namespace, key)
+            )
+
+        return
+
+    def keys(self, namespace):
+        """ Return the keys that have values in a namespace. """
+
+        with self._lock:
+            rows = self._execute(
+                'SELECT key FROM state WHERE namespace = ? ORDER BY key',
+                (namespace,)
+            ).fetchall()
+
+        return [row[0] for row in rows]
+
+    def items(self, namespace):
+        """ Return the (key, value) pairs in a namespace. """
+
+        with self._lock:
+            rows = self._execute(
+                'SELECT key, value FROM state WHERE namespace = ? '
+                'ORDER BY key',
+                (namespace,)
+            ).fetchall()
+
+        return [(key, cPickle.loads(bytes(value))) for key, value in rows]
+
+    def clear(self, namespace):
+        """ Delete every key in a namespace. """
+
+        with self.transaction():
+            self._execute(
+                'DELETE FROM state WHERE namespace = ?', (namespace,)
+            )
+
+        return
+
+    @contextmanager
+    def transaction(self):
+        """ A context manager that groups changes into a single transaction.
+
+        The changes are committed when the outermost block exits normally,
+        and rolled back if it raises an exception. Other threads cannot use
+        the store while a transaction is in progress.
+
+        """
+
+        with self._lock:
+            connection = self._get_connection()
+
+            self._depth += 1
+            try:
+                yield self
+
+            except:
+                self._depth -= 1
+                if self._depth == 0:
+                    connection.rollback()
+                raise
+
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    connection.commit()
+
+        return
+
+    def close(self):
+        """ Close the connection to the database.
+
+        The store can still be used afterwards (the connection is re-opened
+        on demand).
+
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+        return
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _execute(self, sql, parameters):
+        """ Execute an SQL statement on the connection.
+
+        This must be called with the lock held.
+
+        """
+
+        return self._get_connection().execute(sql, parameters)
+
+    def _get_connection(self):
+        """ Return the connection, opening it if necessary. """
+
+        if self._connection is None:
+            if self.filename != ':memory:':
+                dirname = os.path.dirname(self.filename)
+                if dirname and not os.path.exists(dirname):
+                    os.makedirs(dirname)
+
+            # The lock (rather than SQLite) makes sure that the connection is
+            # only used by one thread at a time.
+            connection = sqlite3.connect(
+                self.filename, check_same_thread=False
+            )
+            connection.execute(SCHEMA)
+            connection.commit()
+
+            self._connection = connection
+
+        return self._connection
+
+
+# The shared stores, keyed by absolute filename.
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(filename):
+    """ Return the shared store for a database file.
+
+    Every caller that asks for the same file gets the same store (and hence
+    the same connection).
+
+    """
+
+    filename = os.path.abspath(filename)
+
+    with _stores_lock:
+        store = _stores.get(filename)
+        if store is None:
+            store = _stores[filename] = StateStore(filename=filename)
+
+    return store
+
+#### EOF ######################################################################
@@ -7,6 +7,7 @@ from .split_editor_area_pane import SplitEditorAreaPane
 from .dock_pane import DockPane
 from .editor import Editor
 from .editor_area_pane import EditorAreaPane
+from .editor_hibernation_policy import EditorHibernationPolicy
 from .enaml_dock_pane import EnamlDockPane
 from .enaml_editor import EnamlEditor
 from .enaml_task_pane import EnamlTaskPane
@@ -17,6 +18,8 @@ from .i_task_pane import ITaskPane
 from .task import Task
 from .task_layout import TaskLayout, PaneItem, Tabbed, Splitter, HSplitter, \
     VSplitter
+from .task_layout_serializer import dumps_layout, dumps_window_layout, \
+    LazyTaskLayout, loads_layout, loads_window_layout, TaskLayoutDecodeError
 from .task_pane import TaskPane
 from .task_window import TaskWindow
 from .task_window_layout import TaskWindowLayout
@@ -0,0 +1,72 @@
+# Enthought library imports.
+from traits.api import Callable, HasTraits, Int
+
+
+class EditorHibernationPolicy(HasTraits):
+    """ Decides which editors of an editor area should be hibernated.
+
+    A hibernated editor has its toolkit-specific control destroyed. The editor
+    area keeps a lightweight placeholder in its place, together with the state
+    returned by the editor's ``save_state()`` method. The control is recreated,
+    and the state restored, when the editor is next activated.
+
+    Editors are considered in least-recently-used order. The active editor,
+    and any other editor whose control is visible, is never hibernated.
+    """
+
+    #### 'EditorHibernationPolicy' interface ##################################
+
+    # The maximum number of editors whose controls are kept alive. If zero,
+    # the number of live editors is not limited.
+    max_live = Int(0)
+
+    # The maximum total cost of the editors whose controls are kept alive, as
+    # measured by 'editor_cost'. If zero, the total cost is not limited.
+    memory_budget = Int(0)
+
+    # A callable of form:
+    #     callable(editor) -> int
+    # that estimates the memory held by an editor's control. The units are
+    # arbitrary but must agree with 'memory_budget'. By default, every editor
+    # has unit cost.
+    editor_cost = Callable
+
+    ###########################################################################
+    # 'EditorHibernationPolicy' interface.
+    ###########################################################################
+
+    def select(self, editors):
+        """ Returns the editors to hibernate.
+
+        The 'editors' parameter is the list of live editors, ordered from least
+        to most recently used. The last editor in the list is assumed to be the
+        active one and is never selected.
+        """
+        candidates = list(editors[:-1])
+        victims = []
+
+        if self.max_live > 0:
+            excess = len(editors) - self.max_live
+            if excess > 0:
+                victims.extend(candidates[:excess])
+                del candidates[:excess]
+
+        if self.memory_budget > 0:
+            costs = [ self.editor_cost(editor) for editor in candidates ]
+            total = sum(costs)
+            if editors:
+                total += self.editor_cost(editors[-1])
+            for editor, cost in zip(candidates, costs):
+                if total <= self.memory_budget:
+                    break
+                victims.append(editor)
+                total -= cost
+
+        return victims
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _editor_cost_default(self):
+        return lambda editor: 1
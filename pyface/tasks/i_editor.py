@@ -32,6 +32,10 @@ class IEditor(Interface):
     # Does the editor currently have the focus?
     has_focus = Bool
 
+    # Has the editor's control been destroyed by the editor area to save
+    # resources? If so, 'control' is a lightweight placeholder.
+    hibernated = Bool
+
     # Fired when the editor has been requested to close.
     closing = VetoableEvent
 
@@ -55,6 +59,21 @@ class IEditor(Interface):
         """ Destroy the toolkit-specific control that represents the editor.
         """
 
+    def restore_state(self, state):
+        """ Restore the state of a newly created control.
+
+        The 'state' parameter is the value returned by ``save_state()`` before
+        the previous control was destroyed.
+        """
+
+    def save_state(self):
+        """ Return the state of the control that should survive hibernation.
+
+        Examples are the scroll position, the selection or the cursor position.
+        The editor's object is not destroyed during hibernation and should not
+        be part of the state.
+        """
+
 
 class MEditor(HasTraits):
     """ Mixin containing common code for toolkit-specific implementations.
@@ -72,6 +91,7 @@ class MEditor(HasTraits):
         'pyface.tasks.i_editor_area_pane.IEditorAreaPane')
     is_active = Property(Bool, depends_on='editor_area.active_editor')
     has_focus = Bool(False)
+    hibernated = Bool(False)
 
     closing = VetoableEvent
     closed = Event
@@ -89,6 +109,16 @@ class MEditor(HasTraits):
                 self.editor_area.remove_editor(self)
                 self.closed = True
 
+    def restore_state(self, state):
+        """ Restore the state of a newly created control.
+        """
+        pass
+
+    def save_state(self):
+        """ Return the state of the control that should survive hibernation.
+        """
+        return None
+
     ###########################################################################
     # Private interface.
     ###########################################################################
@@ -2,10 +2,11 @@
 import logging
 
 # Enthought library imports.
-from traits.api import Bool, Callable, Dict, Event, File, HasTraits, Instance, \
-    List, Str
+from traits.api import Any, Bool, Callable, Dict, Event, File, HasTraits, \
+    Instance, List, on_trait_change, Str
 
 # Local imports.
+from pyface.tasks.editor_hibernation_policy import EditorHibernationPolicy
 from pyface.tasks.i_editor import IEditor
 from pyface.tasks.i_task_pane import ITaskPane
 
@@ -42,6 +43,10 @@ class IEditorAreaPane(ITaskPane):
     # Whether to hide the tab bar when there is only a single editor.
     hide_tab_bar = Bool(False)
 
+    # The policy used to destroy the controls of inactive editors, if any. By
+    # default, the controls of all editors are kept alive.
+    hibernation_policy = Instance(EditorHibernationPolicy)
+
     ###########################################################################
     # 'IEditorAreaPane' interface.
     ###########################################################################
@@ -87,6 +92,13 @@ class IEditorAreaPane(ITaskPane):
         Returns None if there is no such editor factory.
         """
 
+    def hibernate_editor(self, editor):
+        """ Destroys the control of an editor, keeping a placeholder for it.
+
+        The state of the control is saved with the editor's ``save_state()``
+        method. This is a no-op if the editor is already hibernated.
+        """
+
     def register_factory(self, factory, filter):
         """ Registers a factory for creating editors.
 
@@ -112,6 +124,14 @@ class IEditorAreaPane(ITaskPane):
         """ Unregisters a factory for creating editors.
         """
 
+    def wake_editor(self, editor):
+        """ Recreates the control of a hibernated editor.
+
+        The state saved when the editor was hibernated is restored with the
+        editor's ``restore_state()`` method. This is a no-op if the editor is
+        not hibernated.
+        """
+
 
 class MEditorAreaPane(HasTraits):
 
@@ -122,11 +142,18 @@ class MEditorAreaPane(HasTraits):
     file_drop_extensions = List(Str)
     file_dropped = Event(File)
     hide_tab_bar = Bool(False)
+    hibernation_policy = Instance(EditorHibernationPolicy)
 
     #### Protected traits #####################################################
 
     _factory_map = Dict(Callable, List(Callable))
 
+    # The editors with live controls, from least to most recently used.
+    _live_editors = List(IEditor)
+
+    # The states saved for hibernated editors, keyed by editor.
+    _hibernated_states = Dict(Any, Any)
+
     ###########################################################################
     # 'IEditorAreaPane' interface.
     ###########################################################################
@@ -184,6 +211,28 @@ class MEditorAreaPane(HasTraits):
                     pass
         return None
 
+    def hibernate_editor(self, editor):
+        """ Destroys the control of an editor, keeping a placeholder for it.
+        """
+        if editor.hibernated or editor.control is None:
+            return
+
+        # Not every editor area supports hibernation.
+        placeholder = self._create_editor_placeholder(editor)
+        if placeholder is None:
+            return
+
+        state = editor.save_state()
+        control = editor.control
+        self._replace_editor_control(editor, control, placeholder)
+        editor.destroy()
+
+        editor.control = placeholder
+        editor.hibernated = True
+        self._hibernated_states[editor] = state
+        if editor in self._live_editors:
+            self._live_editors.remove(editor)
+
     def register_factory(self, factory, filter):
         """ Registers a factory for creating editors.
         """
@@ -194,3 +243,121 @@ class MEditorAreaPane(HasTraits):
         """
         if factory in self._factory_map:
             del self._factory_map[factory]
+
+    def wake_editor(self, editor):
+        """ Recreates the control of a hibernated editor.
+        """
+        if not editor.hibernated:
+            return
+
+        placeholder = editor.control
+        editor.control = None
+        editor.create(self._get_editor_placeholder_parent(placeholder))
+        self._replace_editor_control(editor, placeholder, editor.control)
+        self._destroy_editor_placeholder(placeholder)
+
+        editor.hibernated = False
+        editor.restore_state(self._hibernated_states.pop(editor, None))
+        if editor not in self._live_editors:
+            self._live_editors.append(editor)
+
+    ###########################################################################
+    # Protected 'MEditorAreaPane' interface.
+    ###########################################################################
+
+    def _create_editor_placeholder(self, editor):
+        """ Creates the toolkit-specific placeholder for a hibernated editor.
+
+        Returns None if the editor area does not support hibernation (the
+        default), in which case editors are never hibernated.
+        """
+        return None
+
+    def _destroy_editor_placeholder(self, placeholder):
+        """ Destroys a placeholder created by _create_editor_placeholder().
+        """
+        pass
+
+    def _get_editor_placeholder_parent(self, placeholder):
+        """ Returns the toolkit-specific parent for a woken editor's control.
+        """
+        return None
+
+    def _get_visible_editors(self):
+        """ Returns the editors whose controls are currently visible.
+
+        Visible editors are never hibernated. By default, only the active
+        editor is assumed to be visible.
+        """
+        if self.active_editor is None:
+            return []
+        return [ self.active_editor ]
+
+    def _replace_editor_control(self, editor, old, new):
+        """ Puts the control 'new' in the place of 'old' in the editor area.
+        """
+        pass
+
+    def _destroy_editor_control(self, editor):
+        """ Destroys the control of an editor that is being removed.
+
+        Use this instead of calling the editor's ``destroy()`` method directly,
+        since the control of a hibernated editor has already been destroyed.
+        """
+        if editor.hibernated:
+            placeholder = editor.control
+            editor.control = None
+            editor.hibernated = False
+            self._destroy_editor_placeholder(placeholder)
+        else:
+            editor.destroy()
+
+    def _apply_hibernation_policy(self):
+        """ Hibernates the editors selected by the hibernation policy.
+        """
+        if self.hibernation_policy is None or self.control is None:
+            return
+
+        # The visible editors are moved to the end of the list (with the
+        # active editor last), so that the policy selects the others first.
+        visible = self._get_visible_editors()
+        if self.active_editor in visible:
+            visible.remove(self.active_editor)
+            visible.append(self.active_editor)
+        live = [ editor for editor in self._live_editors
+                 if editor not in visible ]
+        live.extend(editor for editor in visible
+                    if editor in self._live_editors)
+
+        for editor in self.hibernation_policy.select(live):
+            if editor not in visible:
+                self.hibernate_editor(editor)
+
+    #### Trait change handlers ################################################
+
+    @on_trait_change('active_editor')
+    def _update_live_editors_for_activation(self, new):
+        if new is None:
+            return
+
+        self.wake_editor(new)
+        if new in self._live_editors:
+            self._live_editors.remove(new)
+            self._live_editors.append(new)
+        self._apply_hibernation_policy()
+
+    @on_trait_change('editors[]')
+    def _update_live_editors_for_editors(self, object, name, old, new):
+        for editor in old:
+            if editor in self._live_editors:
+                self._live_editors.remove(editor)
+            self._hibernated_states.pop(editor, None)
+        for editor in new:
+            if not editor.hibernated:
+                self._live_editors.append(editor)
+        self._apply_hibernation_policy()
+
+    @on_trait_change('hibernation_policy.[max_live, memory_budget, '
+                     'editor_cost]')
+    def _update_live_editors_for_policy(self):
+        self._apply_hibernation_policy()
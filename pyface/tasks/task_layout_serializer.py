@@ -0,0 +1,289 @@
+""" A compact, versioned serialization format for Task layouts.
+
+Layouts are encoded as JSON. Unlike pickles, the encoding does not refer to
+Python classes by import path, so it survives refactorings of the layout
+classes, and decoding it cannot execute arbitrary code.
+
+A serialized TaskWindowLayout stores the layout of each of its tasks as a
+separately encoded string. When decoding lazily, only the layout of the active
+task is built eagerly; the layouts of the other tasks are decoded the first
+time they are accessed.
+"""
+# Standard library imports.
+import json
+
+# Enthought library imports.
+from traits.api import Any, Instance, Property, TraitError
+
+# Local imports.
+from pyface.tasks.task_layout import HSplitter, PaneItem, Splitter, Tabbed, \
+    TaskLayout, VSplitter
+from pyface.tasks.task_window_layout import TaskWindowLayout
+
+# The identifier stored in every serialized TaskWindowLayout.
+FORMAT = 'pyface.tasks.layout'
+
+# The version of the format written by this module. Bump this whenever the
+# encoding changes, and keep decoding older versions.
+VERSION = 1
+
+# The names of the TaskLayout traits, in the order in which they are encoded.
+DOCK_AREAS = ('left', 'right', 'top', 'bottom')
+CORNERS = ('top_left_corner', 'top_right_corner', 'bottom_left_corner',
+           'bottom_right_corner')
+
+# Compact codes for splitter orientations, and the classes they decode to.
+ORIENTATION_CODES = { 'horizontal': 'h', 'vertical': 'v' }
+SPLITTER_CLASSES = { 'h': HSplitter, 'v': VSplitter }
+
+# Separators producing the most compact JSON.
+SEPARATORS = (',', ':')
+
+###############################################################################
+# Public functions.
+###############################################################################
+
+def dumps_layout(layout):
+    """ Serializes a TaskLayout to a string.
+    """
+    if isinstance(layout, LazyTaskLayout) and not layout.is_decoded():
+        return layout._data
+    return json.dumps(_encode_task_layout(layout), separators=SEPARATORS)
+
+
+def loads_layout(data):
+    """ Deserializes a TaskLayout from a string produced by ``dumps_layout``.
+    """
+    return _decode_task_layout(_parse(data))
+
+
+def dumps_window_layout(window_layout):
+    """ Serializes a TaskWindowLayout to a string.
+    """
+    items = []
+    for item in window_layout.items:
+        if isinstance(item, TaskLayout):
+            items.append({ 'id': item.id, 'layout': dumps_layout(item) })
+        else:
+            items.append({ 'id': item })
+
+    data = {
+        'format': FORMAT,
+        'version': VERSION,
+        'active_task': window_layout.active_task,
+        'position': list(window_layout.position),
+        'size': list(window_layout.size),
+        'size_state': window_layout.size_state,
+        'items': items,
+    }
+    return json.dumps(data, separators=SEPARATORS)
+
+
+def loads_window_layout(data, lazy=False):
+    """ Deserializes a TaskWindowLayout from a string produced by
+    ``dumps_window_layout``.
+
+    If 'lazy' is set, only the layout of the active task is decoded eagerly.
+    The layouts of the other tasks are returned as LazyTaskLayouts.
+    """
+    data = _parse(data)
+    if not isinstance(data, dict) or data.get('format') != FORMAT:
+        raise TaskLayoutDecodeError('Data is not a serialized window layout.')
+    version = data.get('version')
+    if not isinstance(version, int) or version > VERSION:
+        raise TaskLayoutDecodeError(
+            'Unsupported window layout version %r.' % version)
+
+    try:
+        window_layout = TaskWindowLayout(
+            active_task=data['active_task'],
+            position=tuple(data['position']),
+            size=tuple(data['size']),
+            size_state=data['size_state'])
+        # The first task is active if no active task is specified.
+        active_task = window_layout.active_task
+        if not active_task and data['items']:
+            active_task = data['items'][0]['id']
+
+        items = []
+        for item in data['items']:
+            task_id = item['id']
+            if 'layout' not in item:
+                items.append(task_id)
+            elif lazy and task_id != active_task:
+                items.append(LazyTaskLayout(id=task_id, data=item['layout']))
+            else:
+                items.append(loads_layout(item['layout']))
+        window_layout.items = items
+
+    except TaskLayoutDecodeError:
+        raise
+    except (KeyError, TypeError, ValueError, TraitError) as exc:
+        raise TaskLayoutDecodeError('Malformed window layout: %s' % exc)
+
+    return window_layout
+
+###############################################################################
+# Classes.
+###############################################################################
+
+class LazyTaskLayout(TaskLayout):
+    """ A TaskLayout that is decoded from its serialized form on first use.
+
+    Only the task ID is available without decoding.
+    """
+
+    #### 'DockLayout' interface ###############################################
+
+    # The dock areas and corners are delegated to the decoded layout.
+    left = Property(lambda self, name: self._get_decoded_trait(name),
+                    lambda self, name, value: self._set_decoded_trait(name,
+                                                                      value))
+    right = left
+    top = left
+    bottom = left
+    top_left_corner = left
+    top_right_corner = left
+    bottom_left_corner = left
+    bottom_right_corner = left
+
+    #### Private interface ####################################################
+
+    # The serialized TaskLayout, or None once it has been decoded.
+    _data = Any
+
+    # The decoded TaskLayout.
+    _layout = Instance(TaskLayout)
+
+    def __init__(self, id='', data=None, **traits):
+        super(LazyTaskLayout, self).__init__(id=id, **traits)
+        self._data = data
+
+    ###########################################################################
+    # 'HasTraits' interface.
+    ###########################################################################
+
+    def clone_traits(self, traits=None, memo=None, copy=None, **metadata):
+        """ Clones the layout without decoding it, if possible.
+        """
+        if self._data is not None and traits is None:
+            return LazyTaskLayout(id=self.id, data=self._data)
+        return self._decoded_layout().clone_traits(traits, memo, copy,
+                                                   **metadata)
+
+    ###########################################################################
+    # 'LazyTaskLayout' interface.
+    ###########################################################################
+
+    def is_decoded(self):
+        """ Returns whether the layout has been decoded.
+        """
+        return self._data is None
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _decoded_layout(self):
+        if self._data is not None:
+            layout = loads_layout(self._data)
+            layout.id = self.id
+            self._layout, self._data = layout, None
+        return self._layout
+
+    def _get_decoded_trait(self, name):
+        return getattr(self._decoded_layout(), name)
+
+    def _set_decoded_trait(self, name, value):
+        setattr(self._decoded_layout(), name, value)
+
+
+class TaskLayoutDecodeError(ValueError):
+    """ Exception raised when serialized layout data cannot be decoded.
+    """
+    pass
+
+###############################################################################
+# Private functions.
+###############################################################################
+
+def _parse(data):
+    """ Parses JSON data, converting errors to TaskLayoutDecodeErrors.
+    """
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    try:
+        return json.loads(data)
+    except ValueError as exc:
+        raise TaskLayoutDecodeError('Invalid layout data: %s' % exc)
+
+
+def _encode_item(item):
+    """ Encodes a PaneItem, Tabbed or Splitter (or None) as nested lists.
+    """
+    if item is None:
+        return None
+    elif isinstance(item, PaneItem):
+        if item.width == -1 and item.height == -1:
+            return ['p', item.id]
+        return ['p', item.id, item.width, item.height]
+    elif isinstance(item, Tabbed):
+        return ['t', item.active_tab,
+                [ _encode_item(child) for child in item.items ]]
+    elif isinstance(item, Splitter):
+        return ['s', ORIENTATION_CODES[item.orientation],
+                [ _encode_item(child) for child in item.items ]]
+    raise ValueError('Cannot serialize layout item %r' % item)
+
+
+def _decode_item(data):
+    """ Decodes a PaneItem, Tabbed or Splitter (or None) from nested lists.
+    """
+    if data is None:
+        return None
+
+    try:
+        code = data[0]
+        if code == 'p':
+            item = PaneItem(data[1])
+            if len(data) > 2:
+                item.width, item.height = data[2], data[3]
+        elif code == 't':
+            item = Tabbed(*[ _decode_item(child) for child in data[2] ],
+                          active_tab=data[1])
+        elif code == 's':
+            klass = SPLITTER_CLASSES[data[1]]
+            item = klass(*[ _decode_item(child) for child in data[2] ])
+        else:
+            raise TaskLayoutDecodeError('Unknown layout item %r.' % code)
+
+    except TaskLayoutDecodeError:
+        raise
+    except Exception as exc:
+        raise TaskLayoutDecodeError('Malformed layout item %r: %s'
+                                    % (data, exc))
+
+    return item
+
+
+def _encode_task_layout(layout):
+    """ Encodes a TaskLayout as nested lists.
+    """
+    return ([layout.id] +
+            [ _encode_item(getattr(layout, name)) for name in DOCK_AREAS ] +
+            [[ getattr(layout, name) for name in CORNERS ]])
+
+
+def _decode_task_layout(data):
+    """ Decodes a TaskLayout from nested lists.
+    """
+    if not isinstance(data, list) or len(data) != len(DOCK_AREAS) + 2:
+        raise TaskLayoutDecodeError('Malformed task layout %r.' % (data,))
+
+    traits = dict(zip(DOCK_AREAS, [ _decode_item(item)
+                                    for item in data[1:-1] ]))
+    try:
+        traits.update(zip(CORNERS, data[-1]))
+        return TaskLayout(id=data[0], **traits)
+    except Exception as exc:
+        raise TaskLayoutDecodeError('Malformed task layout: %s' % exc)
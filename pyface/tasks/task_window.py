@@ -4,8 +4,8 @@ import logging
 # Enthought library imports.
 from pyface.action.api import MenuBarManager, StatusBarManager, ToolBarManager
 from pyface.api import ApplicationWindow
-from traits.api import Bool, Callable, HasTraits, HasStrictTraits, Instance, \
-    List, Property, Unicode, Vetoable, on_trait_change
+from traits.api import Any, Bool, Callable, Dict, HasTraits, HasStrictTraits, \
+    Instance, List, Property, Unicode, Vetoable, on_trait_change
 
 # Local imports.
 from pyface.tasks.action.task_action_manager_builder import TaskActionManagerBuilder
@@ -63,6 +63,13 @@ class TaskWindow(ApplicationWindow):
     _title = Unicode
     _window_backend = Instance(TaskWindowBackend)
 
+    # The visible panes ordered for focus switching, or None if the ring must
+    # be recomputed from the window layout.
+    _pane_ring = Any
+
+    # A map from each pane in '_pane_ring' to its index in the ring.
+    _pane_ring_index = Dict
+
     ###########################################################################
     # 'Widget' interface.
     ###########################################################################
@@ -221,7 +228,8 @@ class TaskWindow(ApplicationWindow):
             panes = self._get_pane_ring()
             index = 0
             if self.active_pane:
-                index = (panes.index(self.active_pane) + 1) % len(panes)
+                index = self._pane_ring_index.get(self.active_pane, -1) + 1
+                index %= len(panes)
             panes[index].set_focus()
 
     def focus_previous_pane(self):
@@ -232,7 +240,7 @@ class TaskWindow(ApplicationWindow):
             panes = self._get_pane_ring()
             index = -1
             if self.active_pane:
-                index = panes.index(self.active_pane) - 1
+                index = self._pane_ring_index.get(self.active_pane, 0) - 1
             panes[index].set_focus()
 
     def get_central_pane(self, task):
@@ -281,6 +289,7 @@ class TaskWindow(ApplicationWindow):
         """
         if self._active_state:
             self._window_backend.set_layout(layout)
+            self._invalidate_pane_ring()
 
     def reset_layout(self):
         """ Restores the active task's default TaskLayout.
@@ -329,6 +338,7 @@ class TaskWindow(ApplicationWindow):
             # ``activate`` is a no-op, so we must force a re-layout.
             if state == self._active_state:
                 self._window_backend.set_layout(state.layout)
+                self._invalidate_pane_ring()
             else:
                 self.activate_task(state.task)
 
@@ -358,7 +368,14 @@ class TaskWindow(ApplicationWindow):
 
     def _get_pane_ring(self):
         """ Returns a list of visible panes ordered for focus switching.
+
+        The ring is computed from the window layout when it is first needed
+        and then maintained as panes are hidden or removed. Changes that may
+        reorder the ring cause it to be recomputed.
         """
+        if self._pane_ring is not None:
+            return self._pane_ring
+
         # Proceed clockwise through the dock areas.
         # TODO: Also take into account ordering within dock areas.
         panes = []
@@ -370,8 +387,33 @@ class TaskWindow(ApplicationWindow):
                 if item:
                     panes.extend([ self.get_dock_pane(pane_item.id)
                                    for pane_item in item.iterleaves() ])
+
+            # Only cache the ring for an active task, since it is otherwise
+            # empty.
+            self._set_pane_ring(panes)
         return panes
 
+    def _invalidate_pane_ring(self):
+        """ Forces the pane ring to be recomputed when it is next needed.
+        """
+        self._pane_ring = None
+        self._pane_ring_index = {}
+
+    def _remove_from_pane_ring(self, panes):
+        """ Removes panes from the cached pane ring, if there is one.
+        """
+        if self._pane_ring is not None:
+            index = self._pane_ring_index
+            if any(pane in index for pane in panes):
+                self._set_pane_ring([ pane for pane in self._pane_ring
+                                      if pane not in panes ])
+
+    def _set_pane_ring(self, panes):
+        """ Caches a pane ring and indexes its panes.
+        """
+        self._pane_ring = panes
+        self._pane_ring_index = dict((pane, i) for i, pane in enumerate(panes))
+
     def _get_state(self, id_or_task):
         """ Returns the TaskState that contains the specified Task, or None if
             no such state exists.
@@ -421,6 +463,24 @@ class TaskWindow(ApplicationWindow):
     def _states_updated(self):
         self.tasks = [ state.task for state in self._states ]
 
+    @on_trait_change('_active_state, dock_panes, dock_panes:dock_area')
+    def _pane_ring_reordered(self):
+        self._invalidate_pane_ring()
+
+    @on_trait_change('dock_panes_items')
+    def _pane_ring_items_updated(self, event):
+        if event.added:
+            self._invalidate_pane_ring()
+        else:
+            self._remove_from_pane_ring(event.removed)
+
+    @on_trait_change('dock_panes:visible')
+    def _pane_ring_visibility_updated(self, pane, name, new):
+        if new:
+            self._invalidate_pane_ring()
+        else:
+            self._remove_from_pane_ring([pane])
+
 
 class TaskState(HasStrictTraits):
     """ An object used internally by TaskWindow to maintain the state associated
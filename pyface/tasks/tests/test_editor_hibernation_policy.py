@@ -0,0 +1,43 @@
+# Standard library imports.
+import unittest
+
+# Local imports.
+from pyface.tasks.editor_hibernation_policy import EditorHibernationPolicy
+
+
+class EditorHibernationPolicyTestCase(unittest.TestCase):
+
+    def test_unlimited(self):
+        """ Does the default policy keep every editor alive?
+        """
+        policy = EditorHibernationPolicy()
+        self.assertEqual(policy.select(['a', 'b', 'c']), [])
+        self.assertEqual(policy.select([]), [])
+
+    def test_max_live(self):
+        """ Are the least recently used editors selected first?
+        """
+        policy = EditorHibernationPolicy(max_live=2)
+        self.assertEqual(policy.select(['a', 'b', 'c', 'd']), ['a', 'b'])
+        self.assertEqual(policy.select(['a', 'b']), [])
+
+    def test_active_editor_kept(self):
+        """ Is the most recently used editor never selected?
+        """
+        policy = EditorHibernationPolicy(max_live=1, memory_budget=1,
+                                         editor_cost=lambda editor: 10)
+        self.assertEqual(policy.select(['a']), [])
+        self.assertEqual(policy.select(['a', 'b']), ['a'])
+
+    def test_memory_budget(self):
+        """ Are editors selected until the budget is met?
+        """
+        costs = dict(a=5, b=3, c=4, d=2)
+        policy = EditorHibernationPolicy(memory_budget=7,
+                                         editor_cost=costs.get)
+        self.assertEqual(policy.select(['a', 'b', 'c', 'd']), ['a', 'b'])
+        self.assertEqual(policy.select(['c', 'd']), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
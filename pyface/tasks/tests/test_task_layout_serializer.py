@@ -0,0 +1,75 @@
+# Standard library imports.
+import unittest
+
+# Enthought library imports.
+from ..task_layout import HSplitter, PaneItem, Tabbed, TaskLayout, VSplitter
+from ..task_layout_serializer import dumps_layout, dumps_window_layout, \
+    LazyTaskLayout, loads_layout, loads_window_layout, TaskLayoutDecodeError
+from ..task_window_layout import TaskWindowLayout
+
+
+class TaskLayoutSerializerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.layout = TaskLayout(
+            id='task_1',
+            left=VSplitter(PaneItem('a', width=100),
+                           Tabbed(PaneItem('b'), PaneItem(2, height=50),
+                                  active_tab=2)),
+            bottom=HSplitter(PaneItem('c'), PaneItem('d')),
+            top_left_corner='left')
+        self.window_layout = TaskWindowLayout(
+            'task_0', self.layout,
+            TaskLayout(id='task_2', right=PaneItem('e')),
+            active_task='task_1', position=(10, 20), size=(640, 480),
+            size_state='maximized')
+
+    def test_layout_round_trip(self):
+        layout = loads_layout(dumps_layout(self.layout))
+        self.assertEqual(layout.pformat(), self.layout.pformat())
+
+    def test_window_layout_round_trip(self):
+        window_layout = loads_window_layout(
+            dumps_window_layout(self.window_layout))
+        self.assertEqual(window_layout.pformat(),
+                         self.window_layout.pformat())
+
+    def test_lazy_window_layout(self):
+        window_layout = loads_window_layout(
+            dumps_window_layout(self.window_layout), lazy=True)
+        task_0, task_1, task_2 = window_layout.items
+        self.assertEqual(task_0, 'task_0')
+        self.assertNotIsInstance(task_1, LazyTaskLayout)
+        self.assertIsInstance(task_2, LazyTaskLayout)
+        self.assertFalse(task_2.is_decoded())
+
+        # Cloning and re-serializing do not force decoding.
+        self.assertFalse(task_2.clone_traits().is_decoded())
+        self.assertEqual(loads_window_layout(
+            dumps_window_layout(window_layout)).pformat(),
+            self.window_layout.pformat())
+        self.assertFalse(task_2.is_decoded())
+
+        self.assertEqual(task_2.id, 'task_2')
+        self.assertEqual(task_2.right.id, 'e')
+        self.assertTrue(task_2.is_decoded())
+
+    def test_invalid_data(self):
+        data = dumps_window_layout(self.window_layout)
+        for bad in ('', '[1, 2', '{}',
+                    data.replace('"version":1', '"version":99'),
+                    data.replace(r'\"p\"', r'\"x\"')):
+            with self.assertRaises(TaskLayoutDecodeError):
+                loads_window_layout(bad)
+
+    def test_invalid_corners(self):
+        data = dumps_layout(self.layout)
+        corners = '["left","top","bottom","bottom"]'
+        self.assertIn(corners, data)
+        for bad in ('5', '[[1, 2]]', '["nowhere"]'):
+            with self.assertRaises(TaskLayoutDecodeError):
+                loads_layout(data.replace(corners, bad))
+
+
+if __name__ == '__main__':
+    unittest.main()
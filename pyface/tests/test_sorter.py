@@ -0,0 +1,83 @@
+# Standard library imports.
+import unittest
+
+# Enthought library imports.
+from traits.api import HasTraits, Int
+
+# Local imports.
+from pyface.sorter import Sorter
+from pyface.viewer.viewer_sorter import ViewerSorter
+
+
+class CountingModel(HasTraits):
+    """ A tree model (and label provider) that counts its calls. """
+
+    count = Int
+
+    def get_text(self, *args):
+        self.count += 1
+        return str(args[-1])
+
+
+class Widget(HasTraits):
+    """ A widget with a model. """
+
+    def __init__(self, model):
+        self.model = model
+
+
+class Viewer(HasTraits):
+    """ A viewer with a label provider. """
+
+    def __init__(self, label_provider):
+        self.label_provider = label_provider
+
+
+class OddFirstSorter(Sorter):
+    """ A sorter that puts odd numbers first. """
+
+    def category(self, widget, parent, node):
+        return 0 if node % 2 else 1
+
+
+class ReverseSorter(Sorter):
+    """ A sorter that only overrides 'compare'. """
+
+    def compare(self, widget, parent, node_a, node_b):
+        return cmp(node_b, node_a)
+
+
+class SorterTestCase(unittest.TestCase):
+
+    def test_sort_by_key(self):
+        """ Are the labels only fetched once per node?
+        """
+        model = CountingModel()
+        nodes = [5, 3, 4, 1, 2]
+        result = OddFirstSorter().sort(Widget(model), None, nodes)
+
+        self.assertIs(result, nodes)
+        self.assertEqual(nodes, [1, 3, 5, 2, 4])
+        self.assertEqual(model.count, 5)
+
+    def test_compare_override(self):
+        """ Is a subclass that only overrides 'compare' still used?
+        """
+        nodes = [2, 3, 1]
+        ReverseSorter().sort(Widget(CountingModel()), None, nodes)
+
+        self.assertEqual(nodes, [3, 2, 1])
+
+    def test_viewer_sorter(self):
+        """ Are viewer elements sorted by their label text?
+        """
+        label_provider = CountingModel()
+        elements = ['b', 'c', 'a']
+        ViewerSorter().sort(Viewer(label_provider), None, elements)
+
+        self.assertEqual(elements, ['a', 'b', 'c'])
+        self.assertEqual(label_provider.count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# Standard library imports.
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+# Local imports.
+from pyface.state_store import StateStore, get_state_store
+
+
+class StateStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.store = StateStore()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_get_set(self):
+        """ Are values stored per namespace and key?
+        """
+        self.assertIsNone(self.store.get('a', 'x'))
+        self.assertEqual(self.store.get('a', 'x', 42), 42)
+
+        self.store.set('a', 'x', {'layout': (1, 2)})
+        self.store.set('b', 'x', 'other')
+        self.assertEqual(self.store.get('a', 'x'), {'layout': (1, 2)})
+        self.assertEqual(self.store.get('b', 'x'), 'other')
+
+        self.store.set('a', 'x', 'replaced')
+        self.assertEqual(self.store.get('a', 'x'), 'replaced')
+
+    def test_keys_items_delete_clear(self):
+        self.store.set('a', 'y', 2)
+        self.store.set('a', 'x', 1)
+        self.store.set('b', 'z', 3)
+        self.assertEqual(self.store.keys('a'), ['x', 'y'])
+        self.assertEqual(self.store.items('a'), [('x', 1), ('y', 2)])
+
+        self.store.delete('a', 'x')
+        self.store.delete('a', 'missing')
+        self.assertEqual(self.store.keys('a'), ['y'])
+
+        self.store.clear('a')
+        self.assertEqual(self.store.keys('a'), [])
+        self.assertEqual(self.store.keys('b'), ['z'])
+
+    def test_transaction_rollback(self):
+        """ Are the changes in a failed transaction discarded?
+        """
+        self.store.set('a', 'x', 1)
+        try:
+            with self.store.transaction():
+                self.store.set('a', 'x', 2)
+                with self.store.transaction():
+                    self.store.set('a', 'y', 3)
+                raise ValueError
+        except ValueError:
+            pass
+        self.assertEqual(self.store.items('a'), [('x', 1)])
+
+    def test_threads(self):
+        """ Can the store be used from another thread?
+        """
+        thread = threading.Thread(target=self.store.set, args=('a', 'x', 1))
+        thread.start()
+        thread.join()
+        self.assertEqual(self.store.get('a', 'x'), 1)
+
+    def test_persistence(self):
+        """ Are values persisted, and are stores shared per file?
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, 'state.db')
+            store = get_state_store(filename)
+            self.assertIs(get_state_store(filename), store)
+            store.set('a', 'x', 1)
+            store.close()
+            self.assertEqual(StateStore(filename=filename).get('a', 'x'), 1)
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
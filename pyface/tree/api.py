@@ -26,7 +26,9 @@ from .tree_model import TreeModel
 
 from traits.etsconfig.api import ETSConfig
 if ETSConfig.toolkit == 'wx':
-    # Tree has not yet been ported to qt
     from .tree import Tree
 
+elif ETSConfig.toolkit == 'qt4':
+    from pyface.ui.qt4.tree.tree import Tree
+
 del ETSConfig
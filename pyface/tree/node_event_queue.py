@@ -0,0 +1,157 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2005, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Author: Enthought, Inc.
+# Description: <Enthought pyface package component>
+#------------------------------------------------------------------------------
+""" A queue that coalesces node insertion and removal events. """
+
+
+# Standard library imports.
+from collections import OrderedDict
+
+# Enthought library imports.
+from traits.api import Any, Callable, HasTraits
+
+# Local imports.
+from .node_event import NodeEvent
+
+
+class NodeEventQueue(HasTraits):
+    """ A queue that coalesces node insertion and removal events.
+
+    Events are grouped by the node that they refer to (i.e. the parent of the
+    inserted or removed children). The events for each parent are kept in the
+    order in which they were pushed, but an event is merged into the previous
+    event for the same parent if they are of the same kind and (for
+    insertions) the children are contiguous, so a burst of single child
+    appends becomes a single event.
+
+    """
+
+    #### 'NodeEventQueue' interface ###########################################
+
+    # A callable that returns a unique key for a node (usually the 'get_key'
+    # method of a tree model).
+    key = Callable
+
+    #### Private interface ####################################################
+
+    # The queued events.
+    #
+    # The keys are parent node keys, the values are tuples of the form
+    # (parent, [(kind, event), ...]) where 'kind' is either 'inserted' or
+    # 'removed'.
+    _events = Any
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """ Creates a new queue. """
+
+        super(NodeEventQueue, self).__init__(**traits)
+
+        self._events = OrderedDict()
+
+        return
+
+    def __len__(self):
+        """ Returns the number of parents that have queued events. """
+
+        return len(self._events)
+
+    ###########################################################################
+    # 'NodeEventQueue' interface.
+    ###########################################################################
+
+    def push(self, kind, event):
+        """ Queues an event of the specified kind.
+
+        'kind' is either 'inserted' or 'removed'. Returns True if the queue
+        was empty (i.e. the caller should arrange for it to be flushed).
+
+        """
+
+        was_empty = len(self._events) == 0
+
+        key = self.key(event.node)
+        if key not in self._events:
+            self._events[key] = (event.node, [])
+
+        parent, events = self._events[key]
+        if len(events) > 0 and self._can_merge(events[-1], kind, event):
+            last_kind, last_event = events[-1]
+            events[-1] = (kind, NodeEvent(
+                node     = event.node,
+                children = last_event.children + event.children,
+                index    = last_event.index
+            ))
+
+        else:
+            events.append((kind, event))
+
+        return was_empty
+
+    def pop_all(self):
+        """ Removes and returns all of the queued events.
+
+        Returns a list of tuples of the form (parent, [(kind, event), ...]),
+        with the parents in the order in which they were first pushed.
+
+        """
+
+        events, self._events = self._events, OrderedDict()
+
+        return list(events.values())
+
+    def discard(self, node):
+        """ Discards the queued events for a parent node.
+
+        Used when the parent is populated with its current children (which
+        already reflect every queued event).
+
+        """
+
+        self._events.pop(self.key(node), None)
+
+        return
+
+    def clear(self):
+        """ Discards all of the queued events. """
+
+        self._events = OrderedDict()
+
+        return
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _can_merge(self, last, kind, event):
+        """ Returns True if an event can be merged into the previous one. """
+
+        last_kind, last_event = last
+        if kind != last_kind:
+            return False
+
+        # Removals are applied by looking each child up, so their order does
+        # not matter.
+        if kind == 'removed':
+            return True
+
+        # An index of -1 means append!
+        if last_event.index == -1:
+            return event.index == -1
+
+        return event.index == last_event.index + len(last_event.children)
+
+#### EOF ######################################################################
@@ -15,9 +15,10 @@
 
 # Standard library imports.
 import logging
+from collections import OrderedDict
 
 # Enthought library imports.
-from traits.api import HasPrivateTraits, List
+from traits.api import HasPrivateTraits, Int, List
 
 # Local imports
 from .node_type import NodeType
@@ -35,6 +36,11 @@ class NodeManager(HasPrivateTraits):
     # All registered node types.
     node_types = List(NodeType)
 
+    # The maximum number of nodes whose types are cached individually (the
+    # types of nodes recognized by node types that only depend on a node's
+    # class are cached per class instead).
+    cache_size = Int(10000)
+
     # fixme: Where should the system actions go?  The node tree, the node
     # tree model, here?!?
     system_actions = List
@@ -53,7 +59,16 @@ class NodeManager(HasPrivateTraits):
         # nodes that change type dynamically then we will obviously have to
         # re-think this (although we should probably re-think dynamic type
         # changes first ;^).
-        self._node_to_type_map = {} # { Any node : NodeType node_type }
+        #
+        # The map is ordered from least to most recently used, and the node
+        # is kept with its type so that a recycled id can't return the type of
+        # a dead node.
+        self._node_to_type_map = OrderedDict() # { key : (node, node_type) }
+
+        # For each class of node seen so far, the node types that have to be
+        # asked about each node of that class (in order), and the node type
+        # that recognizes the class if none of them do (or None).
+        self._class_to_types_map = {} # { class : ([NodeType], NodeType) }
 
         return
 
@@ -79,26 +94,38 @@ class NodeManager(HasPrivateTraits):
 
         """
 
-        # Generate the key for the node to type map.
-        key = self.get_key(node)
-
-        # Check the cache first.
-        node_type = self._node_to_type_map.get(key, None)
-        if node_type is None:
-            # If we haven't seen this node before then attempt to find a node
-            # type that 'recognizes' it.
-            #
-            # fixme: We currently take the first node type that recognizes the
-            # node.  This obviously means that ordering of node types is
-            # important,  but we don't have an interface for controlling the
-            # order.  Maybe sort on some 'precedence' trait on the node type?
-            for node_type in self.node_types:
-                if node_type.is_type_for(node):
-                    self._node_to_type_map[key] = node_type
-                    break
+        # fixme: We currently take the first node type that recognizes the
+        # node.  This obviously means that ordering of node types is
+        # important,  but we don't have an interface for controlling the
+        # order.  Maybe sort on some 'precedence' trait on the node type?
+        klass = getattr(node, '__class__', type(node))
+        types = self._class_to_types_map.get(klass)
+        if types is None:
+            types = self._class_to_types_map[klass] = \
+                self._get_types_for_class(node)
+
+        candidates, node_type = types
+        if len(candidates) > 0:
+            # Generate the key for the node to type map.
+            key = self.get_key(node)
+
+            # Check the cache first.
+            cached = self._node_to_type_map.get(key)
+            if cached is not None and cached[0] is node:
+                del self._node_to_type_map[key]
+                self._node_to_type_map[key] = cached
+                node_type = cached[1]
 
             else:
-                node_type = None
+                # If we haven't seen this node before then attempt to find a
+                # node type that 'recognizes' it.
+                for candidate in candidates:
+                    if candidate.is_type_for(node):
+                        node_type = candidate
+                        break
+
+                if node_type is not None:
+                    self._cache_node_type(key, node, node_type)
 
         if node_type is None:
             logger.warn('no node type for %s' % str(node))
@@ -127,12 +154,71 @@ class NodeManager(HasPrivateTraits):
     # Private interface.
     ###########################################################################
 
+    def _get_types_for_class(self, node):
+        """ Returns the node types to ask about each node of a node's class.
+
+        Returns a tuple of the form (candidates, node_type), where
+        'candidates' is the list of node types that have to be asked about
+        each node of the class, and 'node_type' is the node type that
+        recognizes the class if none of the candidates recognizes a node (or
+        None).
+
+        """
+
+        candidates = []
+        for node_type in self.node_types:
+            if not node_type.is_class_type:
+                candidates.append(node_type)
+
+            # Any node of the class will do to ask a node type that only
+            # depends on the class.
+            elif node_type.is_type_for(node):
+                return candidates, node_type
+
+        return candidates, None
+
+    def _cache_node_type(self, key, node, node_type):
+        """ Caches the type of a node, discarding the least recently used
+        entries if the cache is full.
+
+        """
+
+        self._node_to_type_map[key] = (node, node_type)
+        while len(self._node_to_type_map) > max(0, self.cache_size):
+            self._node_to_type_map.popitem(last=False)
+
+        return
+
+    def _reset_node_types(self):
+        """ Discards all cached node types. """
+
+        self._node_to_type_map = OrderedDict()
+        self._class_to_types_map = {}
+
+        return
+
     def _node_types_changed(self, new):
         """ Called when the entire list of node types has been changed. """
 
         for node_type in new:
             node_type.node_manager = self
 
+        self._reset_node_types()
+
+        return
+
+    def _node_types_items_changed(self, event):
+        """ Called when node types have been added or removed. """
+
+        self._reset_node_types()
+
+        return
+
+    def _cache_size_changed(self):
+        """ Called when the size of the cache has been changed. """
+
+        self._node_to_type_map = OrderedDict()
+
         return
 
 #### EOF ######################################################################
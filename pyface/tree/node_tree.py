@@ -20,12 +20,18 @@ import inspect
 # Enthought library imports.
 from pyface.action.api import ActionEvent
 from traits.api import Instance, List, Property
+from traits.etsconfig.api import ETSConfig
 
 # Local imports.
 from .node_manager import NodeManager
 from .node_type import NodeType
 from .node_tree_model import NodeTreeModel
-from .tree import Tree
+
+if ETSConfig.toolkit == 'qt4':
+    from pyface.ui.qt4.tree.tree import Tree
+
+else:
+    from .tree import Tree
 
 
 class NodeTree(Tree):
@@ -15,7 +15,7 @@
 
 
 # Enthought library imports.
-from traits.api import Any, HasPrivateTraits, Instance, List
+from traits.api import Any, Bool, HasPrivateTraits, Instance, List
 from pyface.api import ImageResource
 from pyface.action.api import Action, ActionManagerItem, Group
 from pyface.action.api import MenuManager
@@ -40,6 +40,10 @@ class NodeType(HasPrivateTraits):
     # The node manager that the type belongs to.
     node_manager = Instance('pyface.tree.node_manager.NodeManager')
 
+    # Does 'is_type_for' only depend on the class of a node?  If so, the
+    # node manager only asks about one node of each class.
+    is_class_type = Bool(False)
+
     # The image used to represent nodes that DO NOT allow children.
     image = Instance(ImageResource)
 
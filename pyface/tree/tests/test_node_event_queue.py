@@ -0,0 +1,91 @@
+""" Tests for the node event queue. """
+
+import unittest
+
+from pyface.tree.node_event import NodeEvent
+from pyface.tree.node_event_queue import NodeEventQueue
+
+
+class NodeEventQueueTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.queue = NodeEventQueue(key=id)
+
+    def test_appends_are_merged(self):
+        """ Is a burst of appends to one parent merged into one event?
+        """
+        parent = object()
+        self.assertTrue(self.queue.push('inserted', NodeEvent(
+            node=parent, children=['a'], index=-1)))
+        for child in ['b', 'c']:
+            self.assertFalse(self.queue.push('inserted', NodeEvent(
+                node=parent, children=[child], index=-1)))
+
+        [(node, events)] = self.queue.pop_all()
+        self.assertIs(node, parent)
+        self.assertEqual(len(events), 1)
+        kind, event = events[0]
+        self.assertEqual(kind, 'inserted')
+        self.assertEqual(event.children, ['a', 'b', 'c'])
+        self.assertEqual(event.index, -1)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_order_is_kept(self):
+        """ Are events that cannot be merged kept in order per parent?
+        """
+        first, second = object(), object()
+        self.queue.push('inserted', NodeEvent(node=first, children=['a']))
+        self.queue.push('inserted', NodeEvent(node=second, children=['x']))
+        self.queue.push('removed', NodeEvent(node=first, children=['a']))
+        self.queue.push('removed', NodeEvent(node=first, children=['b']))
+        self.queue.push('inserted', NodeEvent(node=first, children=['c']))
+
+        # Insertions at the same index are not contiguous.
+        self.queue.push('inserted', NodeEvent(node=first, children=['d']))
+
+        [(node, events), (other, other_events)] = self.queue.pop_all()
+        self.assertIs(node, first)
+        self.assertEqual(
+            [(kind, event.children) for kind, event in events],
+            [('inserted', ['a']), ('removed', ['a', 'b']),
+             ('inserted', ['c']), ('inserted', ['d'])]
+        )
+        self.assertIs(other, second)
+        self.assertEqual(len(other_events), 1)
+
+    def test_contiguous_inserts_are_merged(self):
+        """ Are insertions that follow on from each other merged?
+        """
+        parent = object()
+        self.queue.push('inserted', NodeEvent(
+            node=parent, children=['a', 'b'], index=3))
+        self.queue.push('inserted', NodeEvent(
+            node=parent, children=['c'], index=5))
+
+        [(node, events)] = self.queue.pop_all()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0][1].children, ['a', 'b', 'c'])
+        self.assertEqual(events[0][1].index, 3)
+
+    def test_discard(self):
+        """ Does discarding a parent's events leave the others queued?
+        """
+        a, b = object(), object()
+        self.queue.push('inserted', NodeEvent(node=a, children=['a']))
+        self.queue.push('inserted', NodeEvent(node=b, children=['b']))
+        self.queue.discard(a)
+        self.queue.discard(object())
+
+        [(node, events)] = self.queue.pop_all()
+        self.assertIs(node, b)
+
+    def test_clear(self):
+        """ Does clearing the queue discard every event?
+        """
+        self.queue.push('removed', NodeEvent(node=object(), children=['a']))
+        self.queue.clear()
+        self.assertEqual(self.queue.pop_all(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
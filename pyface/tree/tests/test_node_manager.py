@@ -0,0 +1,102 @@
+# Standard library imports.
+import unittest
+
+# Enthought library imports.
+from traits.api import Any, Int
+
+# Local imports.
+from pyface.tree.node_manager import NodeManager
+from pyface.tree.node_type import NodeType
+
+
+class CountingNodeType(NodeType):
+    """ A node type that recognizes nodes of a class, and counts how often it
+    is asked.
+    """
+
+    # The class of node recognized.
+    klass = Any
+
+    # The number of times that the node type has been asked about a node.
+    count = Int
+
+    def is_type_for(self, node):
+        self.count += 1
+        return isinstance(node, self.klass)
+
+
+class SpecialNodeType(CountingNodeType):
+    """ A node type that recognizes nodes with a 'special' attribute.
+    """
+
+    def is_type_for(self, node):
+        self.count += 1
+        return getattr(node, 'special', False)
+
+
+class Node(object):
+    pass
+
+
+class NodeManagerTestCase(unittest.TestCase):
+
+    def test_class_type(self):
+        """ Is a class node type only asked about one node of each class?
+        """
+        str_type = CountingNodeType(klass=str, is_class_type=True)
+        node_type = CountingNodeType(klass=Node, is_class_type=True)
+        manager = NodeManager(node_types=[str_type, node_type])
+
+        nodes = [ Node() for i in range(100) ]
+        for node in nodes:
+            self.assertIs(manager.get_node_type(node), node_type)
+        self.assertEqual(node_type.count, 1)
+        self.assertEqual(str_type.count, 1)
+        self.assertEqual(len(manager._node_to_type_map), 0)
+
+    def test_order(self):
+        """ Do node types that depend on each node still take precedence?
+        """
+        class_type = CountingNodeType(klass=Node, is_class_type=True)
+        node_type = SpecialNodeType()
+        manager = NodeManager(node_types=[node_type, class_type])
+
+        special = Node()
+        special.special = True
+        self.assertIs(manager.get_node_type(Node()), class_type)
+        self.assertIs(manager.get_node_type(special), node_type)
+
+    def test_bounded_cache(self):
+        """ Is the per-node cache bounded, and checked for identity?
+        """
+        node_type = CountingNodeType(klass=list)
+        manager = NodeManager(node_types=[node_type], cache_size=10)
+
+        nodes = [ [] for i in range(20) ]
+        for node in nodes:
+            manager.get_node_type(node)
+        self.assertEqual(len(manager._node_to_type_map), 10)
+
+        # The most recently used nodes are cached.
+        node_type.count = 0
+        manager.get_node_type(nodes[-1])
+        self.assertEqual(node_type.count, 0)
+
+        # An equal but different node is not.
+        manager.get_node_type([])
+        self.assertEqual(node_type.count, 1)
+
+    def test_add_node_type(self):
+        """ Does adding a node type discard the cached types?
+        """
+        manager = NodeManager()
+        node = Node()
+        self.assertIsNone(manager.get_node_type(node))
+
+        node_type = CountingNodeType(klass=Node, is_class_type=True)
+        manager.add_node_type(node_type)
+        self.assertIs(manager.get_node_type(node), node_type)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+""" Tests for the wx tree. """
+
+import unittest
+
+try:
+    import wx
+except ImportError:
+    wx_available = False
+else:
+    wx_available = True
+
+from traits.api import HasTraits, List, Str
+
+from pyface.filter import Filter
+from pyface.sorter import Sorter
+from pyface.tree.node_event import NodeEvent
+from pyface.tree.tree_model import TreeModel
+
+
+class Node(HasTraits):
+    """ A node with a name and some children. """
+
+    name = Str
+
+    children = List
+
+
+class NodeTreeModel(TreeModel):
+    """ A model of a tree of nodes. """
+
+    def has_children(self, node):
+        return len(node.children) > 0
+
+    def get_children(self, node):
+        return node.children
+
+    def get_text(self, node):
+        return node.name
+
+    def insert(self, parent, child):
+        parent.children.append(child)
+        self.nodes_inserted = NodeEvent(
+            node=parent, children=[child], index=len(parent.children) - 1
+        )
+
+
+class NameFilter(Filter):
+    """ A filter that hides the nodes with a name. """
+
+    name = Str
+
+    def select(self, widget, parent, node):
+        return node.name != self.name
+
+
+class ReverseSorter(Sorter):
+    """ A sorter that sorts nodes by name in reverse. """
+
+    def sort_key(self, widget, parent, node):
+        return [-ord(c) for c in node.name]
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+class TreeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from pyface.gui import GUI
+        from pyface.tree.tree import Tree
+
+        self.gui = GUI()
+        self.frame = wx.Frame(None)
+
+        self.a1 = Node(name='a1')
+        self.a = Node(name='a', children=[self.a1])
+        self.root = Node(name='root', children=[self.a])
+        self.model = NodeTreeModel(root=self.root)
+
+        self.tree = Tree(self.frame, model=self.model, show_root=True)
+
+    def tearDown(self):
+        self.frame.Destroy()
+        self.gui.process_events()
+
+    def _get_children(self, node):
+        """ Returns the names of the children of a node in the control. """
+
+        control = self.tree.control
+        wxid = self.tree._get_wxid(node)
+
+        names = []
+        cid, cookie = control.GetFirstChild(wxid)
+        while cid.IsOk():
+            populated, child = control.GetPyData(cid)
+            names.append(child.name)
+            cid, cookie = control.GetNextChild(wxid, cookie)
+
+        return names
+
+    def test_insert_into_collapsed_node(self):
+        """ Is a node inserted into a collapsed node shown once expanded?
+        """
+        self.model.insert(self.a, Node(name='a2'))
+        self.tree.expand(self.a)
+
+        self.assertEqual(self._get_children(self.a), ['a1', 'a2'])
+
+    def test_expand_before_flush(self):
+        """ Are queued insertions not applied again to a node that is
+        populated when it is expanded (before the queue is flushed)?
+        """
+        wxid = self.tree._get_wxid(self.a)
+
+        self.model.insert(self.a, Node(name='a2'))
+        self.model.insert(self.a, Node(name='a3'))
+
+        # Expand the node directly (as the user would), so that the queue is
+        # not flushed first.
+        self.tree.control.Expand(wxid)
+        self.gui.process_events()
+
+        self.assertEqual(self._get_children(self.a), ['a1', 'a2', 'a3'])
+
+    def test_insert_into_expanded_node(self):
+        """ Are insertions into an expanded node applied when flushed?
+        """
+        self.tree.expand(self.a)
+
+        self.model.insert(self.a, Node(name='a2'))
+        self.gui.process_events()
+
+        self.assertEqual(self._get_children(self.a), ['a1', 'a2'])
+
+    def test_refresh_after_insert(self):
+        """ Are the children of grandchildren fetched again by a refresh after
+        an insertion?
+        """
+        a1x = Node(name='a1x')
+        self.a1.children = [a1x]
+        self.tree.expand(self.a)
+        self.tree.expand(self.a1)
+
+        self.model.insert(self.a, Node(name='a2'))
+        self.gui.process_events()
+
+        self.a1.children = [Node(name='a1y')]
+        self.model.fire_structure_changed(self.a)
+        self.tree.expand(self.a1)
+
+        self.assertEqual(self._get_children(self.a1), ['a1y'])
+
+    def test_filters_changed(self):
+        """ Are new filters applied when the tree is refreshed?
+        """
+        self.a.children = [self.a1, Node(name='a2')]
+        self.tree.expand(self.a)
+
+        self.tree.filters = [NameFilter(name='a1')]
+        self.tree.refresh(self.root)
+        self.tree.expand(self.a)
+
+        self.assertEqual(self._get_children(self.a), ['a2'])
+
+        self.tree.filters = []
+        self.tree.refresh(self.root)
+        self.tree.expand(self.a)
+
+        self.assertEqual(self._get_children(self.a), ['a1', 'a2'])
+
+    def test_sorter_changed(self):
+        """ Is a new sorter applied when the tree is refreshed?
+        """
+        self.a.children = [self.a1, Node(name='a2')]
+        self.tree.expand(self.a)
+
+        self.tree.sorter = ReverseSorter()
+        self.tree.refresh(self.root)
+        self.tree.expand(self.a)
+
+        self.assertEqual(self._get_children(self.a), ['a2', 'a1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
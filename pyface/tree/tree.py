@@ -29,6 +29,7 @@ from traits.api import List, Property, Callable, Str, Trait, Tuple
 from pyface.wx.drag_and_drop import PythonDropSource, PythonDropTarget
 
 # Local imports.
+from .node_event_queue import NodeEventQueue
 from .tree_model import TreeModel
 
 
@@ -217,6 +218,12 @@ class Tree(Widget):
         # Mapping from node to wx tree item Ids.
         self._node_to_id_map = {}
 
+        # Mapping from node keys to the node's filtered and sorted children.
+        self._children_cache = {}
+
+        # Node insertions and removals waiting to be applied to the tree.
+        self._node_events = NodeEventQueue(key=self.model.get_key)
+
         # Add the root node.
         if self.root is not None:
             self._add_root_node(self.root)
@@ -352,6 +359,9 @@ class Tree(Widget):
 
         """
 
+        # The node's children (and theirs etc.) must be fetched again.
+        self._invalidate_children(node)
+
         # Has the node actually appeared in the tree yet?
         pid = self._get_wxid(node)
         if pid is not None:
@@ -449,6 +459,11 @@ class Tree(Widget):
 
         """
 
+        # Apply any queued insertions and removals first, so that the tree
+        # is always in step with the model when it is used.
+        if len(self._node_events) > 0:
+            self._flush_node_events()
+
         # The model must generate a unique key for each node (unique within the
         # model).
         key = self.model.get_key(node)
@@ -695,7 +710,24 @@ class Tree(Widget):
         return self.model.has_children(node)
 
     def _get_children(self, node):
-        """ Get the children of a node. """
+        """ Get the children of a node.
+
+        The filtered and sorted children are cached until the model reports a
+        change to them, or the tree's filters or sorter change.
+
+        """
+
+        key = self.model.get_key(node)
+
+        filtered_children = self._children_cache.get(key)
+        if filtered_children is None:
+            filtered_children = self._children_cache[key] = \
+                self._filter_and_sort_children(node)
+
+        return filtered_children[:]
+
+    def _filter_and_sort_children(self, node):
+        """ Get the filtered and sorted children of a node from the model. """
 
         children = self.model.get_children(node)
 
@@ -715,6 +747,54 @@ class Tree(Widget):
 
         return filtered_children
 
+    def _invalidate_children(self, node, recursive=True):
+        """ Discards the cached children of a node.
+
+        If 'recursive' is True then the cached children of its descendants
+        are discarded too.
+
+        """
+
+        key = self.model.get_key(node)
+
+        children = self._children_cache.pop(key, None)
+        if recursive:
+            # The node's cached children may already have been discarded
+            # (e.g. when nodes were inserted into it) while those of its
+            # descendants were not, so the descendants that are in the tree
+            # are found from the control rather than from the cache.
+            #
+            # We don't use '_get_wxid' here as it flushes the node event
+            # queue.
+            wxid = self._node_to_id_map.get(key)
+            if wxid is not None and self.control is not None:
+                self._invalidate_item_children(wxid)
+
+            if children is not None:
+                for child in children:
+                    if self.model.get_key(child) not in self._node_to_id_map:
+                        self._invalidate_children(child)
+
+        return
+
+    def _invalidate_item_children(self, wxid):
+        """ Discards the cached children of the descendants of an item. """
+
+        cid, cookie = self.control.GetFirstChild(wxid)
+        while cid.IsOk():
+            # The item data is a tuple.  The first element indicates whether
+            # or not we have already populated the item with its children.
+            # The second element is the actual item data.
+            data = self.control.GetPyData(cid)
+            if data is not None:
+                populated, child = data
+                self._children_cache.pop(self.model.get_key(child), None)
+                self._invalidate_item_children(cid)
+
+            cid, cookie = self.control.GetNextChild(wxid, cookie)
+
+        return
+
     def _get_image_index(self, node):
         """ Returns the tree item image index for a node. """
 
@@ -815,11 +895,127 @@ class Tree(Widget):
 
         return
 
+    def _flush_node_events(self):
+        """ Applies the queued node insertions and removals to the tree.
+
+        All of the changes are made while the control is frozen, so it is
+        only redrawn once.
+
+        """
+
+        if len(self._node_events) == 0:
+            return
+
+        if self.control is None:
+            self._node_events.clear()
+            return
+
+        self.control.Freeze()
+        try:
+            for parent, events in self._node_events.pop_all():
+                self._apply_node_events(parent, events)
+
+        finally:
+            self.control.Thaw()
+
+        return
+
+    def _apply_node_events(self, parent, events):
+        """ Applies the queued insertions and removals for a parent node. """
+
+        # Has the node actually appeared in the tree yet?
+        pid = self._get_wxid(parent)
+        if pid is None:
+            return
+
+        inserted = [event for kind, event in events if kind == 'inserted']
+
+        # The item data is a tuple.  The first element indicates whether or
+        # not we have already populated the item with its children.  The
+        # second element is the actual item data.
+        if self.show_root or parent is not self.root:
+            populated, node = self.control.GetPyData(pid)
+
+        else:
+            populated = True
+
+        if not populated:
+            # If the node is not yet populated then just get the children and
+            # add them (they already reflect every queued event).
+            if len(inserted) > 0:
+                for child in self._get_children(parent):
+                    self._add_node(pid, child)
+
+                # The element is now populated!
+                if self.show_root or parent is not self.root:
+                    self.control.SetPyData(pid, (True, parent))
+
+            else:
+                # Does the node have any children left?
+                self.control.SetItemHasChildren(
+                    pid, self._has_children(parent)
+                )
+
+                return
+
+        # Otherwise, apply the events in order.
+        else:
+            for kind, event in events:
+                if kind == 'inserted':
+                    # An index of -1 means append!
+                    index = event.index
+                    if index == -1:
+                        index = self.control.GetChildrenCount(pid, False)
+
+                    for child in event.children:
+                        self._insert_node(pid, child, index)
+                        index += 1
+
+                else:
+                    for child in event.children:
+                        cid = self._get_wxid(child)
+                        if cid is not None:
+                            self.control.Delete(cid)
+
+        # Does the node have any children now?
+        has_children = self.control.GetChildrenCount(pid) > 0
+        self.control.SetItemHasChildren(pid, has_children)
+
+        # If nodes were inserted and the node is not expanded then expand it.
+        if len(inserted) > 0 and not self.is_expanded(parent):
+            self.expand(parent)
+
+        return
+
     #### Trait event handlers #################################################
 
+    def _filters_changed(self):
+        """ Called when the filters have been changed. """
+
+        self._children_cache = {}
+
+        return
+
+    def _filters_items_changed(self):
+        """ Called when filters have been added or removed. """
+
+        self._children_cache = {}
+
+        return
+
+    def _sorter_changed(self):
+        """ Called when the sorter has been changed. """
+
+        self._children_cache = {}
+
+        return
+
     def _on_root_changed(self, root):
         """ Called when the root of the model has changed. """
 
+        self._children_cache = {}
+        self._node_events.clear()
+
         # Delete everything...
         if self.control is not None:
             self.control.DeleteAllItems()
@@ -835,6 +1031,25 @@ class Tree(Widget):
     def _on_nodes_changed(self, event):
         """ Called when nodes have been changed. """
 
+        # A change to a node may change whether it is filtered out, or where
+        # it is sorted.
+        if len(self.filters) > 0 or self.sorter is not None:
+            if len(event.children) > 0:
+                self._invalidate_children(event.node, recursive=False)
+
+            wxid = self._get_wxid(event.node)
+            if wxid is not None and event.node is not self.root:
+                # The item data of a hidden root node is not set.
+                pid = self.control.GetItemParent(wxid)
+                data = self.control.GetPyData(pid)
+                if data is not None:
+                    populated, parent = data
+
+                else:
+                    parent = self.root
+
+                self._invalidate_children(parent, recursive=False)
+
         self._update_node(self._get_wxid(event.node), event.node)
 
         for child in event.children:
@@ -847,75 +1062,37 @@ class Tree(Widget):
     def _on_nodes_inserted(self, event):
         """ Called when nodes have been inserted. """
 
-        parent   = event.node
-        children = event.children
-        index    = event.index
+        # The parent's existing children are unchanged.
+        self._invalidate_children(event.node, recursive=False)
 
-        # Has the node actually appeared in the tree yet?
-        pid = self._get_wxid(parent)
-        if pid is not None:
-            # The item data is a tuple.  The first element indicates whether or
-            # not we have already populated the item with its children.  The
-            # second element is the actual item data.
-            if self.show_root or parent is not self.root:
-                populated, node = self.control.GetPyData(pid)
-
-            else:
-                populated = True
-
-            # If the node is not yet populated then just get the children and
-            # add them.
-            if not populated:
-                for child in self._get_children(parent):
-                    self._add_node(pid, child)
-
-            # Otherwise, insert them.
-            else:
-                # An index of -1 means append!
-                if index == -1:
-                    index = self.control.GetChildrenCount(pid, False)
-
-                for child in children:
-                    self._insert_node(pid, child, index)
-                    index += 1
-
-            # The element is now populated!
-            if self.show_root or parent is not self.root:
-                self.control.SetPyData(pid, (True, parent))
-
-            # Does the node have any children now?
-            has_children = self.control.GetChildrenCount(pid) > 0
-            self.control.SetItemHasChildren(pid, has_children)
-
-            # If the node is not expanded then expand it.
-            if not self.is_expanded(parent):
-                self.expand(parent)
+        # The tree is updated when the event loop is next idle (or when the
+        # tree is next used), along with any other insertions and removals.
+        if self._node_events.push('inserted', event):
+            GUI.invoke_later(self._flush_node_events)
 
         return
 
     def _on_nodes_removed(self, event):
         """ Called when nodes have been removed. """
 
-        parent   = event.node
-        children = event.children
-
-        # Has the node actually appeared in the tree yet?
-        pid = self._get_wxid(parent)
-        if pid is not None:
-            for child in event.children:
-                cid = self._get_wxid(child)
-                if cid is not None:
-                    self.control.Delete(cid)
+        self._invalidate_children(event.node, recursive=False)
+        for child in event.children:
+            self._invalidate_children(child)
 
-            # Does the node have any children left?
-            has_children = self.control.GetChildrenCount(pid) > 0
-            self.control.SetItemHasChildren(pid, has_children)
+        # The tree is updated when the event loop is next idle (or when the
+        # tree is next used), along with any other insertions and removals.
+        if self._node_events.push('removed', event):
+            GUI.invoke_later(self._flush_node_events)
 
         return
 
     def _on_nodes_replaced(self, event):
         """ Called when nodes have been replaced. """
 
+        self._invalidate_children(event.node, recursive=False)
+        for old_child in event.old_children:
+            self._invalidate_children(old_child)
+
         for old_child, new_child in zip(event.old_children, event.children):
             cid = self._get_wxid(old_child)
             if cid is not None:
@@ -1095,6 +1272,11 @@ class Tree(Widget):
         if self.model.is_expandable(node):
             # Lazily populate the item's children.
             if not populated:
+                # The children already reflect any insertions and removals
+                # that are still queued for the node, so they must not be
+                # applied again when the queue is flushed.
+                self._node_events.discard(node)
+
                 # Add the child nodes.
                 for child in self._get_children(node):
                     self._add_node(wxid, child)
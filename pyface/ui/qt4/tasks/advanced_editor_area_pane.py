@@ -85,6 +85,7 @@ class AdvancedEditorAreaPane(TaskPane, MEditorAreaPane):
     def activate_editor(self, editor):
         """ Activates the specified editor in the pane.
         """
+        self.wake_editor(editor)
         editor_widget = editor.control.parent()
         editor_widget.setVisible(True)
         editor_widget.raise_()
@@ -126,6 +127,48 @@ class AdvancedEditorAreaPane(TaskPane, MEditorAreaPane):
             self._main_window_layout.set_layout_for_area(
                 layout, QtCore.Qt.LeftDockWidgetArea)
 
+    ###########################################################################
+    # Protected 'MEditorAreaPane' interface.
+    ###########################################################################
+
+    def _create_editor_placeholder(self, editor):
+        """ Creates the placeholder for a hibernated editor.
+        """
+        return QtGui.QWidget(editor.control.parent())
+
+    def _destroy_editor_placeholder(self, placeholder):
+        """ Destroys a placeholder for a hibernated editor.
+        """
+        placeholder.hide()
+        placeholder.deleteLater()
+
+    def _get_editor_placeholder_parent(self, placeholder):
+        """ Returns the parent for a woken editor's control.
+        """
+        return placeholder.parent()
+
+    def _get_visible_editors(self):
+        """ Returns the editors whose dock widgets are visible.
+
+        A dock widget that is tabified behind another one is still "visible"
+        as far as Qt is concerned, but has an empty visible region.
+        """
+        editors = []
+        for editor in self.editors:
+            editor_widget = editor.control.parent()
+            if (editor_widget.isVisible() and
+                    not editor_widget.visibleRegion().isEmpty()):
+                editors.append(editor)
+        return editors
+
+    def _replace_editor_control(self, editor, old, new):
+        """ Puts the control 'new' in the place of 'old' in the editor area.
+        """
+        editor_widget = old.parent()
+        editor_widget.setWidget(new)
+        if editor_widget.isVisible():
+            new.show()
+
     ###########################################################################
     # Private interface.
     ###########################################################################
@@ -277,7 +320,7 @@ class EditorAreaWidget(QtGui.QMainWindow):
         """
         editor_widget.hide()
         editor_widget.removeEventFilter(self)
-        editor_widget.editor.destroy()
+        self.editor_area._destroy_editor_control(editor_widget.editor)
         self.removeDockWidget(editor_widget)
 
     def get_dock_widgets(self):
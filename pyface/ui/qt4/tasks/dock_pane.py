@@ -155,8 +155,11 @@ class DockPane(TaskPane, MDockPane):
     #### Signal handlers ######################################################
 
     def _receive_dock_area(self, area):
-        with self._signal_context():
-            self.dock_area = INVERSE_AREA_MAP[int(area)]
+        # A dock widget that is floated reports that it is in no dock area,
+        # but it keeps the area that it will be docked back into.
+        if int(area) in INVERSE_AREA_MAP:
+            with self._signal_context():
+                self.dock_area = INVERSE_AREA_MAP[int(area)]
 
     def _receive_floating(self, floating):
         with self._signal_context():
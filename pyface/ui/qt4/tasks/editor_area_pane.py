@@ -11,7 +11,7 @@ from pyface.qt import QtCore, QtGui
 
 # Local imports.
 from .task_pane import TaskPane
-from .util import set_focus
+from .util import replace_tab_widget, set_focus
 
 ###############################################################################
 # 'EditorAreaPane' class.
@@ -83,6 +83,7 @@ class EditorAreaPane(TaskPane, MEditorAreaPane):
     def activate_editor(self, editor):
         """ Activates the specified editor in the pane.
         """
+        self.wake_editor(editor)
         self.control.setCurrentWidget(editor.control)
 
     def add_editor(self, editor):
@@ -105,12 +106,44 @@ class EditorAreaPane(TaskPane, MEditorAreaPane):
         """
         self.editors.remove(editor)
         self.control.removeTab(self.control.indexOf(editor.control))
-        editor.destroy()
+        self._destroy_editor_control(editor)
         editor.editor_area = None
         self._update_tab_bar()
         if not self.editors:
             self.active_editor = None
 
+    ###########################################################################
+    # Protected 'MEditorAreaPane' interface.
+    ###########################################################################
+
+    def _create_editor_placeholder(self, editor):
+        """ Creates the placeholder for a hibernated editor.
+        """
+        return QtGui.QWidget(self.control)
+
+    def _destroy_editor_placeholder(self, placeholder):
+        """ Destroys a placeholder for a hibernated editor.
+        """
+        placeholder.hide()
+        placeholder.deleteLater()
+
+    def _get_editor_placeholder_parent(self, placeholder):
+        """ Returns the parent for a woken editor's control.
+        """
+        return self.control
+
+    def _get_visible_editors(self):
+        """ Returns the editor shown by the tab widget.
+        """
+        current = self.control.currentWidget()
+        return [ editor for editor in self.editors
+                 if editor.control is current ]
+
+    def _replace_editor_control(self, editor, old, new):
+        """ Puts the control 'new' in the place of 'old' in the editor area.
+        """
+        replace_tab_widget(self.control, old, new)
+
     ###########################################################################
     # Protected interface.
     ###########################################################################
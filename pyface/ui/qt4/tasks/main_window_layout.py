@@ -1,4 +1,5 @@
 # Standard library imports.
+from contextlib import contextmanager
 from itertools import combinations
 import logging
 
@@ -6,7 +7,7 @@ import logging
 from pyface.qt import QtCore, QtGui
 
 # Enthought library imports.
-from traits.api import Any, HasTraits
+from traits.api import Any, Bool, HasTraits, Int, List
 
 # Local imports.
 from pyface.tasks.task_layout import LayoutContainer, PaneItem, Tabbed, \
@@ -30,6 +31,17 @@ class MainWindowLayout(HasTraits):
     # The QMainWindow control to lay out.
     control = Any
 
+    #### Private interface ####################################################
+
+    # The nesting depth of 'suspend_updates' contexts.
+    _suspend_count = Int(0)
+
+    # The dock widgets to raise once Qt has performed its layout.
+    _raised_widgets = List
+
+    # Whether a call to '_finish_layout' has been scheduled.
+    _finish_pending = Bool(False)
+
     ###########################################################################
     # 'MainWindowLayout' interface.
     ###########################################################################
@@ -111,91 +123,49 @@ class MainWindowLayout(HasTraits):
     def set_layout(self, layout):
         """ Applies a DockLayout to the window.
         """
-        # Remove all existing dock widgets.
-        for child in self.control.children():
-            if isinstance(child, QtGui.QDockWidget):
-                child.hide()
-                self.control.removeDockWidget(child)
-
-        # Perform the layout. This will assign fixed sizes to the dock widgets
-        # to enforce size constraints specified in the PaneItems.
+        # Compute the complete arrangement before touching the window.
+        plan = _LayoutPlan()
         for name, q_dock_area in AREA_MAP.iteritems():
             sublayout = getattr(layout, name)
             if sublayout:
-                self.set_layout_for_area(sublayout, q_dock_area,
-                                         _toplevel_call=False)
+                self._plan_layout_for_area(plan, sublayout, q_dock_area)
 
-        # Remove the fixed sizes once Qt activates the layout.
-        QtCore.QTimer.singleShot(0, self._reset_fixed_sizes)
+        with self.suspend_updates():
+            # Remove all existing dock widgets.
+            for child in self.control.children():
+                if isinstance(child, QtGui.QDockWidget):
+                    child.hide()
+                    self.control.removeDockWidget(child)
 
-    def set_layout_for_area(self, layout, q_dock_area,
-                            _toplevel_added=False, _toplevel_call=True):
+            # Perform the layout. This will assign fixed sizes to the dock
+            # widgets to enforce size constraints specified in the PaneItems.
+            self._apply_plan(plan)
+
+    def set_layout_for_area(self, layout, q_dock_area):
         """ Applies a LayoutItem to the specified dock area.
         """
-        # If we try to do the layout bottom-up, Qt will become confused. In
-        # order to do it top-down, we have know which dock widget is
-        # "effectively" top level, requiring us to reach down to the leaves of
-        # the layout. (This is really only an issue for Splitter layouts, since
-        # Tabbed layouts are, for our purposes, leaves.)
-
-        if isinstance(layout, PaneItem):
-            if not _toplevel_added:
-                widget = self._prepare_toplevel_for_item(layout)
-                if widget:
-                    self.control.addDockWidget(q_dock_area, widget)
-                    widget.show()
-
-        elif isinstance(layout, Tabbed):
-            active_widget = first_widget = None
-            for item in layout.items:
-                widget = self._prepare_toplevel_for_item(item)
-                if not widget:
-                    continue
-                if item.id == layout.active_tab:
-                    active_widget = widget
-                if first_widget:
-                    self.control.tabifyDockWidget(first_widget, widget)
-                else:
-                    if not _toplevel_added:
-                        self.control.addDockWidget(q_dock_area, widget)
-                    first_widget = widget
-                widget.show()
+        plan = _LayoutPlan()
+        self._plan_layout_for_area(plan, layout, q_dock_area)
+        with self.suspend_updates():
+            self._apply_plan(plan)
 
-            # Activate the appropriate tab, if possible.
-            if not active_widget:
-                # By default, Qt will activate the last widget.
-                active_widget = first_widget
-            if active_widget:
-                # It seems that the 'raise_' call only has an effect after the
-                # QMainWindow has performed its internal layout.
-                QtCore.QTimer.singleShot(0, active_widget.raise_)
+    @contextmanager
+    def suspend_updates(self):
+        """ A context manager that suspends painting of the QMainWindow.
 
-        elif isinstance(layout, Splitter):
-            # Perform top-level splitting as per above comment.
-            orient = ORIENTATION_MAP[layout.orientation]
-            prev_widget = None
-            for item in layout.items:
-                widget = self._prepare_toplevel_for_item(item)
-                if not widget:
-                    continue
-                if prev_widget:
-                    self.control.splitDockWidget(prev_widget, widget, orient)
-                elif not _toplevel_added:
-                    self.control.addDockWidget(q_dock_area, widget)
-                prev_widget = widget
-                widget.show()
-
-            # Now we can recurse.
-            for i, item in enumerate(layout.items):
-                self.set_layout_for_area(item, q_dock_area,
-                    _toplevel_added=True, _toplevel_call=False)
-
-        else:
-            raise MainWindowLayoutError("Unknown layout item %r" % layout)
-
-        # Remove the fixed sizes once Qt activates the layout.
-        if _toplevel_call:
-            QtCore.QTimer.singleShot(0, self._reset_fixed_sizes)
+        Contexts may be nested; painting resumes when the outermost context is
+        exited.
+        """
+        control = self.control
+        if self._suspend_count == 0 and control is not None:
+            control.setUpdatesEnabled(False)
+        self._suspend_count += 1
+        try:
+            yield
+        finally:
+            self._suspend_count -= 1
+            if self._suspend_count == 0 and control is not None:
+                control.setUpdatesEnabled(True)
 
     ###########################################################################
     # 'MainWindowLayout' abstract interface.
@@ -249,6 +219,99 @@ class MainWindowLayout(HasTraits):
                     return child
         return None
 
+    def _apply_plan(self, plan):
+        """ Applies a _LayoutPlan to the QMainWindow in a single pass.
+        """
+        for function, args in plan.operations:
+            function(*args)
+
+        # Raising tabs and removing the fixed sizes only has an effect after
+        # the QMainWindow has performed its internal layout, which it does
+        # once for the whole plan.
+        self._raised_widgets.extend(plan.raised)
+        if not self._finish_pending:
+            self._finish_pending = True
+            QtCore.QTimer.singleShot(0, self._finish_layout)
+
+    def _finish_layout(self):
+        """ Raises the active tabs and clears the fixed sizes of the last
+        applied plan.
+        """
+        raised, self._raised_widgets = self._raised_widgets, []
+        self._finish_pending = False
+        if self.control is None:
+            return
+        for widget in raised:
+            widget.raise_()
+        self._reset_fixed_sizes()
+
+    def _plan_layout_for_area(self, plan, layout, q_dock_area,
+                              toplevel_added=False):
+        """ Adds the operations that apply a LayoutItem to the specified dock
+        area to a _LayoutPlan.
+        """
+        # If we try to do the layout bottom-up, Qt will become confused. In
+        # order to do it top-down, we have know which dock widget is
+        # "effectively" top level, requiring us to reach down to the leaves of
+        # the layout. (This is really only an issue for Splitter layouts, since
+        # Tabbed layouts are, for our purposes, leaves.)
+
+        if isinstance(layout, PaneItem):
+            if not toplevel_added:
+                widget = self._prepare_toplevel_for_item(layout)
+                if widget:
+                    plan.add(self.control.addDockWidget, q_dock_area, widget)
+                    plan.add(widget.show)
+
+        elif isinstance(layout, Tabbed):
+            active_widget = first_widget = None
+            for item in layout.items:
+                widget = self._prepare_toplevel_for_item(item)
+                if not widget:
+                    continue
+                if item.id == layout.active_tab:
+                    active_widget = widget
+                if first_widget:
+                    plan.add(self.control.tabifyDockWidget, first_widget,
+                             widget)
+                else:
+                    if not toplevel_added:
+                        plan.add(self.control.addDockWidget, q_dock_area,
+                                 widget)
+                    first_widget = widget
+                plan.add(widget.show)
+
+            # Activate the appropriate tab, if possible.
+            if not active_widget:
+                # By default, Qt will activate the last widget.
+                active_widget = first_widget
+            if active_widget:
+                plan.raised.append(active_widget)
+
+        elif isinstance(layout, Splitter):
+            # Perform top-level splitting as per above comment.
+            orient = ORIENTATION_MAP[layout.orientation]
+            prev_widget = None
+            for item in layout.items:
+                widget = self._prepare_toplevel_for_item(item)
+                if not widget:
+                    continue
+                if prev_widget:
+                    plan.add(self.control.splitDockWidget, prev_widget,
+                             widget, orient)
+                elif not toplevel_added:
+                    plan.add(self.control.addDockWidget, q_dock_area, widget)
+                prev_widget = widget
+                plan.add(widget.show)
+
+            # Now we can recurse.
+            for item in layout.items:
+                self._plan_layout_for_area(plan, item, q_dock_area,
+                                           toplevel_added=True)
+
+        else:
+            raise MainWindowLayoutError("Unknown layout item %r" % layout)
+
     def _prepare_pane(self, dock_widget, include_sizes=True):
         """ Returns a sized PaneItem for a QDockWidget.
         """
@@ -296,6 +359,21 @@ class MainWindowLayout(HasTraits):
 
 
 
+class _LayoutPlan(object):
+    """ The operations needed to apply a layout to a QMainWindow, in order.
+    """
+
+    def __init__(self):
+        # A list of (callable, arguments) pairs.
+        self.operations = []
+
+        # The dock widgets to raise once Qt has performed its layout.
+        self.raised = []
+
+    def add(self, function, *args):
+        self.operations.append((function, args))
+
+
 class MainWindowLayoutError(ValueError):
     """ Exception raised when a malformed LayoutItem is passed to the
     MainWindowLayout.
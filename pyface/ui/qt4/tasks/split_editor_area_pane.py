@@ -17,6 +17,7 @@ from pyface.drop_handler import IDropHandler, BaseDropHandler, FileDropHandler
 
 # Local imports.
 from .task_pane import TaskPane
+from .util import replace_tab_widget
 
 ###############################################################################
 # 'SplitEditorAreaPane' class.
@@ -113,6 +114,7 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
     def activate_editor(self, editor):
         """ Activates the specified editor in the pane.
         """
+        self.wake_editor(editor)
         active_tabwidget = editor.control.parent().parent()
         active_tabwidget.setCurrentWidget(editor.control)
         self.active_tabwidget = active_tabwidget
@@ -148,7 +150,7 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         tabwidget = editor.control.parent().parent()
         tabwidget.removeTab(tabwidget.indexOf(editor.control))
         self.editors.remove(editor)
-        editor.destroy()
+        self._destroy_editor_control(editor)
         editor.editor_area = None
         if not self.editors:
             self.active_editor = None
@@ -228,6 +230,41 @@ class SplitEditorAreaPane(TaskPane, MEditorAreaPane):
         # return QMenu object
         return menu
 
+    ###########################################################################
+    # Protected 'MEditorAreaPane' interface.
+    ###########################################################################
+
+    def _create_editor_placeholder(self, editor):
+        """ Creates the placeholder for a hibernated editor.
+        """
+        return QtGui.QWidget(editor.control.parent())
+
+    def _destroy_editor_placeholder(self, placeholder):
+        """ Destroys a placeholder for a hibernated editor.
+        """
+        placeholder.hide()
+        placeholder.deleteLater()
+
+    def _get_editor_placeholder_parent(self, placeholder):
+        """ Returns the parent for a woken editor's control.
+        """
+        return placeholder.parent().parent()
+
+    def _get_visible_editors(self):
+        """ Returns the editors shown by the tabwidgets.
+        """
+        editors = []
+        for tabwidget in self.tabwidgets():
+            editor = self._get_editor(tabwidget.currentWidget())
+            if editor is not None:
+                editors.append(editor)
+        return editors
+
+    def _replace_editor_control(self, editor, old, new):
+        """ Puts the control 'new' in the place of 'old' in the editor area.
+        """
+        replace_tab_widget(old.parent().parent(), old, new)
+
     ###########################################################################
     # Protected interface.
     ###########################################################################
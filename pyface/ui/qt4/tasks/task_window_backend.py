@@ -2,7 +2,7 @@
 from pyface.qt import QtCore, QtGui
 
 # Enthought library imports.
-from traits.api import Instance, List
+from traits.api import Any, Instance, List, on_trait_change
 
 # Local imports.
 from pyface.tasks.i_task_window_backend import MTaskWindowBackend
@@ -27,6 +27,10 @@ class TaskWindowBackend(MTaskWindowBackend):
 
     _main_window_layout = Instance(MainWindowLayout)
 
+    # A map from the controls of the active task's panes to the panes, or None
+    # if it must be recomputed.
+    _panes_by_control = Any
+
     ###########################################################################
     # 'ITaskWindowBackend' interface.
     ###########################################################################
@@ -53,22 +57,25 @@ class TaskWindowBackend(MTaskWindowBackend):
         self.window._active_state.layout = self.get_layout()
 
         # Now hide its controls.
-        self.control.centralWidget().removeWidget(state.central_pane.control)
-        for dock_pane in state.dock_panes:
-            # Warning: The layout behavior is subtly different (and wrong!) if
-            # the order of these two statement is switched.
-            dock_pane.control.hide()
-            self.control.removeDockWidget(dock_pane.control)
+        with self._main_window_layout.suspend_updates():
+            self.control.centralWidget().removeWidget(
+                state.central_pane.control)
+            for dock_pane in state.dock_panes:
+                # Warning: The layout behavior is subtly different (and
+                # wrong!) if the order of these two statement is switched.
+                dock_pane.control.hide()
+                self.control.removeDockWidget(dock_pane.control)
 
     def show_task(self, state):
         """ Assuming no task is currently active, show the controls of the
             specified TaskState.
         """
-        # Show the central pane.
-        self.control.centralWidget().addWidget(state.central_pane.control)
+        with self._main_window_layout.suspend_updates():
+            # Show the central pane.
+            self.control.centralWidget().addWidget(state.central_pane.control)
 
-        # Show the dock panes.
-        self._layout_state(state)
+            # Show the dock panes.
+            self._layout_state(state)
 
         # OSX-specific: if there is only a single tool bar, it doesn't matter if
         # the user can drag it around or not. Therefore, we can combine it with
@@ -108,40 +115,116 @@ class TaskWindowBackend(MTaskWindowBackend):
         """ Layout the dock panes in the specified TaskState using its
             TaskLayout.
         """
-        # Assign the window's corners to the appropriate dock areas.
-        for name, corner in CORNER_MAP.iteritems():
-            area = getattr(state.layout, name + '_corner')
-            self.control.setCorner(corner, AREA_MAP[area])
-
-        # Add all panes in the TaskLayout.
-        self._main_window_layout.state = state
-        self._main_window_layout.set_layout(state.layout)
-
-        # Add all panes not assigned an area by the TaskLayout.
-        for dock_pane in state.dock_panes:
-            if dock_pane.control not in self._main_window_layout.consumed:
-                self.control.addDockWidget(AREA_MAP[dock_pane.dock_area],
-                                           dock_pane.control)
-                # By default, these panes are not visible. However, if a pane
-                # has been explicitly set as visible, honor that setting.
-                if dock_pane.visible:
-                    dock_pane.control.show()
+        main_window_layout = self._main_window_layout
+        with main_window_layout.suspend_updates():
+            # Assign the window's corners to the appropriate dock areas.
+            for name, corner in CORNER_MAP.iteritems():
+                area = getattr(state.layout, name + '_corner')
+                self.control.setCorner(corner, AREA_MAP[area])
+
+            # Add all panes in the TaskLayout.
+            main_window_layout.state = state
+            main_window_layout.set_layout(state.layout)
+
+            # Add all panes not assigned an area by the TaskLayout.
+            consumed = set(main_window_layout.consumed)
+            for dock_pane in state.dock_panes:
+                if dock_pane.control not in consumed:
+                    self.control.addDockWidget(AREA_MAP[dock_pane.dock_area],
+                                               dock_pane.control)
+                    # By default, these panes are not visible. However, if a
+                    # pane has been explicitly set as visible, honor that
+                    # setting.
+                    if dock_pane.visible:
+                        dock_pane.control.show()
+
+    def _connect_dock_signals(self, control):
+        """ Listens for the layout changes of a dock pane's control.
+        """
+        if control is not None:
+            control.dockLocationChanged.connect(
+                self._dock_layout_changed_signal)
+            control.topLevelChanged.connect(self._dock_layout_changed_signal)
+
+    def _disconnect_dock_signals(self, control):
+        """ Stops listening for the layout changes of a dock pane's control.
+        """
+        if control is not None:
+            # The control may already have been deleted, or the signals never
+            # connected if the control was created before the pane was added.
+            try:
+                control.dockLocationChanged.disconnect(
+                    self._dock_layout_changed_signal)
+                control.topLevelChanged.disconnect(
+                    self._dock_layout_changed_signal)
+            except (RuntimeError, TypeError):
+                pass
+
+    def _get_pane_for_widget(self, widget):
+        """ Returns the pane of the active task that contains a widget, or None
+        if there is no such pane.
+        """
+        if widget is None:
+            return None
+
+        panes_by_control = self._panes_by_control
+        if panes_by_control is None:
+            panes = [ self.window.central_pane ] + self.window.dock_panes
+            panes_by_control = dict((pane.control, pane) for pane in panes
+                                    if pane.control is not None)
+            self._panes_by_control = panes_by_control
+
+        # Walk up the widget hierarchy instead of testing every pane.
+        while widget is not None:
+            pane = panes_by_control.get(widget)
+            if pane is not None or widget.isWindow():
+                return pane
+            widget = widget.parentWidget()
+        return None
 
     #### Trait initializers ###################################################
 
     def __main_window_layout_default(self):
         return TaskWindowLayout(control=self.control)
 
+    #### Trait change handlers ################################################
+
+    @on_trait_change('window:central_pane, window:dock_panes[], '
+                     'window:central_pane:control, window:dock_panes:control')
+    def _panes_updated(self):
+        self._panes_by_control = None
+
+    @on_trait_change('window:dock_panes[]')
+    def _dock_panes_updated(self, obj, name, old, new):
+        if name == 'window':
+            old = old.dock_panes if old is not None else []
+            new = new.dock_panes if new is not None else []
+        for dock_pane in old:
+            self._disconnect_dock_signals(dock_pane.control)
+        for dock_pane in new:
+            self._connect_dock_signals(dock_pane.control)
+
+    @on_trait_change('window:dock_panes:control')
+    def _dock_pane_control_updated(self, dock_pane, name, old, new):
+        self._disconnect_dock_signals(old)
+        self._connect_dock_signals(new)
+
     #### Signal handlers ######################################################
 
+    def _dock_layout_changed_signal(self, *args):
+        # A dock widget has been moved (possibly within its dock area, which
+        # does not change its pane's 'dock_area'), tabified or floated, so
+        # the focus order of the panes may have changed.
+        self.window._invalidate_pane_ring()
+
     def _focus_changed_signal(self, old, new):
         if self.window.active_task:
-            panes = [ self.window.central_pane ] + self.window.dock_panes
-            for pane in panes:
-                if new and pane.control.isAncestorOf(new):
-                    pane.has_focus = True
-                elif old and pane.control.isAncestorOf(old):
-                    pane.has_focus = False
+            new_pane = self._get_pane_for_widget(new)
+            old_pane = self._get_pane_for_widget(old)
+            if old_pane is not None and old_pane is not new_pane:
+                old_pane.has_focus = False
+            if new_pane is not None:
+                new_pane.has_focus = True
 
 
 class TaskWindowLayout(MainWindowLayout):
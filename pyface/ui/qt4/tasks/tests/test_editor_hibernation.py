@@ -0,0 +1,159 @@
+""" Tests for hibernating the editors of the editor area panes. """
+
+import unittest
+
+from traits.api import Int
+
+from pyface.qt import QtCore, QtGui
+from pyface.tasks.api import Editor, EditorAreaPane
+from pyface.tasks.editor_hibernation_policy import EditorHibernationPolicy
+from pyface.tasks.split_editor_area_pane import SplitEditorAreaPane
+from pyface.ui.qt4.util.testing import event_loop
+
+
+class StatefulEditor(Editor):
+    """ An editor whose control has some state that survives hibernation. """
+
+    # The state of the editor's control.
+    value = Int
+
+    # The number of times that the control has been created.
+    created = Int
+
+    def create(self, parent):
+        super(StatefulEditor, self).create(parent)
+        self.created += 1
+
+    def restore_state(self, state):
+        self.value = state
+
+    def save_state(self):
+        return self.value
+
+
+class SplitEditorAreaPaneHibernationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.editor_area = SplitEditorAreaPane(
+            hibernation_policy=EditorHibernationPolicy(max_live=2)
+        )
+        self.editor_area.create(parent=None)
+
+    def tearDown(self):
+        with event_loop():
+            self.editor_area.destroy()
+
+    def _add_editors(self, count):
+        editors = []
+        for i in range(count):
+            editor = StatefulEditor(value=i)
+            with event_loop():
+                self.editor_area.add_editor(editor)
+                self.editor_area.activate_editor(editor)
+            editors.append(editor)
+        return editors
+
+    def test_hibernate_least_recently_used(self):
+        """ Are the least recently used editors hibernated?
+        """
+        a, b, c = self._add_editors(3)
+
+        self.assertTrue(a.hibernated)
+        self.assertFalse(b.hibernated)
+        self.assertFalse(c.hibernated)
+
+        # The placeholder takes the editor's place in the tab widget.
+        tabwidget = self.editor_area.control.tabwidget()
+        self.assertEqual(tabwidget.count(), 3)
+        self.assertIs(tabwidget.widget(0), a.control)
+
+    def test_wake_on_activation(self):
+        """ Is a hibernated editor woken (with its state) when activated?
+        """
+        a, b, c = self._add_editors(3)
+        a.value = -1
+
+        with event_loop():
+            self.editor_area.activate_editor(a)
+
+        self.assertFalse(a.hibernated)
+        self.assertEqual(a.created, 2)
+        self.assertEqual(a.value, 0)
+        self.assertIs(self.editor_area.control.tabwidget().widget(0),
+                      a.control)
+
+        # Now the least recently used editor is hibernated instead.
+        self.assertTrue(b.hibernated)
+        self.assertFalse(c.hibernated)
+
+    def test_visible_editors_are_not_hibernated(self):
+        """ Are the editors shown by other tab widgets kept alive?
+        """
+        self.editor_area.hibernation_policy.max_live = 1
+        a, = self._add_editors(1)
+
+        with event_loop():
+            self.editor_area.control.split(orientation=QtCore.Qt.Horizontal)
+        b, = self._add_editors(1)
+
+        # Both editors are visible (in their own tab widgets), so neither is
+        # hibernated even though only one editor may be live.
+        self.assertFalse(a.hibernated)
+        self.assertFalse(b.hibernated)
+
+        # Once hidden behind another editor, the editor can be hibernated.
+        c, = self._add_editors(1)
+        self.assertFalse(a.hibernated)
+        self.assertTrue(b.hibernated)
+        self.assertFalse(c.hibernated)
+
+    def test_remove_hibernated_editor(self):
+        """ Can a hibernated editor be removed?
+        """
+        a, b, c = self._add_editors(3)
+
+        with event_loop():
+            self.editor_area.remove_editor(a)
+
+        self.assertIsNone(a.control)
+        self.assertFalse(a.hibernated)
+        self.assertEqual(self.editor_area.control.tabwidget().count(), 2)
+
+
+class EditorAreaPaneHibernationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.editor_area = EditorAreaPane(
+            hibernation_policy=EditorHibernationPolicy(max_live=1)
+        )
+        self.editor_area.create(parent=None)
+
+    def tearDown(self):
+        with event_loop():
+            self.editor_area.destroy()
+
+    def test_hibernate_and_wake(self):
+        """ Are editors hidden behind the active one hibernated and woken?
+        """
+        a = StatefulEditor(value=1)
+        b = StatefulEditor(value=2)
+        with event_loop():
+            self.editor_area.add_editor(a)
+            self.editor_area.activate_editor(a)
+            self.editor_area.add_editor(b)
+            self.editor_area.activate_editor(b)
+
+        self.assertTrue(a.hibernated)
+        self.assertFalse(b.hibernated)
+
+        with event_loop():
+            self.editor_area.activate_editor(a)
+
+        self.assertFalse(a.hibernated)
+        self.assertEqual(a.value, 1)
+        self.assertTrue(b.hibernated)
+        self.assertIs(self.editor_area.control.currentWidget(), a.control)
+
+
+if __name__ == '__main__':
+    unittest.main()
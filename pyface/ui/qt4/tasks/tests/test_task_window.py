@@ -0,0 +1,101 @@
+""" Tests for the pane focus order of the TaskWindow class. """
+
+import unittest
+
+from traits.api import List
+
+from pyface.qt import QtCore
+from pyface.tasks.api import DockPane, PaneItem, Task, TaskLayout, \
+    TaskPane, TaskWindow, VSplitter
+from pyface.ui.qt4.util.testing import event_loop
+
+
+class LeftPanesTask(Task):
+    """ A task with two dock panes, one above the other, on the left. """
+
+    id = 'tests.left_panes_task'
+    name = 'Left Panes Task'
+
+    dock_panes = List
+
+    def create_central_pane(self):
+        return TaskPane(id='tests.left_panes_task.central_pane')
+
+    def create_dock_panes(self):
+        self.dock_panes = [
+            DockPane(id='tests.left_panes_task.a', name='A'),
+            DockPane(id='tests.left_panes_task.b', name='B'),
+        ]
+        return self.dock_panes
+
+    def _default_layout_default(self):
+        return TaskLayout(
+            left=VSplitter(PaneItem('tests.left_panes_task.a'),
+                           PaneItem('tests.left_panes_task.b'))
+        )
+
+
+class TaskWindowPaneRingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.task = LeftPanesTask()
+        self.window = TaskWindow(size=(800, 600))
+        self.window.add_task(self.task)
+        with event_loop():
+            self.window.open()
+
+        self.a, self.b = self.task.dock_panes
+
+    def tearDown(self):
+        with event_loop():
+            self.window.close()
+
+    def _get_ring(self):
+        return [ pane.id.rsplit('.', 1)[-1]
+                 for pane in self.window._get_pane_ring() ]
+
+    def test_ring(self):
+        """ Are the panes ordered by the layout?
+        """
+        self.assertEqual(self._get_ring(), ['central_pane', 'a', 'b'])
+
+        # The ring is cached.
+        self.assertIs(self.window._get_pane_ring(),
+                      self.window._get_pane_ring())
+
+    def test_reorder_docks(self):
+        """ Is the ring recomputed when docks are reordered within their dock
+        area?
+        """
+        self.assertEqual(self._get_ring(), ['central_pane', 'a', 'b'])
+
+        with event_loop():
+            self.window.control.splitDockWidget(
+                self.b.control, self.a.control, QtCore.Qt.Vertical)
+
+        self.assertEqual(self.a.dock_area, 'left')
+        self.assertEqual(self._get_ring(), ['central_pane', 'b', 'a'])
+
+    def test_tabify_docks(self):
+        """ Is the ring recomputed when docks are tabified?
+        """
+        self.assertEqual(self._get_ring(), ['central_pane', 'a', 'b'])
+
+        with event_loop():
+            self.window.control.tabifyDockWidget(
+                self.b.control, self.a.control)
+
+        self.assertEqual(self._get_ring(), ['central_pane', 'b', 'a'])
+
+    def test_float_dock(self):
+        """ Is the ring recomputed when a dock is floated?
+        """
+        self.window._get_pane_ring()
+
+        with event_loop():
+            self.a.control.setFloating(True)
+
+        self.assertIsNone(self.window._pane_ring)
+
+if __name__ == '__main__':
+    unittest.main()
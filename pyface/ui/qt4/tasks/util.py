@@ -36,3 +36,26 @@ def set_focus(control):
                 control.focusNextChild()
             finally:
                 control.setWindowFlags(flags)
+
+def replace_tab_widget(tab_widget, old, new):
+    """ Replace the page 'old' of a QTabWidget with 'new'.
+
+    The tab text, tooltip and position are preserved, as is the current page.
+    Signals of the tab widget are blocked during the replacement, so that no
+    spurious 'currentChanged' signals are emitted.
+    """
+    index = tab_widget.indexOf(old)
+    if index == -1:
+        return
+
+    current = tab_widget.currentIndex() == index
+    blocked = tab_widget.blockSignals(True)
+    try:
+        # Insert before removing so that the tab widget is never empty.
+        tab_widget.insertTab(index, new, tab_widget.tabText(index))
+        tab_widget.setTabToolTip(index, tab_widget.tabToolTip(index + 1))
+        tab_widget.removeTab(index + 1)
+        if current:
+            tab_widget.setCurrentIndex(index)
+    finally:
+        tab_widget.blockSignals(blocked)
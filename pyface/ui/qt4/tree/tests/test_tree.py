@@ -0,0 +1,152 @@
+""" Tests for the Qt Tree. """
+
+import unittest
+
+from traits.api import Dict, Int
+
+from pyface.filter import Filter
+from pyface.qt import QtCore, QtGui
+from pyface.tree.node_event import NodeEvent
+from pyface.tree.tree_model import TreeModel
+from pyface.ui.qt4.tree.tree import Tree
+from pyface.util.guisupport import get_app_qt4
+
+
+class LargeTreeModel(TreeModel):
+    """ A tree model that counts how much of it has been looked at. """
+
+    # Mapping from nodes to their children.
+    children = Dict
+
+    # The number of times that the children of a node have been requested.
+    get_children_count = Int
+
+    # The number of nodes that are being listened to.
+    listener_count = Int
+
+    def has_children(self, node):
+        return len(self.children.get(node, [])) > 0
+
+    def get_children(self, node):
+        self.get_children_count += 1
+        return self.children.get(node, [])
+
+    def add_listener(self, node):
+        self.listener_count += 1
+
+    def remove_listener(self, node):
+        self.listener_count -= 1
+
+
+class TestTree(unittest.TestCase):
+
+    def setUp(self):
+        self.app = get_app_qt4()
+        self.widget = QtGui.QWidget()
+        self.model = LargeTreeModel(
+            root='root', children={'root' : range(100000), 0 : [-1, -2]}
+        )
+        self.tree = Tree(
+            self.widget, model=self.model, show_root=False, batch_size=100
+        )
+        self.item_model = self.tree.control.model()
+
+    def tearDown(self):
+        self.tree.destroy()
+        self.widget.deleteLater()
+        self.app.processEvents()
+
+    def test_children_fetched_in_batches(self):
+        """ Are only the children that the view needs fetched?
+        """
+        root = QtCore.QModelIndex()
+        self.assertEqual(self.item_model.rowCount(root), 100)
+        self.assertEqual(self.model.listener_count, 101)
+        self.assertTrue(self.item_model.canFetchMore(root))
+
+        self.item_model.fetchMore(root)
+        self.assertEqual(self.item_model.rowCount(root), 200)
+        self.assertEqual(self.model.get_children_count, 1)
+
+        # Later batches are as large as the children fetched so far.
+        self.item_model.fetchMore(root)
+        self.assertEqual(self.item_model.rowCount(root), 400)
+
+    def test_expand_and_collapse(self):
+        """ Can a node that has been fetched be expanded and collapsed?
+        """
+        self.assertFalse(self.tree.is_expanded(0))
+        self.tree.expand(0)
+        self.assertTrue(self.tree.is_expanded(0))
+        self.tree.collapse(0)
+        self.assertFalse(self.tree.is_expanded(0))
+
+        # Nodes that have not been fetched are never expanded.
+        self.tree.expand(500)
+        self.assertFalse(self.tree.is_expanded(500))
+
+    def test_nodes_inserted_and_removed(self):
+        """ Are inserted and removed nodes reflected by the fetched rows?
+        """
+        root = QtCore.QModelIndex()
+        self.model.children['root'] = ['new'] + list(range(100000))
+        self.model.fire_nodes_inserted('root', ['new'])
+        self.assertEqual(self.item_model.rowCount(root), 101)
+        self.assertEqual(self.tree.get_parent('new'), 'root')
+
+        self.model.children['root'] = list(range(100000))
+        self.model.nodes_removed = NodeEvent(node='root', children=['new'])
+        self.assertEqual(self.item_model.rowCount(root), 100)
+        self.assertIsNone(self.tree.get_parent('new'))
+        self.assertEqual(self.model.listener_count, 101)
+
+    def test_refresh_after_insert(self):
+        """ Are the children of grandchildren fetched again by a refresh after
+        an insertion?
+        """
+        # Note that we don't use -1 as a node since it has the same key (its
+        # hash) as -2.
+        item_model = self.tree._item_model
+        self.model.children.update({0 : ['a'], 'a' : ['x']})
+        item_model.fetch(item_model.find(0))
+        item_model.fetch(item_model.find('a'))
+
+        self.model.children[0] = ['a', 'b']
+        self.model.fire_nodes_inserted(0, ['b'])
+
+        self.model.children['a'] = ['y']
+        self.tree.refresh(0)
+        item = item_model.find('a')
+        item_model.fetch(item)
+
+        self.assertEqual([child.node for child in item.children], ['y'])
+
+    def test_refresh_after_change(self):
+        """ Are the children of grandchildren fetched again by a refresh after
+        a change that discards the cached children of the node?
+        """
+        item_model = self.tree._item_model
+        self.tree.filters = [Filter()]
+        self.model.children.update({0 : ['a'], 'a' : ['x']})
+        item_model.fetch(item_model.find(0))
+        item_model.fetch(item_model.find('a'))
+
+        self.model.fire_nodes_changed(0, ['a'])
+
+        self.model.children['a'] = ['y']
+        self.tree.refresh(0)
+        item_model.fetch(item_model.find(0))
+        item = item_model.find('a')
+        item_model.fetch(item)
+
+        self.assertEqual([child.node for child in item.children], ['y'])
+
+    def test_destroy_removes_listeners(self):
+        """ Does destroying the tree stop listening to every node?
+        """
+        self.tree.destroy()
+        self.assertEqual(self.model.listener_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
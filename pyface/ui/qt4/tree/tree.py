@@ -0,0 +1,1396 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2005, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Author: Enthought, Inc.
+# Description: <Enthought pyface package component>
+#------------------------------------------------------------------------------
+""" A tree control with a model/ui architecture. """
+
+
+# Standard library imports.
+import logging
+
+# Major package imports.
+from pyface.qt import QtCore, QtGui
+
+# Enthought library imports.
+from pyface.api import Filter, GUI, KeyPressedEvent, Sorter
+from traits.api import Any, Bool, Callable, Enum, Event, Instance, Int
+from traits.api import List, Property, Str, Trait
+
+# Local imports.
+from pyface.tree.tree_model import TreeModel
+from pyface.ui.qt4.widget import Widget
+
+
+# Create a logger for this module.
+logger = logging.getLogger(__name__)
+
+
+class _TreeItem(object):
+    """ A node that has appeared in the tree. """
+
+    __slots__ = ('node', 'parent', 'row', 'nodes', 'children')
+
+    def __init__(self, node, parent, row):
+        """ Creates a new item. """
+
+        # The node in the tree model.
+        self.node = node
+
+        # The item of the node's parent (None for the invisible root item).
+        self.parent = parent
+
+        # The index of the item in its parent's children.
+        self.row = row
+
+        # The node's filtered and sorted children (None until they are first
+        # needed).
+        self.nodes = None
+
+        # The items for the children that have been fetched so far. These
+        # always correspond to the start of 'nodes'.
+        self.children = []
+
+        return
+
+
+class _TreeItemModel(QtCore.QAbstractItemModel):
+    """ The Qt item model that adapts a tree model for the view.
+
+    Children are fetched lazily, a batch at a time, so an item is only
+    created for a node when the view needs to show it.
+
+    """
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, tree):
+        """ Creates a new item model. """
+
+        QtCore.QAbstractItemModel.__init__(self)
+
+        # The tree that we are the item model for.
+        self._tree = tree
+
+        # The invisible root item. If the root node is hidden then this is
+        # its item, otherwise the root node is its only child.
+        self._root = _TreeItem(None, None, 0)
+        self._root.nodes = []
+
+        # Mapping from node keys to the items that have been created.
+        self._items = {}
+
+        return
+
+    ###########################################################################
+    # 'QAbstractItemModel' interface.
+    ###########################################################################
+
+    def canFetchMore(self, parent):
+        """ Returns True if there are children that have not been fetched. """
+
+        item = self.get_item(parent)
+        if item.nodes is None:
+            # Give the model a chance to veto the expansion before the
+            # children are fetched.
+            node = item.node
+            model = self._tree.model
+
+            return model.is_expandable(node) and self._tree._has_children(node)
+
+        return len(item.children) < len(item.nodes)
+
+    def columnCount(self, parent):
+        """ Returns the number of columns. """
+
+        return 1
+
+    def data(self, index, role):
+        """ Returns the data for an item. """
+
+        if not index.isValid():
+            return None
+
+        item = index.internalPointer()
+
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._tree._get_text(item.node)
+
+        elif role == QtCore.Qt.DecorationRole:
+            if self._tree.show_images:
+                return self._tree._get_icon(item.node, index)
+
+        return None
+
+    def fetchMore(self, parent):
+        """ Fetches the next batch of children. """
+
+        self.fetch(self.get_item(parent))
+
+        return
+
+    def flags(self, index):
+        """ Returns the flags for an item. """
+
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+        if self._tree.model.is_editable(index.internalPointer().node):
+            flags |= QtCore.Qt.ItemIsEditable
+
+        return flags
+
+    def hasChildren(self, parent):
+        """ Returns True if an item has children.
+
+        The children are not fetched to find out.
+
+        """
+
+        item = self.get_item(parent)
+        if item.nodes is not None:
+            return len(item.nodes) > 0
+
+        if item.node is None:
+            return False
+
+        return self._tree._has_children(item.node)
+
+    def index(self, row, column, parent):
+        """ Returns the index of a child item. """
+
+        item = self.get_item(parent)
+        if column == 0 and 0 <= row < len(item.children):
+            return self.createIndex(row, 0, item.children[row])
+
+        return QtCore.QModelIndex()
+
+    def parent(self, index):
+        """ Returns the index of the parent of an item. """
+
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        return self.get_index(index.internalPointer().parent)
+
+    def rowCount(self, parent):
+        """ Returns the number of children of an item that are fetched. """
+
+        if parent.column() > 0:
+            return 0
+
+        return len(self.get_item(parent).children)
+
+    def setData(self, index, value, role):
+        """ Sets the label of an item after it has been edited. """
+
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+
+        return self._tree._set_label(index.internalPointer().node, value)
+
+    ###########################################################################
+    # '_TreeItemModel' interface.
+    ###########################################################################
+
+    def get_index(self, item):
+        """ Returns the index of an item. """
+
+        if item is None or item is self._root:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(item.row, 0, item)
+
+    def get_item(self, index):
+        """ Returns the item at an index. """
+
+        if index.isValid():
+            return index.internalPointer()
+
+        return self._root
+
+    def find(self, node):
+        """ Returns the item of a node (None if it has not been created). """
+
+        return self._items.get(self._tree.model.get_key(node))
+
+    def fetch(self, item):
+        """ Fetches the next batch of an item's children. """
+
+        if item.nodes is None:
+            item.nodes = self._tree._get_children(item.node)
+
+        # The view lays out all of the rows of the parent again after each
+        # batch, so the batches grow with the fetched children to keep the
+        # cost of fetching every child proportional to the number of children.
+        start = len(item.children)
+        end = min(len(item.nodes), start + max(self._tree.batch_size, start))
+        if end > start:
+            self.beginInsertRows(self.get_index(item), start, end - 1)
+            for row in range(start, end):
+                item.children.append(
+                    self._create_item(item.nodes[row], item, row)
+                )
+            self.endInsertRows()
+
+        return
+
+    def fetch_all(self, item):
+        """ Fetches all of an item's children. """
+
+        while self.canFetchMore(self.get_index(item)):
+            self.fetch(item)
+
+        return
+
+    def reset_root(self, root, show_root):
+        """ Discards every item and starts again from a new root node. """
+
+        self.beginResetModel()
+
+        self.release()
+
+        self._root = _TreeItem(None, None, 0)
+        if root is None:
+            self._root.nodes = []
+
+        elif show_root:
+            self._root.nodes = [root]
+            self._root.children = [self._create_item(root, self._root, 0)]
+
+        else:
+            self._root.node = root
+
+            # This gives the model a chance to wire up trait handlers etc.
+            self._tree.model.add_listener(root)
+
+            self._register(self._root)
+
+        self.endResetModel()
+
+        return
+
+    def insert_children(self, item, nodes):
+        """ Updates an item after nodes have been inserted into its children.
+
+        The item's cached children must already have been invalidated.
+
+        """
+
+        # If the children have not been fetched yet then there is nothing to
+        # update.
+        if item.nodes is None:
+            return
+
+        complete = len(item.children) == len(item.nodes)
+        item.nodes = self._tree._get_children(item.node)
+
+        positions = dict(
+            (self._key(node), row) for row, node in enumerate(item.nodes)
+        )
+        rows = sorted(
+            positions[key] for key in map(self._key, nodes)
+            if key in positions
+        )
+
+        # Nodes that are inserted beyond the fetched children are fetched
+        # along with their neighbours, unless every child had been fetched.
+        parent = self.get_index(item)
+        for row in rows:
+            if row < len(item.children) or complete:
+                self.beginInsertRows(parent, row, row)
+                item.children.insert(
+                    row, self._create_item(item.nodes[row], item, row)
+                )
+                self._renumber(item, row + 1)
+                self.endInsertRows()
+
+        return
+
+    def remove_children(self, item, nodes):
+        """ Updates an item after nodes have been removed from its children.
+
+        The item's cached children must already have been invalidated.
+
+        """
+
+        if item.nodes is None:
+            return
+
+        removed = set(map(self._key, nodes))
+        item.nodes = [
+            node for node in item.nodes if self._key(node) not in removed
+        ]
+
+        rows = [
+            child.row for child in item.children
+            if self._key(child.node) in removed
+        ]
+
+        parent = self.get_index(item)
+        for row in reversed(rows):
+            self.beginRemoveRows(parent, row, row)
+            child = item.children.pop(row)
+            self._release(child)
+            self._unregister(child)
+
+            # This gives the model a chance to remove trait handlers etc.
+            self._tree.model.remove_listener(child.node)
+            self._renumber(item, row)
+            self.endRemoveRows()
+
+        return
+
+    def replace_node(self, item, node):
+        """ Replaces the node of an item (and discards its children). """
+
+        self.clear_children(item)
+
+        self._unregister(item)
+        self._tree.model.remove_listener(item.node)
+
+        item.node = node
+        if item.parent is not None:
+            item.parent.nodes[item.row] = node
+
+        self._tree.model.add_listener(node)
+        self._register(item)
+
+        self.update_item(item)
+
+        return
+
+    def clear_children(self, item):
+        """ Discards the items of an item's children.
+
+        They are fetched again when they are next needed.
+
+        """
+
+        if len(item.children) > 0:
+            self.beginRemoveRows(
+                self.get_index(item), 0, len(item.children) - 1
+            )
+            self._release(item)
+            item.children = []
+            self.endRemoveRows()
+
+        item.nodes = None
+
+        return
+
+    def update_item(self, item):
+        """ Notifies the view that an item's text or image has changed. """
+
+        index = self.get_index(item)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+        return
+
+    def release(self):
+        """ Discards every item. """
+
+        self._release(self._root)
+        if self._root.node is not None:
+            self._tree.model.remove_listener(self._root.node)
+
+        self._items = {}
+
+        return
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _key(self, node):
+        """ Returns the key of a node. """
+
+        # The model must generate a unique key for each node (unique within the
+        # model).
+        return self._tree.model.get_key(node)
+
+    def _create_item(self, node, parent, row):
+        """ Creates the item for a node. """
+
+        item = _TreeItem(node, parent, row)
+
+        # This gives the model a chance to wire up trait handlers etc.
+        self._tree.model.add_listener(node)
+
+        self._register(item)
+
+        return item
+
+    def _register(self, item):
+        """ Makes sure that we can find the item of a node. """
+
+        self._items[self._key(item.node)] = item
+
+        return
+
+    def _unregister(self, item):
+        """ Removes the item of a node from the key map. """
+
+        key = self._key(item.node)
+        if self._items.get(key) is item:
+            del self._items[key]
+
+        return
+
+    def _release(self, item):
+        """ Releases the items of an item's descendants. """
+
+        for child in item.children:
+            self._release(child)
+            self._unregister(child)
+
+            # This gives the model a chance to remove trait handlers etc.
+            self._tree.model.remove_listener(child.node)
+
+        return
+
+    def _renumber(self, item, start):
+        """ Renumbers an item's children from a row onwards. """
+
+        children = item.children
+        for row in range(start, len(children)):
+            children[row].row = row
+
+        return
+
+
+class _TreeView(QtGui.QTreeView):
+    """ The Qt tree view that we delegate to.
+
+    We use this derived class so that we can turn mouse and keyboard events
+    into trait events on the tree.
+
+    """
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, tree, parent):
+        """ Creates a new tree view. """
+
+        QtGui.QTreeView.__init__(self, parent)
+
+        # The tree that we are the toolkit-specific delegate for.
+        self._tree = tree
+
+        return
+
+    ###########################################################################
+    # 'QWidget' interface.
+    ###########################################################################
+
+    def contextMenuEvent(self, event):
+        """ Called when the context menu is requested. """
+
+        self._tree._on_context_menu(event.pos(), event.globalPos())
+
+        return
+
+    def keyPressEvent(self, event):
+        """ Called when a key is pressed when the tree has focus. """
+
+        self._tree._on_key_press(event)
+
+        QtGui.QTreeView.keyPressEvent(self, event)
+
+        return
+
+    def mouseDoubleClickEvent(self, event):
+        """ Called when the tree is double clicked. """
+
+        QtGui.QTreeView.mouseDoubleClickEvent(self, event)
+
+        self._tree._on_double_click(event.pos())
+
+        return
+
+    def mousePressEvent(self, event):
+        """ Called when a mouse button is pressed on the tree. """
+
+        QtGui.QTreeView.mousePressEvent(self, event)
+
+        if event.button() == QtCore.Qt.LeftButton:
+            self._tree._on_left_click(event.pos())
+
+        return
+
+
+class Tree(Widget):
+    """ A tree control with a model/ui architecture.
+
+    Only the rows that are visible are ever drawn, and a node's children are
+    only fetched (in batches) when the view needs to show them, so the cost
+    of a tree depends on how much of it has been looked at rather than on
+    how large the model is.
+
+    """
+
+    #### 'Tree' interface #####################################################
+
+    # The number of a node's children that are fetched at once. Once more
+    # than this many have been fetched, each batch is as large as the
+    # children already fetched.
+    batch_size = Int(1000)
+
+    # The tree's filters (empty if no filtering is required).
+    filters = List(Filter)
+
+    # Mode for lines connecting tree nodes which emphasize hierarchy:
+    # 'appearance' - only on when lines look good,
+    # 'on' - always on, 'off' - always off
+    # NOTE: Qt styles decide whether lines are drawn, so this is ignored.
+    lines_mode = Enum('appearance', 'on', 'off')
+
+    # The model that provides the data for the tree.
+    model = Instance(TreeModel, ())
+
+    # The root of the tree (this is for convenience, it just delegates to
+    # the tree's model).
+    root = Property(Any)
+
+    # The objects currently selected in the tree.
+    selection = List
+
+    # Selection mode.
+    selection_mode = Enum('single', 'extended')
+
+    # Should an image be shown for each node?
+    show_images = Bool(True)
+
+    # Should lines be drawn between levels in the tree (ignored, see
+    # 'lines_mode').
+    show_lines = Bool(True)
+
+    # Should the root of the tree be shown?
+    show_root = Bool(True)
+
+    # The tree's sorter (None if no sorting is required).
+    sorter = Instance(Sorter)
+
+    #### Events ####
+
+    # A right-click occurred on the control (not a node!).
+    control_right_clicked = Event#(Point)
+
+    # A key was pressed while the tree has focus.
+    key_pressed = Event(KeyPressedEvent)
+
+    # A node has been activated (ie. double-clicked).
+    node_activated = Event#(Any)
+
+    # A drag operation was started on a node.
+    node_begin_drag = Event#(Any)
+
+    # A (non-leaf) node has been collapsed.
+    node_collapsed = Event#(Any)
+
+    # A (non-leaf) node has been expanded.
+    node_expanded = Event#(Any)
+
+    # A left-click occurred on a node.
+    #
+    # Tuple(node, point).
+    node_left_clicked = Event#(Tuple)
+
+    # A right-click occurred on a node.
+    #
+    # Tuple(node, point). Unlike a left-click, the point is in screen
+    # coordinates so that it can be used to position a context menu.
+    node_right_clicked = Event#(Tuple)
+
+    #### Private interface ####################################################
+
+    # A name to distinguish the tree for debugging!
+    _name = Str('Anonymous tree')
+
+    # An optional callback to detect the end of a label edit.  This is
+    # useful because the callback will be invoked even if the node label was
+    # not actually changed.
+    _label_edit_callback = Trait(None, Callable, None)
+
+    # Flag for allowing selection events to be ignored
+    _ignore_selection_events = Bool(False)
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, parent, image_size=(16, 16), **traits):
+        """ Creates a new tree.
+
+        'parent' is the toolkit-specific control that is the tree's parent.
+
+        'image_size' is a tuple in the form (int width, int height) that
+        specifies the size of the images (if required) displayed in the tree.
+
+        """
+
+        # Base class constructors.
+        super(Tree, self).__init__(**traits)
+
+        # Mapping from node keys to the node's filtered and sorted children.
+        self._children_cache = {}
+
+        # Mapping from images to the icons created for them.
+        self._icon_cache = {}
+
+        # Create the toolkit-specific control. Every row has the same height
+        # so that the view never has to measure the rows that are not
+        # visible.
+        self.control = tree = _TreeView(self, parent)
+        tree.setUniformRowHeights(True)
+        tree.setHeaderHidden(True)
+        tree.setIconSize(QtCore.QSize(*image_size))
+        tree.setRootIsDecorated(True)
+        tree.setEditTriggers(
+            QtGui.QAbstractItemView.EditKeyPressed |
+            QtGui.QAbstractItemView.SelectedClicked
+        )
+
+        if self.selection_mode == 'single':
+            tree.setSelectionMode(QtGui.QAbstractItemView.SingleSelection)
+
+        else:
+            tree.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
+
+        self._item_model = _TreeItemModel(self)
+        tree.setModel(self._item_model)
+
+        # Wire up the Qt tree signals.
+        tree.expanded.connect(self._on_expanded)
+        tree.collapsed.connect(self._on_collapsed)
+        tree.selectionModel().selectionChanged.connect(
+            self._on_selection_changed
+        )
+        tree.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+        # Add the root node.
+        if self.root is not None:
+            self._add_root_node(self.root)
+
+        # Listen for changes to the model.
+        self._add_model_listeners(self.model)
+
+        return
+
+    ###########################################################################
+    # 'IWidget' interface.
+    ###########################################################################
+
+    def destroy(self):
+        """ Destroys the control. """
+
+        # Stop listening to the model! Resetting the item model (rather than
+        # just releasing its items) makes sure that the view never asks about
+        # an item after it has been released.
+        if self.control is not None:
+            self._remove_model_listeners(self.model)
+            self._item_model.reset_root(None, False)
+
+        super(Tree, self).destroy()
+
+        return
+
+    ###########################################################################
+    # 'Tree' interface.
+    ###########################################################################
+
+    #### Properties ###########################################################
+
+    def _get_root(self):
+        """ Returns the root node of the tree. """
+
+        return self.model.root
+
+    def _set_root(self, root):
+        """ Sets the root node of the tree. """
+
+        self.model.root = root
+
+        return
+
+    #### Methods ##############################################################
+
+    def collapse(self, node):
+        """ Collapses the specified node. """
+
+        index = self._get_index(node)
+        if index.isValid():
+            self.control.collapse(index)
+
+        return
+
+    def edit_label(self, node, callback=None):
+        """ Edits the label of the specified node.
+
+        If a callback is specified it will be called when the label edit
+        completes WHETHER OR NOT the label was actually changed.
+
+        The callback must take exactly 3 arguments:- (tree, node, label)
+
+        """
+
+        index = self._get_index(node)
+        if index.isValid():
+            self._label_edit_callback = callback
+            self.control.edit(index)
+
+        return
+
+    def expand(self, node):
+        """ Expands the specified node. """
+
+        index = self._get_index(node)
+        if index.isValid():
+            self.control.expand(index)
+
+        return
+
+    def expand_all(self):
+        """ Expands every node in the tree.
+
+        This fetches every node in the model, so it should be avoided for
+        large trees.
+
+        """
+
+        item = self._item_model.find(self.root)
+        if item is not None:
+            self._expand_item(item)
+
+        return
+
+    def get_parent(self, node):
+        """ Returns the parent of a node.
+
+        This will only work iff the node has been displayed in the tree.  If it
+        hasn't then None is returned.
+
+        """
+
+        item = self._item_model.find(node)
+        if item is not None and item.parent is not None:
+            parent = item.parent.node
+
+        else:
+            parent = None
+
+        return parent
+
+    def is_expanded(self, node):
+        """ Returns True if the node is expanded, otherwise False. """
+
+        # If the root node is hidden then it is always expanded!
+        if node is self.root and not self.show_root:
+            return True
+
+        index = self._get_index(node)
+        if index.isValid():
+            is_expanded = self.control.isExpanded(index)
+
+        else:
+            is_expanded = False
+
+        return is_expanded
+
+    def is_selected(self, node):
+        """ Returns True if the node is selected, otherwise False. """
+
+        index = self._get_index(node)
+        if index.isValid():
+            is_selected = self.control.selectionModel().isSelected(index)
+
+        else:
+            is_selected = False
+
+        return is_selected
+
+    def refresh(self, node):
+        """ Refresh the tree starting from the specified node.
+
+        Call this when the structure of the content has changed DRAMATICALLY.
+
+        """
+
+        # The node's children (and theirs etc.) must be fetched again.
+        self._invalidate_children(node)
+
+        # Has the node actually appeared in the tree yet?
+        item = self._item_model.find(node)
+        if item is not None:
+            # Discard all of the node's children. They are fetched again if
+            # they are visible.
+            self._item_model.clear_children(item)
+
+            index = self._item_model.get_index(item)
+            if not index.isValid() or self.control.isExpanded(index):
+                self._item_model.fetch(item)
+
+            self._item_model.update_item(item)
+
+        return
+
+    def select(self, node):
+        """ Selects the specified node. """
+
+        index = self._get_index(node)
+        if index.isValid():
+            if self.selection_mode == 'single':
+                flags = QtGui.QItemSelectionModel.ClearAndSelect
+
+            else:
+                flags = QtGui.QItemSelectionModel.Select
+
+            self.control.selectionModel().select(index, flags)
+
+        return
+
+    def set_selection(self, list):
+        """ Selects the specified list of nodes. """
+        logger.debug('Setting selection to [%s] within Tree [%s]', list, self)
+
+        # Update the control to reflect the target list by unselecting
+        # everything and then selecting each item in the list.  During this
+        # process, we want to avoid changing our own selection.
+        self._ignore_selection_events = True
+        self.control.clearSelection()
+        for node in list:
+            try:
+                self.select(node)
+            except:
+                logger.exception('Unable to select node [%s]', node)
+
+        self._ignore_selection_events = False
+
+        # Update our selection to reflect the final selection state.
+        self.selection = self._get_selection()
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _get_index(self, node):
+        """ Returns the Qt model index for the specified node.
+
+        Returns an invalid index if the node has not yet appeared in the
+        tree.
+
+        """
+
+        item = self._item_model.find(node)
+        if item is None:
+            return QtCore.QModelIndex()
+
+        return self._item_model.get_index(item)
+
+    def _add_model_listeners(self, model):
+        """ Adds listeners for model changes. """
+
+        # Listen for changes to the model.
+        model.on_trait_change(self._on_root_changed, 'root')
+        model.on_trait_change(self._on_nodes_changed, 'nodes_changed')
+        model.on_trait_change(self._on_nodes_inserted, 'nodes_inserted')
+        model.on_trait_change(self._on_nodes_removed, 'nodes_removed')
+        model.on_trait_change(self._on_nodes_replaced, 'nodes_replaced')
+        model.on_trait_change(self._on_structure_changed, 'structure_changed')
+
+        return
+
+    def _remove_model_listeners(self, model):
+        """ Removes listeners for model changes. """
+
+        # Unhook the model event listeners.
+        model.on_trait_change(
+            self._on_root_changed, 'root', remove=True
+        )
+
+        model.on_trait_change(
+            self._on_nodes_changed, 'nodes_changed', remove=True
+        )
+
+        model.on_trait_change(
+            self._on_nodes_inserted, 'nodes_inserted', remove=True
+        )
+
+        model.on_trait_change(
+            self._on_nodes_removed, 'nodes_removed', remove=True
+        )
+
+        model.on_trait_change(
+            self._on_nodes_replaced, 'nodes_replaced', remove=True
+        )
+
+        model.on_trait_change(
+            self._on_structure_changed, 'structure_changed', remove=True
+        )
+
+        return
+
+    def _add_root_node(self, node):
+        """ Adds the root node. """
+
+        self._item_model.reset_root(node, self.show_root)
+
+        if node is not None:
+            # If the root node is hidden, get its children, otherwise
+            # automatically expand the root.
+            if self.show_root:
+                self.expand(node)
+
+            else:
+                self._item_model.fetch(self._item_model.find(node))
+
+        return
+
+    def _has_children(self, node):
+        """ Returns True if a node has children. """
+
+        # fixme: To be correct we *should* apply filtering here, but that
+        # seems to blow a hole throught models that have some efficient
+        # mechanism for determining whether or not they have children.
+        return self.model.has_children(node)
+
+    def _get_children(self, node):
+        """ Get the children of a node.
+
+        The filtered and sorted children are cached until the model reports a
+        change to them, or the tree's filters or sorter change.
+
+        """
+
+        key = self.model.get_key(node)
+
+        filtered_children = self._children_cache.get(key)
+        if filtered_children is None:
+            filtered_children = self._children_cache[key] = \
+                self._filter_and_sort_children(node)
+
+        return filtered_children[:]
+
+    def _filter_and_sort_children(self, node):
+        """ Get the filtered and sorted children of a node from the model. """
+
+        children = self.model.get_children(node)
+
+        # Filtering....
+        filtered_children = []
+        for child in children:
+            for filter in self.filters:
+                if not filter.select(self, node, child):
+                    break
+
+            else:
+                filtered_children.append(child)
+
+        # Sorting...
+        if self.sorter is not None:
+            self.sorter.sort(self, node, filtered_children)
+
+        return filtered_children
+
+    def _invalidate_children(self, node, recursive=True):
+        """ Discards the cached children of a node.
+
+        If 'recursive' is True then the cached children of its descendants
+        are discarded too.
+
+        """
+
+        children = self._children_cache.pop(self.model.get_key(node), None)
+        if recursive:
+            # The node's cached children may already have been discarded
+            # (e.g. when its children were changed) while those of its
+            # descendants were not, so the descendants that are in the tree
+            # are found from the item model rather than from the cache.
+            item = None
+            if self.control is not None:
+                item = self._item_model.find(node)
+                if item is not None:
+                    self._invalidate_item_children(item)
+
+            if children is not None:
+                for child in children:
+                    if item is None or self._item_model.find(child) is None:
+                        self._invalidate_children(child)
+
+        return
+
+    def _invalidate_item_children(self, item):
+        """ Discards the cached children of the descendants of an item. """
+
+        for child in item.children:
+            self._children_cache.pop(self.model.get_key(child.node), None)
+            self._invalidate_item_children(child)
+
+        return
+
+    def _get_icon(self, node, index):
+        """ Returns the icon for a node. """
+
+        expanded = self.control.isExpanded(index)
+        selected = self.control.selectionModel().isSelected(index)
+
+        # Get the image used to represent the node.
+        image = self.model.get_image(node, selected, expanded)
+        if image is None:
+            return None
+
+        # Every node of a type usually shares the same image, so its icon is
+        # only created once.
+        icon = self._icon_cache.get(image)
+        if icon is None:
+            icon = self._icon_cache[image] = image.create_icon()
+
+        return icon
+
+    def _get_text(self, node):
+        """ Returns the tree item text for a node. """
+
+        text = self.model.get_text(node)
+        if text is None:
+            text = ''
+
+        return text
+
+    def _set_label(self, node, label):
+        """ Sets the label of a node after an edit.
+
+        Returns True if the label was accepted.
+
+        """
+
+        # Making sure the new label is not an empty string
+        if label is not None and len(label) > 0 and \
+            self.model.can_set_text(node, label):
+            def end_label_edit():
+                """ Called to complete the label edit. """
+
+                # Set the node's text.
+                self.model.set_text(node, label)
+
+                # Make sure that the new text is displayed.
+                item = self._item_model.find(node)
+                if item is not None:
+                    self._item_model.update_item(item)
+
+                # If a label edit callback was specified (in the call to
+                # 'edit_label'), then call it).
+                if self._label_edit_callback is not None:
+                    self._label_edit_callback(self, node, label)
+
+                return
+
+            # We use a deferred call here, because a name change can trigger
+            # the structure of a node to change, and hence the actual tree
+            # items might get moved/deleted before the edit has completed.
+            GUI.invoke_later(end_label_edit)
+
+            accepted = True
+
+        else:
+            # If a label edit callback was specified (in the call to
+            # 'edit_label'), then call it).
+            if self._label_edit_callback is not None:
+                self._label_edit_callback(self, node, label)
+
+            accepted = False
+
+        return accepted
+
+    def _get_selection(self):
+        """ Returns a list of the selected nodes """
+
+        selection = []
+        for index in self.control.selectionModel().selectedRows():
+            node = index.internalPointer().node
+            selection.append(self.model.get_selection_value(node))
+
+        return selection
+
+    def _expand_item(self, item):
+        """ Recursively expand a tree item. """
+
+        index = self._item_model.get_index(item)
+        if index.isValid():
+            self.control.expand(index)
+
+        self._item_model.fetch_all(item)
+        for child in item.children:
+            self._expand_item(child)
+
+        return
+
+    def _get_node_at(self, pos):
+        """ Returns the node at a point in the view (or None). """
+
+        index = self.control.indexAt(pos)
+        if index.isValid():
+            node = index.internalPointer().node
+
+        else:
+            node = None
+
+        return node
+
+    #### Trait event handlers #################################################
+
+    def _filters_changed(self):
+        """ Called when the filters have been changed. """
+
+        self._children_cache = {}
+
+        return
+
+    def _filters_items_changed(self):
+        """ Called when filters have been added or removed. """
+
+        self._children_cache = {}
+
+        return
+
+    def _sorter_changed(self):
+        """ Called when the sorter has been changed. """
+
+        self._children_cache = {}
+
+        return
+
+    def _on_root_changed(self, root):
+        """ Called when the root of the model has changed. """
+
+        self._children_cache = {}
+
+        # Delete everything and then add the root item back in.
+        if self.control is not None:
+            self._add_root_node(root)
+
+        return
+
+    def _on_nodes_changed(self, event):
+        """ Called when nodes have been changed. """
+
+        # A change to a node may change whether it is filtered out, or where
+        # it is sorted.
+        if len(self.filters) > 0 or self.sorter is not None:
+            if len(event.children) > 0:
+                self._invalidate_children(event.node, recursive=False)
+
+            parent = self.get_parent(event.node)
+            if parent is not None:
+                self._invalidate_children(parent, recursive=False)
+
+        for node in [event.node] + list(event.children):
+            item = self._item_model.find(node)
+            if item is not None:
+                self._item_model.update_item(item)
+
+        return
+
+    def _on_nodes_inserted(self, event):
+        """ Called when nodes have been inserted. """
+
+        parent = event.node
+
+        # The parent's existing children are unchanged.
+        self._invalidate_children(parent, recursive=False)
+
+        # Has the node actually appeared in the tree yet?
+        item = self._item_model.find(parent)
+        if item is not None:
+            self._item_model.insert_children(item, event.children)
+
+            # If the node is not expanded then expand it.
+            if not self.is_expanded(parent):
+                self.expand(parent)
+
+        return
+
+    def _on_nodes_removed(self, event):
+        """ Called when nodes have been removed. """
+
+        parent = event.node
+
+        self._invalidate_children(parent, recursive=False)
+        for child in event.children:
+            self._invalidate_children(child)
+
+        # Has the node actually appeared in the tree yet?
+        item = self._item_model.find(parent)
+        if item is not None:
+            self._item_model.remove_children(item, event.children)
+
+        return
+
+    def _on_nodes_replaced(self, event):
+        """ Called when nodes have been replaced. """
+
+        self._invalidate_children(event.node, recursive=False)
+        for old_child in event.old_children:
+            self._invalidate_children(old_child)
+
+        for old_child, new_child in zip(event.old_children, event.children):
+            item = self._item_model.find(old_child)
+            if item is not None:
+                self._item_model.replace_node(item, new_child)
+
+        # Update the tree's selection (in case the old node that was replaced
+        # was selected, the selection should now include the new node).
+        self.selection = self._get_selection()
+
+        return
+
+    def _on_structure_changed(self, event):
+        """ Called when the structure of a node has changed drastically. """
+
+        self.refresh(event.node)
+
+        return
+
+    #### Qt event handlers ####################################################
+
+    def _on_collapsed(self, index):
+        """ Called when a tree item has been collapsed. """
+
+        item = index.internalPointer()
+
+        # Give the model a chance to veto the collapse.
+        if not self.model.is_collapsible(item.node):
+            self.control.expand(index)
+
+        else:
+            # Make sure that the item's 'closed' icon is displayed etc.
+            self._item_model.update_item(item)
+
+            # Trait event notification.
+            self.node_collapsed = item.node
+
+        return
+
+    def _on_context_menu(self, pos, global_pos):
+        """ Called when the context menu is requested on the tree. """
+
+        point = (global_pos.x(), global_pos.y())
+
+        # Did the right click occur on a tree item?
+        node = self._get_node_at(pos)
+        if node is not None:
+            # Trait event notification.
+            self.node_right_clicked = node, point
+
+        # Otherwise notify that the control itself was clicked
+        else:
+            self.control_right_clicked = point
+
+        return
+
+    def _on_double_click(self, pos):
+        """ Called when the tree is double clicked. """
+
+        node = self._get_node_at(pos)
+        if node is not None:
+            # Trait event notification.
+            self.node_activated = node
+
+        return
+
+    def _on_expanded(self, index):
+        """ Called when a tree item has been expanded. """
+
+        item = index.internalPointer()
+
+        # Give the model a chance to veto the expansion.
+        if not self.model.is_expandable(item.node):
+            self.control.collapse(index)
+
+        else:
+            # Make sure that the node's 'open' icon is displayed etc.
+            self._item_model.update_item(item)
+
+            # Trait event notification.
+            self.node_expanded = item.node
+
+        return
+
+    def _on_key_press(self, event):
+        """ Called when a key is pressed when the tree has focus. """
+
+        mods = event.modifiers()
+        self.key_pressed = KeyPressedEvent(
+            alt_down     = ((mods & QtCore.Qt.AltModifier) ==
+                            QtCore.Qt.AltModifier),
+            control_down = ((mods & QtCore.Qt.ControlModifier) ==
+                            QtCore.Qt.ControlModifier),
+            shift_down   = ((mods & QtCore.Qt.ShiftModifier) ==
+                            QtCore.Qt.ShiftModifier),
+            key_code     = event.key(),
+            event        = event
+        )
+
+        return
+
+    def _on_left_click(self, pos):
+        """ Called when the left mouse button is clicked on the tree. """
+
+        # Did the left click occur on a tree item?
+        node = self._get_node_at(pos)
+        if node is not None:
+            # Trait event notification.
+            self.node_left_clicked = node, (pos.x(), pos.y())
+
+        return
+
+    def _on_scrolled(self, value):
+        """ Called when the tree has been scrolled.
+
+        The view only fetches more top-level children by itself, so if the
+        last visible row is the last fetched child of any other node then the
+        next batch of that node's children is fetched.
+
+        """
+
+        viewport = self.control.viewport()
+        index = self.control.indexAt(QtCore.QPoint(0, viewport.height() - 1))
+        if not index.isValid():
+            return
+
+        item = index.internalPointer()
+        parent = item.parent
+        if item.row == len(parent.children) - 1:
+            parent_index = self._item_model.get_index(parent)
+            if self._item_model.canFetchMore(parent_index):
+                self._item_model.fetch(parent)
+
+        return
+
+    def _on_selection_changed(self, selected, deselected):
+        """ Called when the selection is changed. """
+
+        # Update our record of the selection to whatever was selected in the
+        # tree UNLESS we are ignoring selection events.
+        if not self._ignore_selection_events:
+
+            # Trait notification.
+            self.selection = self._get_selection()
+
+        return
+
+#### EOF ######################################################################
@@ -79,8 +79,10 @@ class SplitTabWidget(QtGui.QSplitter):
         return self._save_qsplitter(self)
 
     def _save_qsplitter(self, qsplitter):
-        # A splitter state is a tuple of the QSplitter state (as a string) and
-        # the list of child states.
+        # A splitter state is a tuple of the orientation (as a single
+        # character code), the list of child sizes and the list of child
+        # states.  (Older versions saved a tuple of the opaque QSplitter state
+        # and the list of child states instead.  These are still restored.)
         sp_ch_states = []
 
         # Save the children.
@@ -107,7 +109,12 @@ class SplitTabWidget(QtGui.QSplitter):
 
             sp_ch_states.append(ch_state)
 
-        return (QtGui.QSplitter.saveState(qsplitter).data(), sp_ch_states)
+        if qsplitter.orientation() == QtCore.Qt.Vertical:
+            orientation = 'v'
+        else:
+            orientation = 'h'
+
+        return (orientation, list(qsplitter.sizes()), sp_ch_states)
 
     def restoreState(self, state, factory):
         """ Restore the contents from the given state (returned by a previous
@@ -119,14 +126,29 @@ class SplitTabWidget(QtGui.QSplitter):
         # Ensure we are not restoring to a non-empty widget.
         assert self.count() == 0
 
-        self._restore_qsplitter(state, factory, self)
+        # Build the whole hierarchy of splitters and tab widgets off-screen
+        # (so that each page is only reparented once, into its tab widget) and
+        # then add it to this widget in one go with updates disabled.
+        builder = QtGui.QSplitter()
+
+        self.setUpdatesEnabled(False)
+        try:
+            self._restore_qsplitter(state, factory, builder)
+
+            while builder.count() > 0:
+                self.addWidget(builder.widget(0))
+
+            self._restore_sizes(self, state)
+        finally:
+            self.setUpdatesEnabled(True)
+            builder.deleteLater()
 
     def _restore_qsplitter(self, state, factory, qsplitter):
-        sp_qstate, sp_ch_states = state
+        sp_ch_states = state[-1]
 
         # Go through each child state which will consist of a tuple of two
-        # objects.  We use the type of the first to determine if the child is a
-        # tab widget or another splitter.
+        # objects (a tab widget) or of two or three objects (a splitter).  We
+        # use the type of the first to tell them apart.
         for ch_state in sp_ch_states:
             if isinstance(ch_state[0], int):
                 current_idx, tabs = ch_state
@@ -147,7 +169,7 @@ class SplitTabWidget(QtGui.QSplitter):
                     # Set the correct tab as the current one.
                     new_tab.setCurrentIndex(current_idx)
                 else:
-                    del new_tab
+                    new_tab.deleteLater()
             else:
                 new_qsp = QtGui.QSplitter()
 
@@ -158,11 +180,31 @@ class SplitTabWidget(QtGui.QSplitter):
                 if new_qsp.count() > 0:
                     qsplitter.addWidget(new_qsp)
                 else:
-                    del new_qsp
+                    new_qsp.deleteLater()
+
+        self._restore_sizes(qsplitter, state)
 
-        # Restore the QSplitter state (being careful to get the right
-        # implementation).
-        QtGui.QSplitter.restoreState(qsplitter, sp_qstate)
+    @staticmethod
+    def _restore_sizes(qsplitter, state):
+        """ Restore the orientation and sizes of a splitter from its state.
+        """
+
+        if len(state) == 3:
+            orientation, sizes, _ = state
+
+            if orientation == 'v':
+                qsplitter.setOrientation(QtCore.Qt.Vertical)
+            else:
+                qsplitter.setOrientation(QtCore.Qt.Horizontal)
+
+            # If some of the children couldn't be restored then let the
+            # splitter share out the space.
+            if len(sizes) == qsplitter.count():
+                qsplitter.setSizes(sizes)
+        else:
+            # Restore the QSplitter state (being careful to get the right
+            # implementation).
+            QtGui.QSplitter.restoreState(qsplitter, state[0])
 
     def addTab(self, w, text):
         """ Add a new tab to the main tab widget. """
@@ -0,0 +1,58 @@
+from __future__ import absolute_import
+
+from traits.testing.unittest_tools import unittest
+
+from pyface.qt import QtCore, QtGui
+from pyface.ui.qt4.util.gui_test_assistant import GuiTestAssistant
+from pyface.ui.qt4.workbench.split_tab_widget import SplitTabWidget
+
+
+class TestSplitTabWidget(GuiTestAssistant, unittest.TestCase):
+
+    def setUp(self):
+        GuiTestAssistant.setUp(self)
+        self.pages = {}
+
+    def _page(self, name):
+        page = QtGui.QWidget()
+        page.setObjectName(name)
+        self.pages[name] = page
+        return page
+
+    def test_save_restore(self):
+        widget = SplitTabWidget()
+        for name in ('a', 'b', 'c'):
+            widget.addTab(self._page(name), name.upper())
+        state = widget.saveState()
+
+        orientation, sizes, children = state
+        self.assertEqual(orientation, 'h')
+        self.assertEqual(len(sizes), 1)
+        self.assertEqual([name for name, title in children[0][1]],
+                         ['a', 'b', 'c'])
+
+        restored = SplitTabWidget()
+        restored.restoreState(state, lambda name: self._page(name))
+        self.assertEqual(restored.saveState()[2], children)
+
+    def test_restore_missing_page(self):
+        state = ('v', [100, 100], [(0, [(u'a', u'A')]),
+                                   (0, [(u'b', u'B')])])
+        widget = SplitTabWidget()
+        widget.restoreState(
+            state, lambda name: self._page(name) if name == 'a' else None)
+        self.assertEqual(widget.count(), 1)
+        self.assertEqual(widget.orientation(), QtCore.Qt.Vertical)
+
+    def test_restore_old_state(self):
+        splitter = QtGui.QSplitter(QtCore.Qt.Vertical)
+        state = (QtGui.QSplitter.saveState(splitter).data(),
+                 [(0, [(u'a', u'A')])])
+        widget = SplitTabWidget()
+        widget.restoreState(state, self._page)
+        self.assertEqual(widget.count(), 1)
+        self.assertEqual(widget.orientation(), QtCore.Qt.Vertical)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -75,6 +75,10 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
         return editor
 
     def activate_view(self, view):
+        # Create the control of a lazily added view.
+        if view.control is None and self.contains_view(view):
+            self._qt4_create_view_control(view)
+
         # FIXME v3: This probably doesn't work as expected.
         view.control.raise_()
         view.set_focus()
@@ -135,11 +139,16 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
 
         self._qt4_editor_area.clear()
 
-        # Delete all dock widgets.
+        # Delete all dock widgets (including any kept for reuse).
         for v in self.window.views:
             if self.contains_view(v):
                 self._qt4_delete_view_dock_widget(v)
 
+            dw = getattr(v, '_qt4_parked_dock', None)
+            if dw is not None:
+                delattr(v, '_qt4_parked_dock')
+                dw.deleteLater()
+
     def create_initial_layout(self, parent):
         self._qt4_editor_area = editor_area = SplitTabWidget(parent)
 
@@ -215,6 +224,10 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
         # Now we know the structure of the memento we can "parse" it.
         view_ids, state = mdata
 
+        # In lazy mode the view controls are only created for the dock
+        # widgets that end up visible.
+        lazy = self.window.lazy_views
+
         # Get a list of all views that have dock widgets and mark them.
         dock_views = [v for v in self.window.views if self.contains_view(v)]
 
@@ -232,7 +245,8 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
                     # invisible so that it matches the state of the visible
                     # trait.  Things will all come right when the main window
                     # state is restored below.
-                    self._qt4_create_view_dock_widget(v).setVisible(False)
+                    self._qt4_create_view_dock_widget(
+                        v, lazy=lazy).setVisible(False)
 
                     if v in dock_views:
                         delattr(v, '_qt4_gone')
@@ -246,12 +260,23 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
             except AttributeError:
                 pass
             else:
-                self._qt4_delete_view_dock_widget(v)
+                # In lazy mode keep the dock widget (and the view control)
+                # for when the view is next used.
+                self._qt4_delete_view_dock_widget(v, park=lazy)
 
         # Restore the state.  This will update the view's visible trait through
         # the dock window's toggle action.
         self.window.control.restoreState(state)
 
+        # Create the controls of the lazily added views that are now visible.
+        # (If the main window isn't visible yet then this happens when the
+        # dock widgets are first shown.)
+        if lazy:
+            for v in self.window.views:
+                if v.control is None and self.contains_view(v) and \
+                        v._qt4_dock.isVisible():
+                    self._qt4_create_view_control(v)
+
     def get_editor_memento(self):
         # Get the layout of the editors.
         editor_layout = self._qt4_editor_area.saveState()
@@ -449,7 +474,6 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
         if position is None:
             position = view.position
 
-        dw = self._qt4_create_view_dock_widget(view, size)
         mw = self.window.control
 
         try:
@@ -457,6 +481,13 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
         except AttributeError:
             rel_dw = None
 
+        # In lazy mode a view added to a tab group (where it is hidden behind
+        # the existing view) doesn't get a control until it is first shown.
+        lazy = self.window.lazy_views and position == 'with' and \
+                rel_dw is not None
+
+        dw = self._qt4_create_view_dock_widget(view, size, lazy)
+
         if rel_dw is None:
             # If we are trying to add a view with a non-existent item, then
             # just default to the left of the editor area.
@@ -492,13 +523,23 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
                 mw.splitDockWidget(dw, rel_dw, orient)
                 rel_dw.show()
 
-    def _qt4_create_view_dock_widget(self, view, size=(-1, -1)):
-        """ Create a dock widget that wraps a view. """
+    def _qt4_create_view_dock_widget(self, view, size=(-1, -1), lazy=False):
+        """ Create a dock widget that wraps a view.  If 'lazy' is set then the
+        view control isn't created until the dock widget is first shown.
+        """
 
         # See if it has already been created.
         try:
             dw = view._qt4_dock
         except AttributeError:
+            # See if one was kept for reuse.
+            dw = getattr(view, '_qt4_parked_dock', None)
+
+            if dw is not None:
+                delattr(view, '_qt4_parked_dock')
+                view._qt4_dock = dw
+
+        if dw is None:
             dw = QtGui.QDockWidget(view.name, self.window.control)
             dw.setWidget(_ViewContainer(size, self.window.control))
             dw.setObjectName(view.id)
@@ -515,36 +556,55 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
 
             view.on_trait_change(on_name_changed, 'name')
 
-        # Make sure the view control exists.
+        # Make sure the view control exists (unless it is being created
+        # lazily).
         if view.control is None:
-            # Make sure that the view knows which window it is in.
-            view.window = self.window
+            if not lazy:
+                self._qt4_create_view_control(view)
 
-            try:
-                view.control = view.create_control(dw.widget())
-            except:
-                # Tidy up if the view couldn't be created.
-                delattr(view, '_qt4_dock')
-                self.window.control.removeDockWidget(dw)
-                dw.deleteLater()
-                del dw
-                raise
-
-        dw.widget().setCentralWidget(view.control)
+        else:
+            dw.widget().setCentralWidget(view.control)
 
         return dw
 
-    def _qt4_delete_view_dock_widget(self, view):
-        """ Delete a view's dock widget. """
+    def _qt4_create_view_control(self, view):
+        """ Create the control of a view that has a dock widget. """
 
         dw = view._qt4_dock
 
+        # Make sure that the view knows which window it is in.
+        view.window = self.window
+
+        try:
+            view.control = view.create_control(dw.widget())
+        except:
+            # Tidy up if the view couldn't be created.
+            delattr(view, '_qt4_dock')
+            self.window.control.removeDockWidget(dw)
+            dw.deleteLater()
+            del dw
+            raise
+
+        dw.widget().setCentralWidget(view.control)
+
+    def _qt4_delete_view_dock_widget(self, view, park=False):
+        """ Delete a view's dock widget.  If 'park' is set then the dock
+        widget and the view control are removed from the main window but kept
+        so that they can be reused.
+        """
+
+        dw = view._qt4_dock
+        delattr(view, '_qt4_dock')
+
+        if park:
+            view._qt4_parked_dock = dw
+            self.window.control.removeDockWidget(dw)
+            return
+
         # Disassociate the view from the dock.
         if view.control is not None:
             view.control.setParent(None)
 
-        delattr(view, '_qt4_dock')
-
         # Delete the dock (and the view container).
         self.window.control.removeDockWidget(dw)
         dw.deleteLater()
@@ -566,6 +626,14 @@ class WorkbenchWindowLayout(MWorkbenchWindowLayout):
                 # the view
                 v.visible = checked
 
+            # Create the control of a lazily added view when it is first shown.
+            if checked and v.control is None and (sender is dw or
+                    sender is dw.toggleViewAction()):
+                try:
+                    self._qt4_create_view_control(v)
+                except Exception:
+                    logger.exception('error creating view control [%s]', v.id)
+
     def _qt4_monitor(self, control):
         """ Install an event filter for a view or editor control to keep an eye
         on certain events.
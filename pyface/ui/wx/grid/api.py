@@ -14,7 +14,7 @@
 from __future__ import absolute_import
 
 from .grid import Grid
-from .grid_model import GridModel, GridSortEvent
+from .grid_model import GridModel, GridRowChangeEvent, GridSortEvent
 from .composite_grid_model import CompositeGridModel
 from .inverted_grid_model import InvertedGridModel
 from .simple_grid_model import SimpleGridModel, GridRow, GridColumn
@@ -22,4 +22,10 @@ from .trait_grid_model import TraitGridModel, TraitGridColumn, \
      TraitGridSelection
 from .grid_cell_renderer import GridCellRenderer
 
+# The array model needs NumPy, which is optional.
+try:
+    from .array_grid_model import ArrayGridModel
+except ImportError:
+    pass
+
 #### EOF ######################################################################
@@ -0,0 +1,421 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2005, Enthought, Inc.
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in enthought/LICENSE.txt and may be redistributed only
+# under the conditions described in the aforementioned license.  The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+# Thanks for using Enthought open source!
+#
+# Author: Enthought, Inc.
+# Description: <Enthought pyface package component>
+#------------------------------------------------------------------------------
+""" An ArrayGridModel displays a NumPy array in a grid. The array can either
+be 2-dimensional (in which case each column of the array is a column of the
+grid) or a 1-dimensional structured/record array (in which case each field is
+a column of the grid). The array is never copied: sorting only reorders an
+index array, and editing a cell changes the array in place. """
+
+# Standard library imports
+from collections import OrderedDict
+
+# Major package imports
+import numpy
+
+# Enthought library imports
+from traits.api import Any, Bool, Instance, Int, List, Str, Trait
+
+# local imports
+from .grid_model import GridColumn, GridModel, GridSortEvent
+
+# The default format for each kind of array element.
+DEFAULT_FORMATS = {
+    'b' : '%s',
+    'i' : '%d',
+    'u' : '%d',
+    'f' : '%g',
+}
+
+class ArrayGridModel(GridModel):
+    """ An ArrayGridModel displays a NumPy array in a grid. The array can
+    either be 2-dimensional (in which case each column of the array is a
+    column of the grid) or a 1-dimensional structured/record array (in which
+    case each field is a column of the grid).
+
+    Cell text is formatted a block of rows at a time with a single vectorized
+    operation per column, and the most recently used blocks are cached, so
+    scrolling through a large array only formats the rows that are actually
+    displayed. """
+
+    # The array containing the grid data.
+    data = Any
+
+    # The columns in the model (by default the labels are the field names of
+    # a structured array, or the column index plus 1).
+    columns = Trait(None, None, List(GridColumn))
+
+    # The '%' style format for each column. If there is no format for a
+    # column then one is chosen based on the type of its elements.
+    formats = List(Str)
+
+    # Can the array be edited from the grid? (An array that is not writeable
+    # is always read-only).
+    read_only = Bool(False)
+
+    # Do we allow sorts by column?
+    allow_column_sort = Bool(True)
+
+    # The number of rows whose text is formatted at once.
+    block_size = Int(256)
+
+    # The maximum number of formatted blocks (per column) that are cached.
+    cache_size = Int(64)
+
+    #### Private interface ####################################################
+
+    # The indices of the array rows in display order (None if the array is
+    # not sorted).
+    _order = Any
+
+    # The formatted blocks, keyed by (block index, column index) and kept in
+    # least recently used order.
+    _text_cache = Instance(OrderedDict, ())
+
+    #########################################################################
+    # 'object' interface.
+    #########################################################################
+    def __init__(self, **traits):
+        """ Create an ArrayGridModel object. """
+
+        # Base class constructor
+        super(ArrayGridModel, self).__init__(**traits)
+
+        return
+
+    #########################################################################
+    # 'GridModel' interface.
+    #########################################################################
+
+    def get_column_count(self):
+        """ Return the number of columns for this table. """
+
+        if self.data is None:
+            count = 0
+        elif self.data.dtype.names is not None:
+            count = len(self.data.dtype.names)
+        elif self.data.ndim == 1:
+            count = 1
+        else:
+            count = self.data.shape[1]
+
+        return count
+
+    def get_column_name(self, index):
+        """ Return the name of the column specified by the
+        (zero-based) index. """
+
+        if self.columns is not None:
+            # if we have an explicit declaration then use it
+            try:
+                name = self.columns[index].label
+            except IndexError:
+                name = ''
+        elif self.data.dtype.names is not None:
+            name = self.data.dtype.names[index]
+        else:
+            name = str(index + 1)
+
+        return name
+
+    def get_cols_drag_value(self, cols):
+        """ Return the value to use when the specified columns are dragged or
+        copied and pasted. cols is a list of column indexes. """
+
+        if len(cols) == 1:
+            value = self.__get_data_column(cols[0])
+        else:
+            value = [self.__get_data_column(col) for col in cols]
+
+        return value
+
+    def sort_by_column(self, col, reverse=False):
+        """ Sort model data by the column indexed by col. The reverse flag
+        indicates that the sort should be done in reverse. """
+
+        if not self.allow_column_sort or col >= self.get_column_count():
+            return
+
+        column = self._get_column(col)
+        if reverse:
+            # a stable descending sort is the reverse of a stable ascending
+            # sort of the reversed values
+            order = numpy.argsort(column[::-1], kind='mergesort')
+            order = (len(column) - 1 - order)[::-1]
+        else:
+            order = numpy.argsort(column, kind='mergesort')
+
+        self._order = order
+        self._text_cache.clear()
+
+        # now fire an event to tell the grid we're sorted
+        self.column_sorted = GridSortEvent(index = col, reversed = reverse)
+
+        return
+
+    def no_column_sort(self):
+        """ Turn off any column sorting of the model data. """
+
+        self._order = None
+        self._text_cache.clear()
+
+        return
+
+    def is_column_read_only(self, index):
+        """ Return True if the column specified by the zero-based index
+        is read-only. """
+
+        if self.read_only or not self.data.flags.writeable:
+            return True
+
+        read_only = False
+        if self.columns is not None:
+            try:
+                read_only = self.columns[index].read_only
+            except IndexError:
+                pass
+
+        return read_only
+
+    def get_row_count(self):
+        """ Return the number of rows for this table. """
+
+        if self.data is None:
+            return 0
+
+        return len(self.data)
+
+    def get_row_name(self, index):
+        """ Return the name of the row specified by the
+        (zero-based) index. """
+
+        # the name is the position of the row in the array, so that it stays
+        # with the row when the array is sorted
+        return str(self._get_array_row(index) + 1)
+
+    def get_rows_drag_value(self, rows):
+        """ Return the value to use when the specified rows are dragged or
+        copied and pasted. rows is a list of row indexes. """
+
+        if len(rows) == 1:
+            value = self.__get_data_row(rows[0])
+        else:
+            value = [self.__get_data_row(row) for row in rows]
+
+        return value
+
+    def get_value(self, row, col):
+        """ Return the text displayed in the table at (row, col). """
+
+        if row >= self.get_row_count() or col >= self.get_column_count():
+            return ''
+
+        block, offset = divmod(row, self.block_size)
+
+        return self._get_text_block(block, col)[offset]
+
+    def is_cell_empty(self, row, col):
+        """ Returns True if the cell at (row, col) has a None value,
+        False otherwise."""
+
+        return row >= self.get_row_count() or col >= self.get_column_count()
+
+    def get_cell_drag_value(self, row, col):
+        """ Return the value to use when the specified cell is dragged or
+        copied and pasted. """
+
+        return self._get_column(col)[self._get_array_row(row)].tolist()
+
+    def get_cell_selection_value(self, row, col):
+        """ Return the value stored in the table at (row, col). """
+
+        return self.get_cell_drag_value(row, col)
+
+    def get_rows_selection_value(self, rows):
+        """ Return the value to use when the specified rows are selected. """
+
+        return [self.__get_data_row(row) for row in rows]
+
+    def get_cols_selection_value(self, cols):
+        """ Return the value to use when the specified cols are selected. """
+
+        return [self.__get_data_column(col) for col in cols]
+
+    def is_valid_cell_value(self, row, col, value):
+        """ Tests whether value is valid for the cell at row, col. Returns
+            True if value is acceptable, False otherwise. """
+
+        try:
+            numpy.asarray(value).astype(self._get_column(col).dtype)
+        except (TypeError, ValueError):
+            return False
+
+        return True
+
+    def is_cell_read_only(self, row, col):
+        """ Returns True if the cell at (row, col) is not editable,
+        False otherwise. """
+
+        return self.is_column_read_only(col)
+
+    def has_uniform_column_style(self, col):
+        """ Return True if every cell in the column indexed by col has the
+        same renderer, read-only state, colors, font and alignment. """
+
+        # the style of a cell only depends on the type of its column
+        return True
+
+    def get_cell_halignment(self, row, col):
+        """ Return a string specifying what the horizontal alignment
+            of the specified cell should be. """
+
+        if self._get_column(col).dtype.kind in 'iuf':
+            return 'right'
+
+        return None
+
+    #########################################################################
+    # protected 'GridModel' interface.
+    #########################################################################
+    def _set_value(self, row, col, value):
+        """ Sets the value of the cell at (row, col) to value.
+
+        Raises a ValueError if the value is vetoed or the cell at
+        (row, col) does not exist. """
+
+        if self.is_column_read_only(col):
+            raise ValueError('column %d is read-only' % col)
+
+        # the array is edited in place (the grid text is refreshed when the
+        # content changed event is fired)
+        self._get_column(col)[self._get_array_row(row)] = value
+
+        return 0
+
+    ###########################################################################
+    # protected interface.
+    ###########################################################################
+
+    def _get_array_row(self, row):
+        """ Return the index in the array of the row displayed at row. """
+
+        if self._order is None:
+            return row
+
+        return int(self._order[row])
+
+    def _get_column(self, col):
+        """ Return a view of the column indexed by col. """
+
+        if self.data.dtype.names is not None:
+            return self.data[self.data.dtype.names[col]]
+        elif self.data.ndim == 1:
+            return self.data
+
+        return self.data[:, col]
+
+    def _get_format(self, col, column):
+        """ Return the format for the column indexed by col. """
+
+        if col < len(self.formats) and len(self.formats[col]) > 0:
+            return self.formats[col]
+
+        return DEFAULT_FORMATS.get(column.dtype.kind, '%s')
+
+    def _get_text_block(self, block, col):
+        """ Return the formatted text of a block of rows in a column. """
+
+        key = (block, col)
+        text = self._text_cache.pop(key, None)
+        if text is None:
+            column = self._get_column(col)
+
+            # only the rows in the block are read from the array
+            start = block * self.block_size
+            stop = min(start + self.block_size, len(column))
+            if self._order is None:
+                values = column[start:stop]
+            else:
+                values = column[self._order[start:stop]]
+
+            text = numpy.char.mod(self._get_format(col, values), values)
+            text = text.tolist()
+
+            while len(self._text_cache) >= self.cache_size * \
+                      max(self.get_column_count(), 1):
+                self._text_cache.popitem(last=False)
+
+        self._text_cache[key] = text
+
+        return text
+
+    ###########################################################################
+    # trait handlers.
+    ###########################################################################
+
+    def _data_changed(self):
+        """ Called when the array is replaced. """
+
+        self._order = None
+        self._text_cache.clear()
+
+        self.fire_structure_changed()
+
+        return
+
+    def _formats_changed(self):
+        """ Called when the column formats are changed. """
+
+        self._text_cache.clear()
+        self.fire_content_changed()
+
+        return
+
+    def _formats_items_changed(self):
+        """ Called when the column formats are changed. """
+
+        self._formats_changed()
+
+        return
+
+    def _content_changed_fired(self):
+        """ Called when the content of the array has changed. """
+
+        # the array may have been changed in place, so the text of any row
+        # may be stale
+        self._text_cache.clear()
+
+        return
+
+    ###########################################################################
+    # private interface.
+    ###########################################################################
+
+    def __get_data_column(self, col):
+        """ Return a 1-d list of data from the column indexed by col. """
+
+        column = self._get_column(col)
+        if self._order is not None:
+            column = column[self._order]
+
+        return column.tolist()
+
+    def __get_data_row(self, row):
+        """ Return a 1-d list of data from the row indexed by row. """
+
+        index = self._get_array_row(row)
+
+        return [self._get_column(col)[index].tolist()
+                for col in range(self.get_column_count())]
+
+#### EOF ####################################################################
@@ -13,13 +13,17 @@
 #------------------------------------------------------------------------------
 """ A grid control with a model/ui architecture. """
 
+# Standard library imports
+from collections import OrderedDict
+
 # Major package imports
 import sys
 import wx
 import wx.lib.gridmovers as grid_movers
 from os.path import abspath, exists
 from wx.grid import Grid as wxGrid
-from wx.grid import GridCellAttr, GridCellBoolRenderer, PyGridTableBase
+from wx.grid import GridCellAttr, GridCellBoolRenderer, GridCellCoords, \
+     PyGridTableBase
 from wx.grid import GridTableMessage, \
      GRIDTABLE_NOTIFY_ROWS_APPENDED, GRIDTABLE_NOTIFY_ROWS_DELETED,  \
      GRIDTABLE_NOTIFY_ROWS_INSERTED, GRIDTABLE_NOTIFY_COLS_APPENDED, \
@@ -30,7 +34,7 @@ from wx import TheClipboard
 # Enthought library imports
 from pyface.api import Sorter, Widget
 from pyface.timer.api import do_later
-from traits.api import Bool, Color, Enum, Event, Font, Instance, Int, \
+from traits.api import Any, Bool, Color, Enum, Event, Font, Instance, Int, \
      List, Trait, Undefined
 from pyface.wx.drag_and_drop import PythonDropSource, \
      PythonDropTarget, PythonObject
@@ -46,6 +50,10 @@ is_win32 = (sys.platform == 'win32')
 
 ASCII_C = 67
 
+# The space (in pixels) left around the text of a cell when auto-sizing.
+AUTOSIZE_COLUMN_MARGIN = 10
+AUTOSIZE_ROW_MARGIN    = 6
+
 class Grid(Widget):
     """ A grid control with a model/ui architecture. """
 
@@ -116,9 +124,16 @@ class Grid(Widget):
     # auto-size columns and rows?
     autosize = Bool(False)
 
+    # The maximum number of rows (in addition to the visible ones) whose cells
+    # are measured when auto-sizing.
+    autosize_sample_size = Int(200)
+
     # Allow single-click access to cell-editors?
     edit_on_first_click = Bool(True)
 
+    # The maximum number of cells whose attributes and editors are cached.
+    attr_cache_size = Int(2048)
+
     #### Events ####
 
     # A cell has been activated (ie. double-clicked).
@@ -145,6 +160,13 @@ class Grid(Widget):
     _x_clicked = Int
     _y_clicked = Int
 
+    # The widest text in each column amongst the rows measured when
+    # auto-sizing (None if the columns need to be measured again):
+    _autosize_widths = Any
+
+    # The number of rows in the grid when the columns were last auto-sized:
+    _autosize_row_count = Int
+
     ###########################################################################
     # 'object' interface.
     ###########################################################################
@@ -214,6 +236,7 @@ class Grid(Widget):
         otc   = self.on_trait_change
         smotc(self._on_model_content_changed, 'content_changed')
         smotc(self._on_model_structure_changed, 'structure_changed')
+        smotc(self._on_model_row_changed, 'row_changed')
         smotc(self._on_row_sort, 'row_sorted')
         smotc(self._on_column_sort, 'column_sorted')
         otc(self._on_new_model, 'model')
@@ -233,6 +256,8 @@ class Grid(Widget):
         otc(self._on_default_cell_font_changed, 'default_cell_font')
         otc(self._on_default_cell_text_color_changed, 'default_cell_text_color')
         otc(self._on_default_cell_bg_color_changed, 'default_cell_bg_color')
+        otc(self._on_default_cell_read_only_color_changed,
+            'default_cell_read_only_color')
         otc(self._on_read_only_changed, 'read_only_changed')
         otc(self._on_selection_mode_changed, 'selection_mode')
         otc(self._on_column_label_height_changed, 'column_label_height')
@@ -347,6 +372,8 @@ class Grid(Widget):
             remove = True)
         otc(self._on_default_cell_bg_color_changed, 'default_cell_bg_color',
             remove = True)
+        otc(self._on_default_cell_read_only_color_changed,
+            'default_cell_read_only_color', remove = True)
         otc(self._on_read_only_changed, 'read_only_changed',
             remove = True)
         otc(self._on_selection_mode_changed, 'selection_mode',
@@ -375,6 +402,7 @@ class Grid(Widget):
         """ When we get a new model reinitialize grid match to that model. """
 
         self._grid_table_base.model = self.model
+        self._grid_table_base._clear_cache()
 
         self.__initialize_counts(self.model)
 
@@ -383,20 +411,67 @@ class Grid(Widget):
         if self.autosize:
             # Note that we don't call AutoSize() here, because autosizing
             # the rows looks like crap.
-            self._grid.AutoSizeColumns(False)
+            self._autosize_widths = None
+            self.__autosize_columns()
 
         return
 
     def _on_model_content_changed(self):
         """ A notification method called when the data in the underlying
             model changes. """
+        # The style of any cell may depend on the data:
+        self._grid_table_base._clear_attr_cache()
         self._grid.ForceRefresh()
 
-    def _on_model_structure_changed(self, *arg, **kw):
+    def _on_model_row_changed(self, evt):
+        """ A notification method called when values in a row of the
+            underlying model change. Only the affected cells are redrawn,
+            and only if they are visible. """
+
+        grid = self._grid
+        row  = evt.index
+        if (row < 0) or (row >= grid.GetNumberRows()):
+            return
+
+        # The style of the changed cells may depend on their values (even
+        # if they are not visible at the moment):
+        self._grid_table_base._clear_attr_cache(row, evt.column)
+
+        if evt.column < 0:
+            left, right = 0, grid.GetNumberCols() - 1
+        else:
+            left = right = evt.column
+
+        if right < 0:
+            return
+
+        # The device rectangle only covers the visible part of the cells:
+        rect = grid.BlockToDeviceRect(GridCellCoords(row, left),
+                                      GridCellCoords(row, right))
+        window = grid.GetGridWindow()
+        rect   = rect.Intersect(window.GetClientRect())
+        if rect.IsEmpty():
+            return
+
+        window.RefreshRect(rect, False)
+
+        # Any value in the row may have changed, including its label:
+        if evt.column < 0:
+            label_window = grid.GetGridRowLabelWindow()
+            label_window.RefreshRect(wx.Rect(0, rect.y,
+                                     label_window.GetClientSize().width,
+                                     rect.height), False)
+
+    def _on_model_structure_changed(self, new='changed'):
         """ A notification method called when the underlying model has
         changed. Responsible for making sure the view object updates
         correctly. """
 
+        # Unless rows were only appended, any row may have changed, so the
+        # cached widths used when auto-sizing are no longer valid:
+        if new != 'appended':
+            self._autosize_widths = None
+
         # Disable any active editors in order to prevent a wx crash bug:
         self._edit = False
         grid       = self._grid
@@ -567,6 +642,13 @@ class Grid(Widget):
             self._grid.SetDefaultCellBackgroundColour(color)
             self._grid.ForceRefresh()
 
+    def _on_default_cell_read_only_color_changed(self):
+        """ Handle a change to the default_cell_read_only_color trait. """
+
+        # The color is part of the cached attributes of read-only cells:
+        self._grid_table_base._clear_attr_cache()
+        self._grid.ForceRefresh()
+
     def _on_read_only_changed(self):
         """ Handle a change to the read_only trait. """
 
@@ -1382,8 +1464,8 @@ class Grid(Widget):
         model = self.model
         grid  = self._grid
         if grid is not None and self.autosize:
-            grid.AutoSizeColumns(False)
-            grid.AutoSizeRows(False)
+            heights = self.__autosize_columns()
+            self.__autosize_rows(heights)
 
         # Whenever we size the grid we need to take in to account any
         # explicitly set column sizes:
@@ -1445,6 +1527,98 @@ class Grid(Widget):
         grid.EndBatch()
         grid.ForceRefresh()
 
+    def __autosize_columns(self):
+        """ Size the columns to fit their labels and contents.
+
+            Measuring every cell (as wx does) is far too slow for large
+            models, so only the visible rows and a bounded sample of the
+            others are measured. The measured widths are cached, so when rows
+            are added only the new rows need to be sampled.
+
+            Returns the heights of the text in the measured rows, keyed by
+            row. """
+
+        grid = self._grid
+        rows = grid.GetNumberRows()
+        cols = grid.GetNumberCols()
+
+        widths   = self._autosize_widths
+        measured = self._autosize_row_count
+        if (widths is None) or (len( widths ) != cols) or (measured > rows):
+            widths, measured = [ 0 ] * cols, 0
+
+        sample = set( self.__sample_rows( measured, rows ) )
+        sample.update( self.__visible_rows() )
+
+        dc      = wx.ClientDC( grid.GetGridWindow() )
+        heights = dict( ( row, 0 ) for row in sample )
+        for col in xrange( cols ):
+            for row in sample:
+                dc.SetFont( grid.GetCellFont( row, col ) )
+                w, h = dc.GetMultiLineTextExtent(
+                                   grid.GetCellValue( row, col ) )[:2]
+                widths[col]  = max( widths[col], w )
+                heights[row] = max( heights[row], h )
+
+            dc.SetFont( grid.GetLabelFont() )
+            label = dc.GetMultiLineTextExtent( grid.GetColLabelValue( col ) )
+            width = max( widths[col], label[0] )
+            if width == 0:
+                width = grid.GetDefaultColSize()
+            else:
+                width += AUTOSIZE_COLUMN_MARGIN
+
+            grid.SetColSize( col, max( width,
+                                       grid.GetColMinimalAcceptableWidth() ) )
+
+        self._autosize_widths    = widths
+        self._autosize_row_count = rows
+
+        return heights
+
+    def __autosize_rows(self, heights):
+        """ Size the rows to fit their contents. """
+
+        grid = self._grid
+        if grid.GetNumberRows() <= self.autosize_sample_size:
+            grid.AutoSizeRows(False)
+
+        elif len( heights ) > 0:
+            # Sizing each row to fit is far too slow for large models, so
+            # every row gets the height needed by the measured rows:
+            height = max( heights.values() )
+            if height > 0:
+                height = max( height + AUTOSIZE_ROW_MARGIN,
+                              grid.GetRowMinimalAcceptableHeight() )
+                grid.SetDefaultRowSize( height, True )
+
+    def __sample_rows(self, start, stop):
+        """ Returns at most 'autosize_sample_size' rows evenly spread over
+            the range start to stop. """
+
+        n    = stop - start
+        size = self.autosize_sample_size
+        if n <= size:
+            return range( start, stop )
+
+        return [ start + ((i * n) // size) for i in xrange( size ) ]
+
+    def __visible_rows(self):
+        """ Returns the rows that are currently visible. """
+
+        grid   = self._grid
+        y      = grid.CalcUnscrolledPosition( 0, 0 )[1]
+        height = grid.GetGridWindow().GetClientSize().height
+        top    = grid.YToRow( y )
+        if top < 0:
+            return []
+
+        bottom = grid.YToRow( y + height )
+        if bottom < 0:
+            bottom = grid.GetNumberRows() - 1
+
+        return range( top, bottom + 1 )
+
     def __resolve_grid_coords(self, x, y):
         """ Resolve the specified x and y coordinates into row/col
             coordinates. Returns row, col. """
@@ -1514,20 +1688,24 @@ class _GridTableBase(PyGridTableBase):
         self._row_count = -1
         self._col_count = -1
 
-        # caches for editors and renderers
-        self._editor_cache   = {}
-        self._renderer_cache = {}
+        # The cached attrs and editors of the most recently used cells,
+        # keyed by (row, col) in least recently used order:
+        self._cell_cache = OrderedDict()
+
+        # The cached styles shared by whole columns or rows, keyed by
+        # (None, col) or (row, None):
+        self._style_cache = OrderedDict()
 
     def dispose(self):
 
         # Make sure dispose gets called on all traits editors:
-        for editor in self._editor_cache.values():
-            editor.dispose()
-        self._editor_cache = {}
-
-        for renderer in self._renderer_cache.values():
-            renderer.dispose()
-        self._renderer_cache = {}
+        for attr, editor in self._cell_cache.values():
+            if attr is not None:
+                attr.DecRef()
+            if editor is not None:
+                editor.dispose()
+        self._cell_cache  = OrderedDict()
+        self._style_cache = OrderedDict()
 
     ###########################################################################
     # 'wxPyGridTableBase' interface.
@@ -1665,25 +1843,129 @@ class _GridTableBase(PyGridTableBase):
     def GetAttr(self, row, col, kind):
         """ Retrieve the cell attribute object for the specified cell. """
 
-        result = GridCellAttr()
         # we only handle cell requests, for other delegate to the supa
         if kind != GridCellAttr.Cell and kind != GridCellAttr.Any:
-            return result
+            return GridCellAttr()
 
         rows = self.model.get_row_count()
         cols = self.model.get_column_count()
+        if (row >= rows) or (col >= cols):
+            return self._create_dummy_attr()
 
-        # First look in the cache for the editor:
-        editor = self._editor_cache.get((row, col))
-        if editor is None:
-            if (row >= rows) or (col >= cols):
-                editor = DummyGridCellEditor()
-            else:
-                # Ask the underlying model for an editor for this cell:
-                editor = self.model.get_cell_editor(row, col)
-                if editor is not None:
-                    self._editor_cache[(row, col)] = editor
-                    editor._grid_info = (self._grid._grid, row, col)
+        # Look in the cache first (the entry for a cell is a list of the form
+        # [attr, editor], where the attr is None if it must be recreated):
+        key   = (row, col)
+        entry = self._cell_cache.pop(key, None)
+        if entry is None:
+            entry = [None, self._create_editor(row, col)]
+
+        if entry[0] is None:
+            entry[0] = self._create_attr(row, col, entry[1])
+
+        # Mark the cell as the most recently used:
+        self._cell_cache[key] = entry
+        if len(self._cell_cache) > self._grid.attr_cache_size:
+            self._trim_cell_cache()
+
+        # Note: The grid releases its reference to the attr when it has
+        #       finished with it, so we have to add one to keep ours:
+        result = entry[0]
+        result.IncRef()
+
+        return result
+
+    ###########################################################################
+    # private interface.
+    ###########################################################################
+    def _clear_cache(self):
+        """ Clean out the editor/renderer cache. """
+
+        # Dispose of the editors in the cache after a brief delay, so as
+        # to allow completion of the current event:
+        editors = []
+        for attr, editor in self._cell_cache.values():
+            if attr is not None:
+                attr.DecRef()
+            if editor is not None:
+                editors.append(editor)
+
+        do_later( self._editor_dispose, editors )
+
+        self._cell_cache  = OrderedDict()
+        self._style_cache = OrderedDict()
+        return
+
+    def _clear_attr_cache(self, row=-1, col=-1):
+        """ Discard the cached attributes (but not the editors) of a cell.
+
+            If col is -1 then the attributes of every cell in the row are
+            discarded, and if row is -1 then those of every cell are. """
+
+        if row < 0:
+            keys = self._cell_cache.keys()
+            self._style_cache = OrderedDict()
+        elif col < 0:
+            keys = [key for key in self._cell_cache if key[0] == row]
+            self._style_cache.pop((row, None), None)
+        else:
+            keys = [(row, col)]
+
+        for key in keys:
+            entry = self._cell_cache.get(key)
+            if entry is not None and entry[0] is not None:
+                entry[0].DecRef()
+                entry[0] = None
+
+        return
+
+    def _trim_cell_cache(self):
+        """ Discard the least recently used cells from the cache. """
+
+        # The editor of a cell that is being edited must not be disposed of:
+        grid    = self._grid._grid
+        editing = None
+        if grid.IsCellEditControlEnabled():
+            editing = (grid.GetGridCursorRow(), grid.GetGridCursorCol())
+
+        # Trim well below the limit so that the editors are disposed of in
+        # batches rather than one at a time while scrolling:
+        size    = max(self._grid.attr_cache_size, 2)
+        size   -= size // 4
+        editors = []
+        while len(self._cell_cache) > size:
+            key, entry = self._cell_cache.popitem(last=False)
+            if key == editing:
+                self._cell_cache[key] = entry
+                editing = None
+                continue
+
+            attr, editor = entry
+            if attr is not None:
+                attr.DecRef()
+            if editor is not None:
+                editors.append(editor)
+
+        while len(self._style_cache) > size:
+            self._style_cache.popitem(last=False)
+
+        if len(editors) > 0:
+            do_later( self._editor_dispose, editors )
+
+        return
+
+    def _create_editor(self, row, col):
+        """ Ask the underlying model for an editor for a cell. """
+
+        editor = self.model.get_cell_editor(row, col)
+        if editor is not None:
+            editor._grid_info = (self._grid._grid, row, col)
+
+        return editor
+
+    def _create_attr(self, row, col, editor):
+        """ Create the attribute object for a cell. """
+
+        result = GridCellAttr()
 
         if editor is not None:
             # Note: We have to increment the reference to keep the
@@ -1691,21 +1973,12 @@ class _GridTableBase(PyGridTableBase):
             editor.IncRef()
             result.SetEditor(editor)
 
-        # try to find a renderer for this cell
-        renderer = None
-        if row < rows and col < cols:
-            renderer = self.model.get_cell_renderer(row, col)
+        renderer, read_only, bgcolor, text_color, cell_font, alignment = \
+            self._get_style(row, col)
 
-        if renderer is not None and renderer.renderer is not None:
-            renderer.renderer.IncRef()
-            result.SetRenderer(renderer.renderer)
-
-        # look to see if this cell is editable
-        read_only = False
-        if row < rows and col < cols:
-            read_only = self.model.is_cell_read_only(row, col) or \
-                        self.model.is_row_read_only(row) or \
-                        self.model.is_column_read_only(col)
+        if renderer is not None:
+            renderer.IncRef()
+            result.SetRenderer(renderer)
 
         result.SetReadOnly(read_only)
         if read_only :
@@ -1713,37 +1986,85 @@ class _GridTableBase(PyGridTableBase):
             if read_only_color is not None and read_only_color is not Undefined:
                 result.SetBackgroundColour(read_only_color)
 
-        # check to see if colors or fonts are specified for this cell
-        bgcolor = None
-        if row < rows and col < cols:
-            bgcolor = self.model.get_cell_bg_color(row, col)
-        else:
-            bgcolor = self._grid.default_cell_bg_color
-
         if bgcolor is not None:
             result.SetBackgroundColour(bgcolor)
 
-        text_color = None
-        if row < rows and col < cols:
-            text_color = self.model.get_cell_text_color(row, col)
-        else:
-            text_color = self._grid.default_cell_text_color
         if text_color is not None:
             result.SetTextColour(text_color)
 
-        cell_font = None
-        if row < rows and col < cols:
-            cell_font = self.model.get_cell_font(row, col)
-        else:
-            cell_font = self._grid.default_cell_font
         if cell_font is not None:
             result.SetFont(cell_font)
 
+        if alignment is not None:
+            result.SetAlignment(*alignment)
+
+        return result
+
+    def _create_dummy_attr(self):
+        """ Create the attribute object for a cell that is not in the model.
+        """
+
+        result = GridCellAttr()
+
+        editor = DummyGridCellEditor()
+        editor.IncRef()
+        result.SetEditor(editor)
+        result.SetReadOnly(False)
+
+        if self._grid.default_cell_bg_color is not None:
+            result.SetBackgroundColour(self._grid.default_cell_bg_color)
+
+        if self._grid.default_cell_text_color is not None:
+            result.SetTextColour(self._grid.default_cell_text_color)
+
+        if self._grid.default_cell_font is not None:
+            result.SetFont(self._grid.default_cell_font)
+
+        return result
+
+    def _get_style(self, row, col):
+        """ Return the style of a cell.
+
+            Models that declare that every cell in a column (or a row) is
+            styled in the same way are only asked about one cell in it. """
+
+        if self.model.has_uniform_column_style(col):
+            key = (None, col)
+        elif self.model.has_uniform_row_style(row):
+            key = (row, None)
+        else:
+            return self._compute_style(row, col)
+
+        style = self._style_cache.pop(key, None)
+        if style is None:
+            style = self._compute_style(row, col)
+
+        self._style_cache[key] = style
+
+        return style
+
+    def _compute_style(self, row, col):
+        """ Ask the underlying model for the style of a cell.
+
+            The style is a tuple of the form (renderer, read_only, bgcolor,
+            text_color, font, alignment). """
+
+        model = self.model
+
+        # try to find a renderer for this cell
+        renderer = model.get_cell_renderer(row, col)
+        if renderer is not None:
+            renderer = renderer.renderer
+
+        # look to see if this cell is editable
+        read_only = model.is_cell_read_only(row, col) or \
+                    model.is_row_read_only(row) or \
+                    model.is_column_read_only(col)
+
         # check for alignment definition for this cell
-        halignment = valignment = None
-        if row < rows and col < cols:
-            halignment = self.model.get_cell_halignment(row, col)
-            valignment = self.model.get_cell_valignment(row, col)
+        alignment  = None
+        halignment = model.get_cell_halignment(row, col)
+        valignment = model.get_cell_valignment(row, col)
         if halignment is not None and valignment is not None:
             if halignment == 'center':
                 h = wx.ALIGN_CENTRE
@@ -1759,23 +2080,11 @@ class _GridTableBase(PyGridTableBase):
             else:
                 v = wx.ALIGN_CENTRE
 
-            result.SetAlignment(h, v)
-
-        return result
-
-    ###########################################################################
-    # private interface.
-    ###########################################################################
-    def _clear_cache(self):
-        """ Clean out the editor/renderer cache. """
-
-        # Dispose of the editors in the cache after a brief delay, so as
-        # to allow completion of the current event:
-        do_later( self._editor_dispose, self._editor_cache.values() )
+            alignment = (h, v)
 
-        self._editor_cache   = {}
-        self._renderer_cache = {}
-        return
+        return (renderer, read_only, model.get_cell_bg_color(row, col),
+                model.get_cell_text_color(row, col),
+                model.get_cell_font(row, col), alignment)
 
     def _editor_dispose(self, editors):
         for editor in editors:
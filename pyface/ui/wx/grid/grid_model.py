@@ -47,6 +47,18 @@ class GridSortData(HasTraits):
 # for backwards compatibility
 GridSortEvent = GridSortData
 
+class GridRowChangeEvent(HasTraits):
+    """ An event that signals that values in a row have changed.
+
+        The index attribute is the index of the row. The column attribute
+        is the index of the column whose value changed, or -1 if any of the
+        values in the row may have changed. The obj and trait_name
+        attributes describe the change to the underlying data (if known). """
+    index = Int(-1)
+    column = Int(-1)
+    obj = Any
+    trait_name = Str
+
 class GridModel(HasPrivateTraits):
     """ Model for grid views. """
 
@@ -58,6 +70,10 @@ class GridModel(HasPrivateTraits):
     # Fire when the content of the underlying grid model has changed.
     content_changed = Event
 
+    # Fire when values in a single row have changed (a GridRowChangeEvent).
+    # Unlike 'content_changed' only the affected cells need to be redrawn.
+    row_changed = Event
+
     # Column model is currently sorted on.
     column_sorted = Instance(GridSortData)
 
@@ -243,6 +259,18 @@ class GridModel(HasPrivateTraits):
         """ Return the renderer for the specified cell. """
         return None
 
+    def has_uniform_column_style(self, col):
+        """ Return True if every cell in the column indexed by col has the
+        same renderer, read-only state, colors, font and alignment. The grid
+        then only asks about the style of one cell in the column. """
+        return False
+
+    def has_uniform_row_style(self, row):
+        """ Return True if every cell in the row indexed by row has the
+        same renderer, read-only state, colors, font and alignment. The grid
+        then only asks about the style of one cell in the row. """
+        return False
+
     def resolve_selection(self, selection_list):
         """ Returns a list of (row, col) grid-cell coordinates that
         correspond to the objects in selection_list. For each coordinate, if
@@ -330,10 +358,24 @@ class GridModel(HasPrivateTraits):
 
         return
 
-    def fire_structure_changed(self):
-        """ Fires the appearance changed event. """
+    def fire_row_changed(self, index, column=-1, obj=None, trait_name=''):
+        """ Fires the row changed event. """
 
-        self.structure_changed = 'changed'
+        self.row_changed = GridRowChangeEvent(index=index, column=column,
+                                              obj=obj, trait_name=trait_name)
+
+        return
+
+    def fire_structure_changed(self, appended=False):
+        """ Fires the appearance changed event.
+
+        'appended' should be True if the only change is that rows were
+        appended to the end of the model. """
+
+        if appended:
+            self.structure_changed = 'appended'
+        else:
+            self.structure_changed = 'changed'
 
         return
 
@@ -357,7 +399,9 @@ class GridModel(HasPrivateTraits):
         inserted = self._insert_rows(pos, num_rows)
 
         if inserted > 0:
-            self.fire_structure_changed()
+            self.fire_structure_changed(
+                appended=(pos >= self.get_row_count() - inserted)
+            )
 
         return True
 
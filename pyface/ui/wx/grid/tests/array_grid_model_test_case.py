@@ -0,0 +1,91 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+else:
+    numpy_available = True
+
+try:
+  from pyface.ui.wx.grid.api \
+       import ArrayGridModel
+except ImportError:
+    wx_available = False
+else:
+    wx_available = True
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+@unittest.skipUnless(numpy_available, "NumPy is not available")
+class ArrayGridModelTestCase( unittest.TestCase ):
+
+    def setUp(self):
+
+        self.data = numpy.array([(3, 1.5), (1, 2.5), (2, 0.5), (1, 4.0)],
+                                dtype=[('id', int), ('value', float)])
+
+        self.model = ArrayGridModel(data=self.data, block_size=2)
+
+        return
+
+    def test_get_column_count(self):
+
+        self.assertEqual(self.model.get_column_count(), 2)
+        self.assertEqual(self.model.get_column_name(1), 'value')
+
+        return
+
+    def test_get_value(self):
+
+        self.assertEqual(self.model.get_value(0, 0), '3')
+        self.assertEqual(self.model.get_value(3, 1), '4')
+        self.assertEqual(self.model.get_value(4, 0), '')
+
+        return
+
+    def test_sort_by_column(self):
+
+        self.model.sort_by_column(0)
+        self.assertEqual([self.model.get_value(row, 1) for row in range(4)],
+                         ['2.5', '4', '0.5', '1.5'])
+        self.assertEqual(self.model.get_row_name(0), '2')
+
+        # Rows with equal values keep their order in both directions.
+        self.model.sort_by_column(0, reverse=True)
+        self.assertEqual([self.model.get_value(row, 1) for row in range(4)],
+                         ['1.5', '0.5', '2.5', '4'])
+
+        # The array itself is never reordered.
+        self.assertEqual(self.data['id'].tolist(), [3, 1, 2, 1])
+
+        self.model.no_column_sort()
+        self.assertEqual(self.model.get_value(0, 0), '3')
+
+        return
+
+    def test_set_value(self):
+
+        self.model.sort_by_column(1)
+        self.model.get_value(0, 1)
+
+        self.model.set_value(0, 1, '7.25')
+        self.assertEqual(self.data['value'][2], 7.25)
+        self.assertEqual(self.model.get_value(0, 1), '7.25')
+
+        return
+
+    def test_2d_array(self):
+
+        model = ArrayGridModel(data=numpy.arange(6).reshape(3, 2),
+                               formats=['%03d'])
+        self.assertEqual(model.get_column_count(), 2)
+        self.assertEqual(model.get_column_name(0), '1')
+        self.assertEqual(model.get_value(2, 0), '004')
+        self.assertEqual(model.get_value(2, 1), '5')
+        self.assertEqual(model.get_rows_drag_value([1]), [2, 3])
+
+        return
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from traits.api import List
+
+try:
+  from pyface.ui.wx.grid.api \
+       import GridModel
+except ImportError:
+    wx_available = False
+else:
+    wx_available = True
+
+
+if wx_available:
+
+    class ListGridModel(GridModel):
+        """ A grid model whose rows are the items of a list. """
+
+        rows = List
+
+        def get_row_count(self):
+            return len(self.rows)
+
+        def _insert_rows(self, pos, num_rows):
+            self.rows[pos:pos] = [None] * num_rows
+            return num_rows
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+class GridModelTestCase( unittest.TestCase ):
+
+    def setUp(self):
+
+        self.model = ListGridModel(rows=[1, 2])
+
+        self.events = []
+        self.model.on_trait_change(self._on_structure_changed,
+                                   'structure_changed')
+
+        return
+
+    def _on_structure_changed(self, new):
+
+        self.events.append(new)
+
+        return
+
+    def test_append_rows(self):
+
+        # Rows inserted at the end of the model are only appended.
+        self.model.insert_rows(2, 3)
+        self.assertEqual(self.events, ['appended'])
+
+        return
+
+    def test_insert_rows(self):
+
+        self.model.insert_rows(1, 3)
+        self.assertEqual(self.events, ['changed'])
+
+        return
+
+    def test_fire_structure_changed(self):
+
+        self.model.fire_structure_changed()
+        self.assertEqual(self.events, ['changed'])
+
+        return
+
+
+#### EOF ######################################################################
@@ -0,0 +1,115 @@
+import unittest
+
+from traits.api import Float, HasTraits, Str
+
+try:
+  from pyface.ui.wx.grid.api \
+       import TraitGridColumn, TraitGridModel
+except ImportError:
+    wx_available = False
+else:
+    wx_available = True
+
+
+class Record(HasTraits):
+
+    name = Str
+
+    value = Float
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+class TraitGridModelTestCase( unittest.TestCase ):
+
+    def setUp(self):
+
+        self.records = [Record(name=name, value=value) for name, value in
+                        [('c', 2.0), ('a', 1.0), ('b', 2.0), ('d', 1.0)]]
+
+        self.model = TraitGridModel(data=self.records[:],
+                                    columns=[TraitGridColumn(name='name'),
+                                             TraitGridColumn(name='value')])
+
+        return
+
+    def test_sort_by_column(self):
+
+        self.model.sort_by_column(0)
+        self.assertEqual([r.name for r in self.model.data],
+                         ['a', 'b', 'c', 'd'])
+
+        self.model.sort_by_column(0, reverse=True)
+        self.assertEqual([r.name for r in self.model.data],
+                         ['d', 'c', 'b', 'a'])
+
+        return
+
+    def test_sort_is_stable(self):
+
+        # Rows with equal values keep their order in both directions.
+        self.model.sort_by_column(1)
+        self.assertEqual([r.name for r in self.model.data],
+                         ['a', 'd', 'c', 'b'])
+
+        self.model.sort_by_column(1, reverse=True)
+        self.assertEqual([r.name for r in self.model.data],
+                         ['c', 'b', 'a', 'd'])
+
+        self.model.sort_by_column(1)
+        self.assertEqual([r.name for r in self.model.data],
+                         ['a', 'd', 'c', 'b'])
+
+        return
+
+    def test_column_sorter(self):
+
+        self.model.columns[0].sorter = lambda a, b: cmp(b, a)
+        self.model.sort_by_column(0)
+        self.assertEqual([r.name for r in self.model.data],
+                         ['d', 'c', 'b', 'a'])
+
+        return
+
+    def test_get_sort_order(self):
+
+        values = [3, 1, 2, 1]
+        self.assertEqual(self.model._get_sort_order(values), [1, 3, 2, 0])
+        self.assertEqual(self.model._get_sort_order(values, reverse=True),
+                         [0, 2, 1, 3])
+
+        values = ['b', None, 'a']
+        self.assertEqual(self.model._get_sort_order(values), [1, 2, 0])
+
+        return
+
+    def test_row_changed(self):
+
+        events = []
+        self.model.on_trait_change(lambda new: events.append(new),
+                                  'row_changed')
+
+        self.model.sort_by_column(0)
+        record = self.records[0]
+        record.value = 5.0
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].index, self.model.data.index(record))
+        self.assertEqual(events[0].column, 1)
+        self.assertIs(events[0].obj, record)
+        self.assertEqual(events[0].trait_name, 'value')
+
+        # A change to the row name trait refreshes the whole row (including
+        # its label) even though the trait is also a column.
+        self.model.row_name_trait = 'name'
+        del events[:]
+        record.name = 'e'
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].index, self.model.data.index(record))
+        self.assertEqual(events[0].column, -1)
+        self.assertEqual(events[0].trait_name, 'name')
+
+        return
+
+if __name__ == '__main__':
+    unittest.main()
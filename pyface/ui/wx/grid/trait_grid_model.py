@@ -18,6 +18,16 @@ defining which traits will be shown in the columns and in which order. If this
 list is not passed in, then the first object is inspected and every trait
 from that object gets a column."""
 
+# Standard library imports
+from functools import cmp_to_key
+from numbers import Real
+
+# NumPy is optional, it is only used to sort numeric columns more quickly.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Enthought library imports
 from traits.api import Any, Bool, Callable, Dict, Function, HasTraits, \
      Int, List, Str, Trait, TraitError, Type
@@ -84,6 +94,13 @@ class TraitGridModel(GridModel):
     # be a no-argument function.
     row_factory = Trait(None, None, Function)
 
+    # Is the data currently being rearranged by a sort?
+    _sorting = Bool(False)
+
+    # Maps the id of each row object to the index of its row (None until it
+    # is first needed).
+    _row_map = Any
+
     #########################################################################
     # 'object' interface.
     #########################################################################
@@ -206,35 +223,30 @@ class TraitGridModel(GridModel):
         try:
             column = self._auto_columns[col]
             name = self.__get_column_name(col)
-            # by default we use cmp to sort on the traits
-            sorter = cmp
+            # by default we sort on the values of the traits
+            sorter = None
             if isinstance(column, TraitGridColumn) and \
                    column.sorter is not None:
                 sorter = column.sorter
         except IndexError:
             return
 
-        # now sort the data appropriately
-        def sort_function(a, b):
-            if hasattr(a, name):
-                a_trait = getattr(a, name)
-            else:
-                a_trait = None
-
-            if hasattr(b, name):
-                b_trait = getattr(b, name)
-            else:
-                b_trait = None
+        # get the value to sort on for each row just once
+        values = [getattr(row, name, None) for row in self.data]
 
-            return sorter(a_trait, b_trait)
+        order = self._get_sort_order(values, sorter, reverse)
 
-        self.data.sort(sort_function)
+        # now rearrange the data (the rows themselves are unchanged, so
+        # there is no need to update the listeners on them)
+        self._sorting = True
+        try:
+            self.data[:] = [self.data[index] for index in order]
+        finally:
+            self._sorting = False
 
-        if reverse:
-            self.data.reverse()
+        self._row_map = None
 
         # now fire an event to tell the grid we're sorted
-        print 'firing sort event'
         self.column_sorted = GridSortEvent(index = col, reversed = reverse)
 
         return
@@ -472,6 +484,50 @@ class TraitGridModel(GridModel):
     #########################################################################
     # protected interface.
     #########################################################################
+    def _get_sort_order(self, values, sorter=None, reverse=False):
+        """ Return the order of the rows that sorts their values.
+
+        The sort is stable in both directions, so rows with equal values
+        stay in the same order however many times the column is sorted. If
+        'sorter' is not None then it is a cmp-style function used to compare
+        the values. """
+
+        if sorter is not None:
+            key = cmp_to_key(sorter)
+            keys = [key(value) for value in values]
+
+        elif numpy is not None and len(values) > 0 and \
+                 all(isinstance(value, Real) for value in values):
+            array = numpy.array(values)
+            if reverse:
+                # a stable descending sort is the reverse of a stable
+                # ascending sort of the reversed values
+                order = numpy.argsort(array[::-1], kind='mergesort')
+                order = (len(values) - 1 - order)[::-1]
+            else:
+                order = numpy.argsort(array, kind='mergesort')
+
+            return order.tolist()
+
+        else:
+            keys = values
+
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+    def _get_row_index(self, obj):
+        """ Return the index of the row for an object (or None if the object
+        is not in exactly one row). """
+
+        if self._row_map is None:
+            self._row_map = dict((id(row), index)
+                                 for index, row in enumerate(self.data))
+
+            # an object that is in several rows can't be mapped to one
+            if len(self._row_map) != len(self.data):
+                self._row_map = {}
+
+        return self._row_map.get(id(obj))
+
     def _get_row(self, index):
         """ Return the object that corresponds to the row at index. Override
         this to handle very large data sets. """
@@ -580,9 +636,23 @@ class TraitGridModel(GridModel):
         self.fire_structure_changed()
         return
 
-    def _on_contained_trait_changed(self, new):
-        """ Force the grid to refresh when any underlying trait changes. """
-        self.fire_content_changed()
+    def _on_contained_trait_changed(self, object, name, old, new):
+        """ Tell the grid which row (and if possible which cell) has changed
+        when any underlying trait changes. """
+
+        row = self._get_row_index(object)
+        if row is None:
+            self.fire_content_changed()
+            return
+
+        # the value of a column defined by a method may depend on any trait,
+        # and the row label must be refreshed if it is the row name trait
+        column = self._get_column_index_by_trait(name)
+        if column is None or self.__has_method_columns() or \
+               name == self.row_name_trait:
+            column = -1
+
+        self.fire_row_changed(row, column, object, name)
         return
 
     def _on_data_changed(self, object, name, old, new):
@@ -590,18 +660,26 @@ class TraitGridModel(GridModel):
 
         self.__manage_data_listeners(old, remove=True)
         self.__manage_data_listeners(self.data)
+        self._row_map = None
         self.fire_structure_changed()
         return
 
     def _on_data_items_changed(self, event):
         """ Force the grid to refresh when the underlying list changes. """
 
+        # sorting only rearranges the rows (and the grid is told about it
+        # separately)
+        if self._sorting:
+            return
+
         # if an item was removed then remove that item's listener
         self.__manage_data_listeners(event.removed, remove=True)
 
         # if items were added then add trait change listeners on those items
         self.__manage_data_listeners(event.added)
 
+        self._row_map = None
+
         self.fire_content_changed()
         return
 
@@ -683,6 +761,15 @@ class TraitGridModel(GridModel):
 
         return None
 
+    def __has_method_columns(self):
+
+        for col in self._auto_columns:
+            if isinstance(col, TraitGridColumn) and col.name is None and \
+                   col.method is not None:
+                return True
+
+        return False
+
     def __manage_data_listeners(self, list, remove=False):
         # attach appropriate trait handlers to objects in the list
         if list is not None:
@@ -14,12 +14,16 @@
 """ A viewer for tabular data. """
 
 
+# Standard library imports.
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
 # Major package imports.
 import wx
 
 # Enthought library imports.
 from pyface.image_list import ImageList
-from traits.api import Color, Event, Instance, Trait
+from traits.api import Color, Event, Instance, Int, Trait, TraitListObject
 
 # Local imports.
 from .content_viewer import ContentViewer
@@ -47,6 +51,10 @@ class TableViewer(ContentViewer):
     even_row_background = Color("white")
     odd_row_background  = Color((245, 245, 255))
 
+    # The maximum number of rows (in addition to the visible ones) whose text
+    # is measured when a column is sized to fit its contents.
+    autosize_sample_size = Int(200)
+
     # A row has been selected.
     row_selected = Event
 
@@ -70,6 +78,10 @@ class TableViewer(ContentViewer):
         # Base-class constructor.
         super(TableViewer, self).__init__(**traits)
 
+        # The object and trait name of the input's elements if they are being
+        # listened to (a tuple of the form (object, name)).
+        self._hooked = None
+
         # Create the toolkit-specific control.
         self.control = table = _Table(parent, image_size, self)
 
@@ -104,6 +116,20 @@ class TableViewer(ContentViewer):
 
         return
 
+    ###########################################################################
+    # 'IWidget' interface.
+    ###########################################################################
+
+    def destroy(self):
+        """ Destroys the viewer. """
+
+        # Stop listening for changes to the input's elements.
+        self._unhook_elements()
+
+        super(TableViewer, self).destroy()
+
+        return
+
     ###########################################################################
     # 'TableViewer' interface.
     ###########################################################################
@@ -143,6 +169,31 @@ class TableViewer(ContentViewer):
 
         return
 
+    def _on_elements_items_changed(self, event):
+        """ Called when elements have been added to or removed from the
+        input's elements. """
+
+        # Extended slices, and sorters that can only compare elements, need
+        # the whole table to be updated.
+        if not isinstance(event.index, int) or \
+           (self.sorter is not None and not self.sorter.uses_sort_key()):
+            self._update_contents()
+
+            return
+
+        self._remove_elements(event.index, event.removed)
+        inserted = self._insert_elements(
+            event.index, event.added, len(event.removed)
+        )
+
+        # Setting this causes a refresh!
+        self.control.SetItemCount(len(self._elements))
+
+        if len(inserted) > 0:
+            self._update_column_widths(inserted)
+
+        return
+
     ###########################################################################
     # wx event handlers.
     ###########################################################################
@@ -242,37 +293,200 @@ class TableViewer(ContentViewer):
         return
 
     def _update_contents(self):
-        """ Updates the table content. """
+        """ Updates the table content.
+
+        If the input's elements are a traits list then subsequent changes to
+        the list are applied incrementally.
+
+        """
 
+        self._unhook_elements()
+
+        # The elements that are displayed, in the order they are displayed.
         self._elements = []
+
+        # If the sorter uses keys, then the key of each displayed element.
+        self._keys = []
+
+        # If there is no sorter, then the index in the input's elements of
+        # each displayed element.
+        self._rows = []
+
         if self.input is not None:
-            # Filtering...
-            for element in  self.content_provider.get_elements(self.input):
-                for filter in self.filters:
-                    if not filter.select(self, self.input, element):
-                        break
+            elements = self.content_provider.get_elements(self.input)
 
-                else:
+            # Filtering...
+            for row, element in enumerate(elements):
+                if self._select(element):
                     self._elements.append(element)
+                    self._rows.append(row)
 
             # Sorting...
             if self.sorter is not None:
-                self.sorter.sort(self, self.input, self._elements)
+                self._rows = []
+
+                if self.sorter.uses_sort_key():
+                    keys = [self._get_sort_key(e) for e in self._elements]
+                    order = sorted(range(len(keys)), key=keys.__getitem__)
+
+                    self._elements = [self._elements[i] for i in order]
+                    self._keys = [keys[i] for i in order]
+
+                else:
+                    self.sorter.sort(self, self.input, self._elements)
+
+            self._hook_elements(elements)
 
         # Setting this causes a refresh!
         self.control.SetItemCount(len(self._elements))
 
         return
 
-    def _update_column_widths(self):
-        """ Updates the column widths. """
+    def _select(self, element):
+        """ Returns True if an element passes all of the filters. """
+
+        for filter in self.filters:
+            if not filter.select(self, self.input, element):
+                return False
+
+        return True
+
+    def _get_sort_key(self, element):
+        """ Returns the sort key of an element. """
+
+        return self.sorter.sort_key(self, self.input, element)
+
+    def _hook_elements(self, elements):
+        """ Listens for changes to the input's elements (if possible). """
+
+        if isinstance(elements, TraitListObject) and elements.name_items:
+            obj = elements.object()
+            if obj is not None:
+                obj.on_trait_change(
+                    self._on_elements_items_changed, elements.name_items
+                )
+
+                self._hooked = (obj, elements.name_items)
+
+        return
+
+    def _unhook_elements(self):
+        """ Stops listening for changes to the input's elements. """
+
+        if self._hooked is not None:
+            obj, name_items = self._hooked
+            obj.on_trait_change(
+                self._on_elements_items_changed, name_items, remove=True
+            )
+
+            self._hooked = None
+
+        return
+
+    def _insert_elements(self, index, elements, removed):
+        """ Inserts elements into the table.
+
+        'index' is the index in the input's elements of the first element,
+        and 'removed' is the number of the input's elements that they
+        replaced.
+
+        Returns the elements that were inserted (i.e. not filtered out).
+
+        """
+
+        selected = [
+            (index + i, element) for i, element in enumerate(elements)
+            if self._select(element)
+        ]
+
+        if self.sorter is None:
+            # The table is in the same order as the input's elements, so the
+            # rows of the elements after the inserted ones move along.
+            start = bisect_left(self._rows, index)
+            for i in range(start, len(self._rows)):
+                self._rows[i] += len(elements) - removed
+
+            self._rows[start:start] = [row for row, element in selected]
+            self._elements[start:start] = [
+                element for row, element in selected
+            ]
+
+        else:
+            # Each element goes after any elements with an equal key.
+            for row, element in selected:
+                key = self._get_sort_key(element)
+                position = bisect_right(self._keys, key)
+
+                self._keys.insert(position, key)
+                self._elements.insert(position, element)
+
+        return [element for row, element in selected]
+
+    def _remove_elements(self, index, elements):
+        """ Removes elements from the table.
+
+        'index' is the index in the input's elements of the first element.
+
+        """
+
+        if self.sorter is None:
+            start = bisect_left(self._rows, index)
+            end = bisect_left(self._rows, index + len(elements))
+
+            del self._rows[start:end]
+            del self._elements[start:end]
+
+        else:
+            for element in elements:
+                position = self._find_sorted(element)
+                if position != -1:
+                    del self._keys[position]
+                    del self._elements[position]
+
+        return
+
+    def _find_sorted(self, element):
+        """ Returns the position of an element in a sorted table.
+
+        Returns -1 if the element is not in the table.
+
+        """
+
+        # Look amongst the elements with the same key first (the key may have
+        # changed since the element was inserted though).
+        key = self._get_sort_key(element)
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, start)
+
+        for position in chain(range(start, end), range(len(self._elements))):
+            if self._elements[position] is element:
+                return position
+
+        return -1
+
+    def _update_column_widths(self, elements=None):
+        """ Updates the column widths.
+
+        If 'elements' is specified then columns are only widened (if
+        necessary) to fit the text of those elements.
+
+        """
 
         # Set all columns to be the size of their largest item, or the size of
         # their header whichever is the larger.
         for column in range(self.control.GetColumnCount()):
             width = self.column_provider.get_width(self, column)
             if width == -1:
-                width = self._get_column_width(column)
+                if elements is None:
+                    width = self._get_column_width(column)
+
+                else:
+                    width = self._measure_column(
+                        column, self._sample_elements(elements)
+                    )
+
+                    if width <= self.control.GetColumnWidth(column):
+                        continue
 
             self.control.SetColumnWidth(column, width)
 
@@ -284,17 +498,48 @@ class TableViewer(ContentViewer):
         self.control.SetColumnWidth(column, wx.LIST_AUTOSIZE_USEHEADER)
         header_width = self.control.GetColumnWidth(column)
 
-        if self.control.GetItemCount() == 0:
-            width = header_width
+        # Measuring the text of every row (as LIST_AUTOSIZE does) is far too
+        # slow for large tables, so only the visible rows and a sample of the
+        # others are measured.
+        top = self.control.GetTopItem()
+        visible = self._elements[top:top + self.control.GetCountPerPage() + 1]
+        elements = chain(visible, self._sample_elements(self._elements))
 
-        else:
-            self.control.SetColumnWidth(column, wx.LIST_AUTOSIZE)
-            data_width = self.control.GetColumnWidth(column)
+        return max(header_width, self._measure_column(column, elements))
+
+    def _measure_column(self, column, elements):
+        """ Returns the width needed by the text of some elements in a column.
+        """
+
+        width = 0
+        for element in elements:
+            text = self.label_provider.get_text(self, element, column)
+            text_width = self.control.GetTextExtent(text)[0]
 
-            width = max(header_width, data_width)
+            # The image (if any) is displayed in the first column.
+            if column == 0 and \
+               self.label_provider.get_image(self, element) is not None:
+                text_width += self.control.image_size[0]
+
+            width = max(width, text_width)
+
+        # Leave room for the margins around the text.
+        if width > 0:
+            width += 8
 
         return width
 
+    def _sample_elements(self, elements):
+        """ Returns at most 'autosize_sample_size' elements spread evenly
+        over a list of elements. """
+
+        count = len(elements)
+        size = self.autosize_sample_size
+        if count <= size:
+            return elements
+
+        return [elements[(index * count) // size] for index in range(size)]
+
 
 class _Table(wx.ListCtrl):
     """ The wx control that we use to implement the table viewer. """
@@ -317,6 +562,9 @@ class _Table(wx.ListCtrl):
         # The vierer that we are providing the control for.
         self._viewer = viewer
 
+        # The size of the images displayed in the table.
+        self.image_size = image_size
+
         # Base-class constructor.
         wx.ListCtrl.__init__(self, parent, -1, style=self.STYLE)
 
@@ -0,0 +1,175 @@
+""" Tests for applying list changes to the table viewer incrementally. """
+
+import random
+import unittest
+
+import mock
+
+try:
+    from pyface.viewer.table_viewer import TableViewer
+except ImportError:
+    wx_available = False
+else:
+    wx_available = True
+
+from traits.api import HasTraits, Int, List
+
+from pyface.viewer.table_content_provider import TableContentProvider
+from pyface.viewer.viewer_filter import ViewerFilter
+from pyface.viewer.viewer_sorter import ViewerSorter
+
+
+class Element(HasTraits):
+    """ An element of the table. """
+
+    value = Int
+
+
+class Source(HasTraits):
+    """ The input of the table. """
+
+    elements = List(Element)
+
+
+class SourceContentProvider(TableContentProvider):
+    """ Provides the elements of a source. """
+
+    def get_elements(self, element):
+        return element.elements
+
+
+class KeySorter(ViewerSorter):
+    """ Sorts elements by their value modulo 7 (so many keys are equal). """
+
+    def sort_key(self, viewer, parent, element):
+        return element.value % 7
+
+
+class EvenFilter(ViewerFilter):
+    """ Selects the elements with an even value. """
+
+    def select(self, viewer, parent, element):
+        return element.value % 2 == 0
+
+
+@unittest.skipUnless(wx_available, "Wx is not available")
+class TableViewerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # Stand in for the wx list control.
+        patcher = mock.patch('pyface.viewer.table_viewer._Table')
+        self.addCleanup(patcher.stop)
+        table_class = patcher.start()
+        self.table = table_class.return_value
+        self.table.GetColumnCount.return_value = 0
+
+        self.rng = random.Random(0)
+
+    def _create_viewer(self, sorter=None, filters=None):
+        self.source = Source(elements=self._create_elements(20))
+        return TableViewer(
+            None, input=self.source, sorter=sorter, filters=filters or [],
+            content_provider=SourceContentProvider()
+        )
+
+    def _create_elements(self, count):
+        return [Element(value=self.rng.randint(0, 100)) for i in range(count)]
+
+    def _change_elements(self):
+        """ Makes a random change to the elements of the source. """
+
+        rng = self.rng
+        elements = self.source.elements
+        n = len(elements)
+        op = rng.choice('insert extend remove splice set'.split())
+        if op == 'insert':
+            elements.insert(rng.randint(0, n), *self._create_elements(1))
+        elif op == 'extend':
+            elements.extend(self._create_elements(3))
+        elif op == 'remove' and n > 0:
+            del elements[rng.randint(0, n - 1)]
+        elif op == 'splice' and n > 3:
+            i = rng.randint(0, n - 3)
+            elements[i:i + 2] = self._create_elements(rng.randint(0, 3))
+        elif n > 0:
+            elements[rng.randint(0, n - 1)] = self._create_elements(1)[0]
+
+    def _expected(self, viewer):
+        """ Returns the elements that the viewer should display. """
+
+        return [element for element in self.source.elements
+                if viewer._select(element)]
+
+    def _check_random_changes(self, sorter=None, filters=None):
+        viewer = self._create_viewer(sorter, filters)
+
+        for i in range(300):
+            self._change_elements()
+            expected = self._expected(viewer)
+
+            if sorter is None:
+                self.assertEqual(viewer._elements, expected)
+                self.assertEqual(
+                    viewer._rows,
+                    [self.source.elements.index(element)
+                     for element in expected]
+                )
+
+            else:
+                # Elements with equal keys may be in any order.
+                self.assertEqual(sorted(map(id, viewer._elements)),
+                                 sorted(map(id, expected)))
+                keys = [sorter.sort_key(viewer, self.source, element)
+                        for element in viewer._elements]
+                self.assertEqual(viewer._keys, keys)
+                self.assertEqual(keys, sorted(keys))
+
+            self.table.SetItemCount.assert_called_with(len(expected))
+
+    def test_changes(self):
+        """ Are changes to the input's elements applied incrementally?
+        """
+        self._check_random_changes()
+
+    def test_filtered_changes(self):
+        """ Are changes applied incrementally to a filtered table?
+        """
+        self._check_random_changes(filters=[EvenFilter()])
+
+    def test_sorted_changes(self):
+        """ Are changes applied incrementally to a sorted table?
+        """
+        self._check_random_changes(sorter=KeySorter())
+
+    def test_sorted_filtered_changes(self):
+        """ Are changes applied incrementally to a sorted, filtered table?
+        """
+        self._check_random_changes(sorter=KeySorter(), filters=[EvenFilter()])
+
+    def test_find_sorted(self):
+        """ Is an element found in a sorted table even if its key changed?
+        """
+        viewer = self._create_viewer(sorter=KeySorter())
+        element = viewer._elements[0]
+
+        self.assertEqual(viewer._find_sorted(element), 0)
+
+        element.value += 1
+        self.assertEqual(viewer._find_sorted(element), 0)
+        self.assertEqual(viewer._find_sorted(Element()), -1)
+
+    def test_destroy(self):
+        """ Does the viewer stop listening to its input once destroyed?
+        """
+        viewer = self._create_viewer()
+        elements = viewer._elements[:]
+
+        viewer.destroy()
+        self.source.elements.append(Element())
+
+        self.assertIsNone(viewer._hooked)
+        self.assertEqual(viewer._elements, elements)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,19 +34,60 @@ class ViewerSorter(HasTraits):
 
         Returns the list that was sorted IN PLACE (for convenience).
 
+        Elements are sorted by their 'sort_key', unless a subclass overrides
+        'compare' (but not 'sort_key'), in which case the comparison is used.
+
         """
 
-        # This creates a comparison function with the names 'viewer' and
-        # 'parent' bound to the corresponding arguments to this method.
-        def comparator(element_a, element_b):
-            """ Comparator. """
+        if not self.uses_sort_key():
+            # This creates a comparison function with the names 'viewer' and
+            # 'parent' bound to the corresponding arguments to this method.
+            def comparator(element_a, element_b):
+                """ Comparator. """
+
+                return self.compare(viewer, parent, element_a, element_b)
+
+            elements.sort(comparator)
+
+        else:
+            # The key of each element is only computed once (rather than once
+            # per comparison).
+            def key(element):
+                """ Key function. """
 
-            return self.compare(viewer, parent, element_a, element_b)
+                return self.sort_key(viewer, parent, element)
 
-        elements.sort(comparator)
+            elements.sort(key=key)
 
         return elements
 
+    def sort_key(self, viewer, parent, element):
+        """ Returns the key that an element is sorted by.
+
+        'viewer'  is the viewer that we are sorting elements for.
+        'parent'  is the parent element.
+        'element' is the element to return the key for.
+
+        By default the key is the element's category followed by its label
+        text, which orders elements in the same way as 'compare'.
+
+        """
+
+        return (
+            self.category(viewer, parent, element),
+            self._get_text(viewer, element)
+        )
+
+    def uses_sort_key(self):
+        """ Returns True if elements are sorted by their 'sort_key'.
+
+        This is False only for sorters that override 'compare' but not
+        'sort_key'.
+
+        """
+
+        return not _overrides(self, 'compare') or _overrides(self, 'sort_key')
+
     def compare(self, viewer, parent, element_a, element_b):
         """ Returns the result of comparing two elements.
 
@@ -68,16 +109,8 @@ class ViewerSorter(HasTraits):
 
         else:
             # Get the label text for each element.
-            #
-            # fixme: This is a hack until we decide whethwe we like the
-            # JFace(ish) or Swing(ish) models!
-            if hasattr(viewer, 'label_provider'):
-              label_a = viewer.label_provider.get_text(viewer, element_a)
-              label_b = viewer.label_provider.get_text(viewer, element_b)
-
-            else:
-                label_a = viewer.node_model.get_text(viewer, element_a)
-                label_b = viewer.node_model.get_text(viewer, element_b)
+            label_a = self._get_text(viewer, element_a)
+            label_b = self._get_text(viewer, element_b)
 
             # Compare the label text.
             result = cmp(label_a, label_b)
@@ -115,4 +148,31 @@ class ViewerSorter(HasTraits):
 
         return False
 
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _get_text(self, viewer, element):
+        """ Returns the label text for an element. """
+
+        # fixme: This is a hack until we decide whethwe we like the
+        # JFace(ish) or Swing(ish) models!
+        if hasattr(viewer, 'label_provider'):
+            text = viewer.label_provider.get_text(viewer, element)
+
+        else:
+            text = viewer.node_model.get_text(viewer, element)
+
+        return text
+
+
+def _overrides(sorter, name):
+    """ Returns True if a sorter's class overrides a ViewerSorter method. """
+
+    method = getattr(type(sorter), name)
+    base_method = getattr(ViewerSorter, name)
+
+    return getattr(method, '__func__', method) is not \
+        getattr(base_method, '__func__', base_method)
+
 #### EOF ######################################################################
@@ -4,10 +4,11 @@
 import weakref
 
 # Enthought library imports.
-from traits.api import HasTraits, Instance, provides
+from traits.api import HasTraits, Instance, on_trait_change, provides
 
 # Local imports.
 from .i_editor_manager import IEditorManager
+from .list_index import ListIndex
 from .traits_ui_editor import TraitsUIEditor
 
 
@@ -19,6 +20,15 @@ class EditorManager(HasTraits):
     # The workbench window that the editor manager manages editors for ;^)
     window = Instance('pyface.workbench.api.WorkbenchWindow')
 
+    #### Private interface ####################################################
+
+    # The window's editors, keyed by the object that they are editing and
+    # their kind.
+    _editors_by_obj_and_kind = Instance(ListIndex)
+
+    # The window's editors, keyed by the object that they are editing.
+    _editors_by_obj = Instance(ListIndex)
+
     ###########################################################################
     # 'object' interface.
     ###########################################################################
@@ -26,11 +36,14 @@ class EditorManager(HasTraits):
     def __init__(self, **traits):
         """ Constructor. """
 
-        super(EditorManager, self).__init__(**traits)
-
         # A mapping from editor to editor kind (the factory that created them).
+        #
+        # This is created before the window is set as the editors are indexed
+        # by their kind.
         self._editor_to_kind_map = weakref.WeakKeyDictionary()
 
+        super(EditorManager, self).__init__(**traits)
+
         return
 
     ###########################################################################
@@ -40,8 +53,23 @@ class EditorManager(HasTraits):
     def add_editor(self, editor, kind):
         """ Registers an existing editor. """
 
+        old = self._editor_to_kind_map.get(editor)
         self._editor_to_kind_map[editor] = kind
 
+        # If the editor is already open then it has been indexed by its old
+        # kind.
+        if self.window is not None and old is not kind:
+            index = self._editors_by_obj_and_kind
+            for other in index.get((editor.obj, old)):
+                if other is editor:
+                    index.move(
+                        editor, (editor.obj, old), (editor.obj, kind),
+                        self.window.editors
+                    )
+                    break
+
+        return
+
     def create_editor(self, window, obj, kind):
         """ Create an editor for an object. """
 
@@ -54,7 +82,16 @@ class EditorManager(HasTraits):
     def get_editor(self, window, obj, kind):
         """ Get the editor that is currently editing an object. """
 
-        for editor in window.editors:
+        # The index can only be used if it is for the right window and the
+        # default '_is_editing' (which only compares the objects) is in use.
+        # Otherwise, every editor in the window is checked.
+        if window is self.window and not self._is_editing_overridden():
+            candidates = self._get_editors_by_obj(obj, kind)
+
+        else:
+            candidates = window.editors
+
+        for editor in candidates:
             if self._is_editing(editor, obj, kind):
                 break
         else:
@@ -92,4 +129,86 @@ class EditorManager(HasTraits):
 
         return editor.obj == obj
 
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _get_editors_by_obj(self, obj, kind):
+        """ Return the window's editors that might be editing an object. """
+
+        # If the object can't be hashed then we have to check every editor.
+        try:
+            hash(obj)
+
+        except TypeError:
+            return self.window.editors
+
+        # Editors of the same kind are preferred, but the default
+        # '_is_editing' accepts an editor of any kind.
+        editors = self._editors_by_obj_and_kind.get((obj, kind))
+        if len(editors) == 0:
+            editors = self._editors_by_obj.get(obj)
+
+        return editors
+
+    def _get_editor_key(self, editor):
+        """ Return the key of an editor in the (object, kind) index. """
+
+        return (editor.obj, self._editor_to_kind_map.get(editor))
+
+    def _index_editors(self):
+        """ Build the indexes of the window's editors. """
+
+        editors = self.window.editors if self.window is not None else []
+
+        # Editors of objects that can't be hashed are left out of the
+        # indexes (they can only be found by objects that can't be hashed
+        # either, and those are looked up the slow way).
+        self._editors_by_obj_and_kind = ListIndex(
+            editors, key=self._get_editor_key
+        )
+        self._editors_by_obj = ListIndex(
+            editors, key=lambda editor: editor.obj
+        )
+
+        return
+
+    def _is_editing_overridden(self):
+        """ Return True if a subclass has overridden '_is_editing'. """
+
+        method = type(self)._is_editing
+        function = getattr(method, '__func__', method)
+
+        return function is not EditorManager.__dict__['_is_editing']
+
+    #### Trait change handlers ################################################
+
+    @on_trait_change('window, window:editors')
+    def _window_editors_changed(self, obj, name, old, new):
+        """ Dynamic trait change handler. """
+
+        # Editors that are added or removed are simply added to or removed
+        # from the indexes. Only a new window or list of editors requires them
+        # to be rebuilt.
+        if name == 'editors_items':
+            self._editors_by_obj_and_kind.update(new, self.window.editors)
+            self._editors_by_obj.update(new, self.window.editors)
+
+        else:
+            self._index_editors()
+
+        return
+
+    @on_trait_change('window:editors:obj')
+    def _editor_obj_changed(self, editor, name, old, new):
+        """ Dynamic trait change handler. """
+
+        kind = self._editor_to_kind_map.get(editor)
+        self._editors_by_obj_and_kind.move(
+            editor, (old, kind), (new, kind), self.window.editors
+        )
+        self._editors_by_obj.move(editor, old, new, self.window.editors)
+
+        return
+
 #### EOF ######################################################################
@@ -0,0 +1,181 @@
+""" An index of the items in a list that is maintained incrementally. """
+
+
+# Enthought library imports.
+from traits.api import Any, Callable, HasTraits
+
+
+class ListIndex(HasTraits):
+    """ An index of the items in a list that is maintained incrementally.
+
+    Each key maps to the items that have that key, in the same order as they
+    are in the list. The index is updated from the items that are added to
+    and removed from the list, so it never has to be rebuilt while the list
+    is only modified.
+
+    Items whose keys cannot be hashed are left out of the index.
+
+    """
+
+    #### 'ListIndex' interface ################################################
+
+    # A callable that returns the key of an item.
+    key = Callable
+
+    #### Private interface ####################################################
+
+    # The items, keyed by their keys.
+    _items = Any
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, items=None, **traits):
+        """ Creates a new index of the items in a list. """
+
+        super(ListIndex, self).__init__(**traits)
+
+        self._items = {}
+        if items is not None:
+            for item in items:
+                self._append(self._get_key(item), item)
+
+        return
+
+    ###########################################################################
+    # 'ListIndex' interface.
+    ###########################################################################
+
+    def get(self, key):
+        """ Returns the items with a key (in list order). """
+
+        try:
+            return self._items.get(key, [])
+
+        except TypeError:
+            return []
+
+    def get_first(self, key):
+        """ Returns the first item with a key (or None if there is none). """
+
+        items = self.get(key)
+
+        return items[0] if len(items) > 0 else None
+
+    def update(self, event, items):
+        """ Updates the index from a list items changed event.
+
+        'items' is the list after the change.
+
+        """
+
+        self.remove(event.removed)
+
+        # Items appended to the end of the list simply go at the end of their
+        # keys' items.
+        appended = isinstance(event.index, int) \
+            and event.index + len(event.added) == len(items)
+
+        self.add(event.added, None if appended else items)
+
+        return
+
+    def add(self, added, items=None):
+        """ Adds items to the index.
+
+        If 'items' is not None then it is the list that the items were
+        inserted into, and it is used to keep each key's items in list
+        order. Otherwise the items are assumed to have been appended.
+
+        """
+
+        keys = set()
+        for item in added:
+            key = self._get_key(item)
+            if self._append(key, item):
+                keys.add(key)
+
+        if items is not None:
+            self._sort(keys, items)
+
+        return
+
+    def remove(self, removed):
+        """ Removes items from the index. """
+
+        for item in removed:
+            self._remove(self._get_key(item), item)
+
+        return
+
+    def move(self, item, old_key, new_key, items):
+        """ Moves an item whose key has changed. """
+
+        self._remove(old_key, item)
+        if self._append(new_key, item):
+            self._sort([new_key], items)
+
+        return
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _get_key(self, item):
+        """ Returns the key of an item. """
+
+        return self.key(item)
+
+    def _append(self, key, item):
+        """ Adds an item at the end of a key's items.
+
+        Returns False if the key cannot be hashed.
+
+        """
+
+        try:
+            self._items.setdefault(key, []).append(item)
+
+        except TypeError:
+            return False
+
+        return True
+
+    def _remove(self, key, item):
+        """ Removes an item from a key's items. """
+
+        try:
+            bucket = self._items.get(key)
+
+        except TypeError:
+            return
+
+        if bucket is not None:
+            for index, other in enumerate(bucket):
+                if other is item:
+                    del bucket[index]
+                    break
+
+            if len(bucket) == 0:
+                del self._items[key]
+
+        return
+
+    def _sort(self, keys, items):
+        """ Puts the items of some keys back into list order. """
+
+        positions = None
+        for key in keys:
+            bucket = self._items.get(key)
+            if bucket is not None and len(bucket) > 1:
+                if positions is None:
+                    positions = dict(
+                        (id(item), index) for index, item in enumerate(items)
+                    )
+
+                bucket.sort(key=lambda item: positions.get(id(item), -1))
+
+        return
+
+#### EOF ######################################################################
@@ -0,0 +1,307 @@
+""" A background writer for persisted workbench state. """
+
+
+# Standard library imports.
+import atexit
+import cPickle
+import logging
+import os
+import tempfile
+import threading
+import time
+
+# Enthought library imports.
+from traits.api import Any, Bool, Dict, Float, HasTraits, Int
+
+
+# Logging.
+logger = logging.getLogger(__name__)
+
+
+class StateWriter(HasTraits):
+    """ A background writer for persisted workbench state.
+
+    Snapshots of state are taken by the caller (normally on the GUI thread)
+    and handed to the writer, which pickles them and writes them to a file or
+    to a state store on a background thread.
+
+    Writes are atomic: each snapshot is either written to a temporary file in
+    the same directory which is then renamed over the target, or set in a
+    single store transaction, so a crash part way through a write never
+    corrupts the previously saved state.
+
+    Writes are debounced: if a newer snapshot for the same target arrives
+    before an older one has been written, only the newer one is written.
+
+    """
+
+    #### 'StateWriter' interface ##############################################
+
+    # The default time (in seconds) that a snapshot is held before it is
+    # written. Any newer snapshot for the same file that arrives in that time
+    # replaces it.
+    delay = Float(0)
+
+    # The pickle protocol used to serialize snapshots.
+    protocol = Int(cPickle.HIGHEST_PROTOCOL)
+
+    #### Private interface ####################################################
+
+    # Guards all of the private state below and signals changes to it.
+    _condition = Any
+
+    # The snapshots waiting to be written.
+    #
+    # The keys are the targets (either a filename or a tuple of the form
+    # (store, namespace, key)), the values are tuples of the form
+    # (deadline, snapshot).
+    _pending = Dict
+
+    # The number of snapshots that are currently being written.
+    _writing = Int(0)
+
+    # The background thread (None until the first snapshot is scheduled).
+    _thread = Any
+
+    # Set when the background thread should exit.
+    _stopping = Bool(False)
+
+    # Set once 'flush' has been registered to run when the interpreter exits.
+    _flush_at_exit = Bool(False)
+
+    ###########################################################################
+    # 'object' interface.
+    ###########################################################################
+
+    def __init__(self, **traits):
+        """ Creates a new writer. """
+
+        super(StateWriter, self).__init__(**traits)
+
+        self._condition = threading.Condition()
+
+        return
+
+    ###########################################################################
+    # 'StateWriter' interface.
+    ###########################################################################
+
+    def write(self, filename, snapshot, delay=None):
+        """ Schedules a snapshot to be written to a file.
+
+        The snapshot must not be modified after it has been passed to the
+        writer. If 'delay' is None then the writer's default delay is used.
+
+        """
+
+        self._schedule(filename, snapshot, delay)
+
+        return
+
+    def write_state(self, store, namespace, key, snapshot, delay=None):
+        """ Schedules a snapshot to be set as the value of a key in a state
+        store.
+
+        The snapshot must not be modified after it has been passed to the
+        writer. If 'delay' is None then the writer's default delay is used.
+
+        """
+
+        self._schedule((store, namespace, key), snapshot, delay)
+
+        return
+
+    def flush(self, timeout=None):
+        """ Writes all pending snapshots immediately and waits for them.
+
+        Returns True if everything was written before the (optional) timeout
+        expired.
+
+        """
+
+        if timeout is not None:
+            end = time.time() + timeout
+
+        with self._condition:
+            # Make everything that is pending due now.
+            for target, (deadline, snapshot) in self._pending.items():
+                self._pending[target] = (0, snapshot)
+            self._condition.notify_all()
+
+            while self._pending or self._writing > 0:
+                if timeout is None:
+                    self._condition.wait()
+
+                else:
+                    remaining = end - time.time()
+                    if remaining <= 0:
+                        return False
+
+                    self._condition.wait(remaining)
+
+        return True
+
+    def stop(self):
+        """ Writes all pending snapshots and stops the background thread. """
+
+        self.flush()
+
+        with self._condition:
+            thread = self._thread
+            self._thread = None
+            self._stopping = True
+            self._condition.notify_all()
+
+        if thread is not None:
+            thread.join()
+
+        return
+
+    ###########################################################################
+    # Private interface.
+    ###########################################################################
+
+    def _schedule(self, target, snapshot, delay):
+        """ Schedules a snapshot to be written to a target. """
+
+        if delay is None:
+            delay = self.delay
+
+        with self._condition:
+            self._start()
+
+            # A pending snapshot keeps its deadline (so that a stream of
+            # updates cannot postpone the write forever) unless the new one
+            # is wanted sooner.
+            deadline = time.time() + delay
+            if target in self._pending:
+                deadline = min(deadline, self._pending[target][0])
+
+            self._pending[target] = (deadline, snapshot)
+            self._condition.notify_all()
+
+        return
+
+    def _start(self):
+        """ Starts the background thread if it is not already running.
+
+        This must be called with the condition held.
+
+        """
+
+        if self._thread is None:
+            self._stopping = False
+
+            # The thread is a daemon so that it never keeps the application
+            # alive, but anything still pending is written when the
+            # interpreter exits.
+            self._thread = threading.Thread(
+                target=self._run, name='StateWriter'
+            )
+            self._thread.daemon = True
+            self._thread.start()
+
+            # The thread may be started again after the writer is stopped, but
+            # the writer only needs to be flushed once at exit.
+            if not self._flush_at_exit:
+                atexit.register(self.flush)
+                self._flush_at_exit = True
+
+        return
+
+    def _run(self):
+        """ The body of the background thread. """
+
+        while True:
+            with self._condition:
+                due = self._wait_for_due()
+                if due is None:
+                    break
+
+                self._writing += 1
+
+            try:
+                target, snapshot = due
+                try:
+                    if isinstance(target, tuple):
+                        store, namespace, key = target
+                        store.set(namespace, key, snapshot)
+
+                    else:
+                        self._write_atomic(target, snapshot)
+
+                # If *anything* goes wrong then simply log the error and carry
+                # on (the previously saved state is still intact).
+                except:
+                    logger.exception('writing state to %s', target)
+
+            finally:
+                with self._condition:
+                    self._writing -= 1
+                    self._condition.notify_all()
+
+        return
+
+    def _wait_for_due(self):
+        """ Waits for a pending snapshot to become due and removes it.
+
+        Returns a tuple of the form (target, snapshot), or None if the
+        thread should exit. This must be called with the condition held.
+
+        """
+
+        while not self._stopping:
+            if self._pending:
+                target, (deadline, snapshot) = min(
+                    self._pending.items(), key=lambda item: item[1][0]
+                )
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    del self._pending[target]
+                    return target, snapshot
+
+                self._condition.wait(remaining)
+
+            else:
+                self._condition.wait()
+
+        return None
+
+    def _write_atomic(self, filename, snapshot):
+        """ Pickles a snapshot to a file atomically. """
+
+        dirname, basename = os.path.split(os.path.abspath(filename))
+
+        fd, temp_filename = tempfile.mkstemp(
+            prefix=basename + '.', suffix='.tmp', dir=dirname
+        )
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                cPickle.dump(snapshot, f, self.protocol)
+                f.flush()
+                os.fsync(f.fileno())
+
+            finally:
+                f.close()
+
+            try:
+                os.rename(temp_filename, filename)
+
+            # On Windows a rename can't replace an existing file.
+            except OSError:
+                if not os.path.exists(filename):
+                    raise
+
+                os.remove(filename)
+                os.rename(temp_filename, filename)
+
+        except:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
+
+        return
+
+#### EOF ######################################################################
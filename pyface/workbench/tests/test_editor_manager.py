@@ -0,0 +1,166 @@
+# Standard library imports.
+import unittest
+
+# Local imports.
+from pyface.workbench.api import Editor, Perspective, WorkbenchWindow
+
+
+class EditorManagerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.window = WorkbenchWindow()
+        self.manager = self.window.editor_manager
+
+    def _open(self, obj, kind=None, id=''):
+        editor = Editor(window=self.window, obj=obj, id=id)
+        self.manager.add_editor(editor, kind)
+        self.window.editors.append(editor)
+
+        return editor
+
+    def test_get_editor(self):
+        """ Are open editors found by the object that they are editing?
+        """
+        a = self._open('a')
+        b = self._open('b')
+
+        self.assertIs(self.window.get_editor('a'), a)
+        self.assertIs(self.window.get_editor('b'), b)
+        self.assertIsNone(self.window.get_editor('c'))
+
+    def test_open_close_does_not_rebuild(self):
+        """ Is the index updated rather than rebuilt as editors come and go?
+        """
+        a = self._open('a')
+        index = self.manager._editors_by_obj_and_kind
+
+        b = self._open('b')
+        self.assertIs(self.window.get_editor('b'), b)
+
+        self.window.editors.remove(a)
+        self.assertIsNone(self.window.get_editor('a'))
+        self.assertIs(self.window.get_editor('b'), b)
+
+        c = self._open('a')
+        self.assertIs(self.window.get_editor('a'), c)
+
+        self.assertIs(self.manager._editors_by_obj_and_kind, index)
+
+    def test_replace_editors(self):
+        """ Is the index rebuilt when the list of editors is replaced?
+        """
+        self._open('a')
+        b = Editor(window=self.window, obj='b')
+        self.window.editors = [b]
+
+        self.assertIsNone(self.window.get_editor('a'))
+        self.assertIs(self.window.get_editor('b'), b)
+
+    def test_first_editor_wins(self):
+        """ Is the first editor in the window found (even if inserted)?
+        """
+        a = self._open('a')
+        b = Editor(window=self.window, obj='a')
+        self.window.editors.insert(0, b)
+
+        self.assertIs(self.window.get_editor('a'), b)
+
+        self.window.editors.remove(b)
+        self.assertIs(self.window.get_editor('a'), a)
+
+    def test_kind(self):
+        """ Is an editor of the same kind preferred?
+        """
+        a = self._open('a', kind='x')
+        b = self._open('a', kind='y')
+
+        self.assertIs(self.window.get_editor('a', 'x'), a)
+        self.assertIs(self.window.get_editor('a', 'y'), b)
+
+        # The default '_is_editing' accepts an editor of any kind.
+        self.assertIs(self.window.get_editor('a', 'z'), a)
+
+        # Changing the kind of an open editor moves it.
+        self.manager.add_editor(a, 'y')
+        self.assertIs(self.window.get_editor('a', 'y'), a)
+
+    def test_obj_changed(self):
+        """ Is an editor found by its new object when the object changes?
+        """
+        a = self._open('a')
+        a.obj = 'b'
+
+        self.assertIsNone(self.window.get_editor('a'))
+        self.assertIs(self.window.get_editor('b'), a)
+
+    def test_unhashable(self):
+        """ Are editors of objects that can't be hashed still found?
+        """
+        a = self._open(['a'])
+
+        self.assertIs(self.window.get_editor(['a']), a)
+
+    def test_new_window(self):
+        """ Is the index rebuilt for a new window?
+        """
+        self._open('a')
+
+        window = WorkbenchWindow()
+        b = Editor(window=window, obj='a')
+        window.editors.append(b)
+        self.manager.window = window
+
+        self.assertIs(self.manager.get_editor(window, 'a', None), b)
+
+
+class WorkbenchWindowIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.window = WorkbenchWindow()
+
+    def test_editor_by_id(self):
+        """ Is the Id index updated rather than rebuilt as editors come and go?
+        """
+        a = Editor(window=self.window, id='a')
+        self.window.editors.append(a)
+        self.assertIs(self.window.get_editor_by_id('a'), a)
+        index = self.window._editors_by_id
+
+        b = Editor(window=self.window, id='b')
+        self.window.editors.append(b)
+        self.assertIs(self.window.get_editor_by_id('b'), b)
+
+        self.window.editors.remove(a)
+        self.assertIsNone(self.window.get_editor_by_id('a'))
+
+        b.id = 'c'
+        self.assertIsNone(self.window.get_editor_by_id('b'))
+        self.assertIs(self.window.get_editor_by_id('c'), b)
+
+        self.assertIs(self.window._editors_by_id, index)
+
+    def test_replace_editors(self):
+        """ Is the Id index rebuilt when the list of editors is replaced?
+        """
+        a = Editor(window=self.window, id='a')
+        self.window.editors.append(a)
+        self.assertIs(self.window.get_editor_by_id('a'), a)
+
+        b = Editor(window=self.window, id='a')
+        self.window.editors = [b]
+        self.assertIs(self.window.get_editor_by_id('a'), b)
+
+    def test_first_perspective_wins(self):
+        """ Is the first perspective with an Id found?
+        """
+        a = Perspective(id='a')
+        b = Perspective(id='a')
+        self.window.perspectives = [a]
+        self.assertIs(self.window.get_perspective_by_id('a'), a)
+
+        self.window.perspectives.insert(0, b)
+        self.assertIs(self.window.get_perspective_by_id('a'), b)
+
+
+if __name__ == '__main__':
+    unittest.main()
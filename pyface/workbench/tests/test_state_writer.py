@@ -0,0 +1,90 @@
+# Standard library imports.
+import atexit
+import cPickle
+import os
+import shutil
+import tempfile
+import unittest
+
+# Major package imports.
+import mock
+
+# Local imports.
+from pyface.state_store import StateStore
+from pyface.workbench.state_writer import StateWriter
+
+
+class StateWriterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'state')
+        self.writer = StateWriter()
+
+    def tearDown(self):
+        self.writer.stop()
+        shutil.rmtree(self.directory)
+
+    def _read(self):
+        with open(self.filename, 'rb') as f:
+            return cPickle.load(f)
+
+    def test_write(self):
+        """ Is a snapshot written and no temporary file left behind?
+        """
+        self.writer.write(self.filename, {'a': 1})
+        self.assertTrue(self.writer.flush())
+        self.assertEqual(self._read(), {'a': 1})
+        self.assertEqual(os.listdir(self.directory), ['state'])
+
+    def test_replace(self):
+        """ Does a new snapshot replace the previously written one?
+        """
+        self.writer.write(self.filename, 1)
+        self.writer.flush()
+        self.writer.write(self.filename, 2)
+        self.writer.flush()
+        self.assertEqual(self._read(), 2)
+
+    def test_debounce(self):
+        """ Are pending snapshots replaced by newer ones?
+        """
+        for i in range(10):
+            self.writer.write(self.filename, i, delay=60)
+        self.assertFalse(os.path.exists(self.filename))
+        self.assertTrue(self.writer.flush(timeout=10))
+        self.assertEqual(self._read(), 9)
+
+    def test_failed_write_keeps_state(self):
+        """ Does a failed write leave the previous state intact?
+        """
+        self.writer.write(self.filename, 'saved')
+        self.writer.flush()
+        self.writer.write(self.filename, lambda: None)
+        self.writer.flush()
+        self.assertEqual(self._read(), 'saved')
+        self.assertEqual(os.listdir(self.directory), ['state'])
+
+    def test_write_state(self):
+        """ Are snapshots written to state stores?
+        """
+        store = StateStore()
+        self.writer.write_state(store, 'workbench', 'memento', 1, delay=60)
+        self.writer.write_state(store, 'workbench', 'memento', 2, delay=60)
+        self.writer.flush()
+        self.assertEqual(store.get('workbench', 'memento'), 2)
+
+    def test_flush_registered_at_exit_once(self):
+        """ Is the writer only flushed once at exit, however often its thread
+        is started?
+        """
+        with mock.patch.object(atexit, 'register') as register:
+            for i in range(3):
+                self.writer.write(self.filename, i)
+                self.writer.stop()
+
+        register.assert_called_once_with(self.writer.flush)
+
+
+if __name__ == '__main__':
+    unittest.main()
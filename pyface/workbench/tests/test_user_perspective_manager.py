@@ -0,0 +1,61 @@
+# Standard library imports.
+import os
+import shutil
+import tempfile
+import unittest
+
+# Local imports. The workbench API is imported first since the user
+# perspective manager module can't be imported on its own.
+import pyface.workbench.api
+from pyface.state_store import StateStore
+from pyface.workbench.user_perspective_manager import UserPerspectiveManager
+
+
+class UserPerspectiveManagerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = StateStore()
+
+        # The definitions as kept by older versions of the workbench.
+        self.filename = os.path.join(self.directory, '__user_perspective__')
+        with open(self.filename, 'w') as f:
+            f.write('__user_perspective_000000001__: One\n')
+            f.write('__user_perspective_000000002__: Two\n')
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def _create_manager(self):
+        return UserPerspectiveManager(state_location=self.directory,
+                                      state_store=self.store)
+
+    def test_migrate(self):
+        """ Are the old definitions migrated and the old file left in place?
+        """
+        manager = self._create_manager()
+        self.assertEqual(sorted(p.name for p in manager.perspectives),
+                         ['One', 'Two'])
+        self.assertTrue(os.path.exists(self.filename))
+
+        # The definitions are read from the store from now on.
+        self.assertEqual(
+            sorted(self.store.items('workbench.user_perspectives')),
+            [('__user_perspective_000000001__', 'One'),
+             ('__user_perspective_000000002__', 'Two')]
+        )
+
+    def test_migrate_once(self):
+        """ Do removed definitions stay removed even though the old file is
+        still there?
+        """
+        manager = self._create_manager()
+        for perspective in list(manager.perspectives):
+            manager.remove(perspective.id)
+
+        self.assertEqual(list(self._create_manager().perspectives), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,14 +6,23 @@ import logging
 import os
 
 # Enthought library imports.
+from pyface.state_store import StateStore, get_state_store
 from pyface.workbench.api import Perspective
-from traits.api import Any, Dict, HasTraits, Int, List, Property
+from traits.api import Any, Dict, HasTraits, Instance, Int, List, Property
 from traits.api import Unicode
 
 
 # Logging.
 logger = logging.getLogger(__name__)
 
+# The state store namespace in which the perspective names are kept (keyed by
+# perspective Id).
+NAMESPACE = 'workbench.user_perspectives'
+
+# The key (in the 'workbench' namespace) that records that the definitions
+# kept by older versions have been migrated to the state store.
+MIGRATED_KEY = 'user_perspectives_migrated'
+
 
 class UserPerspectiveManager(HasTraits):
     """ Manages a set of user perspectives. """
@@ -24,6 +33,10 @@ class UserPerspectiveManager(HasTraits):
     # will. This is used to persist window layout information, etc.
     state_location = Unicode
 
+    # The store in which the user perspective definitions are persisted. By
+    # default this is a database in the 'state_location' directory.
+    state_store = Instance(StateStore)
+
     # Next available user perspective id.
     next_id = Property(Int)
 
@@ -33,7 +46,8 @@ class UserPerspectiveManager(HasTraits):
     # The list of user defined perspective definitions.
     perspectives = Property(List)
 
-    # The name of the user defined perspectives definition file.
+    # The name of the file in which older versions kept the user defined
+    # perspective definitions (they are migrated to the state store).
     file_name = Property(Unicode)
 
     #### Private interface ####################################################
@@ -69,19 +83,19 @@ class UserPerspectiveManager(HasTraits):
         if self._id_to_perspective is None:
             self._id_to_perspective = dic = {}
             try:
-                fh = open( self.file_name, 'r' )
-                for line in fh:
-                    data = line.split( ':', 1 )
-                    if len( data ) == 2:
-                        id, name = data[0].strip(), data[1].strip()
-                        dic[ id ] = Perspective(
-                            id               = id,
-                            name             = name,
-                            show_editor_area = False
-                        )
-                fh.close()
+                items = self.state_store.items( NAMESPACE )
+                if len( items ) == 0:
+                    items = self._migrate_persistent_data()
+
+                for id, name in items:
+                    dic[ id ] = Perspective(
+                        id               = id,
+                        name             = name,
+                        show_editor_area = False
+                    )
             except:
-                pass
+                logger.exception( "Could not read the user defined "
+                                  "perspective definitions" )
 
         return self._id_to_perspective
 
@@ -95,6 +109,13 @@ class UserPerspectiveManager(HasTraits):
 
         return os.path.join(self.state_location, '__user_perspective__')
 
+    #### Initializers #########################################################
+
+    def _state_store_default(self):
+        """ Trait initializer. """
+
+        return get_state_store(os.path.join(self.state_location, 'state.db'))
+
     #### Methods ##############################################################
 
     def create_perspective(self, name, show_editor_area=True):
@@ -202,18 +223,49 @@ class UserPerspectiveManager(HasTraits):
     # Private interface.
     ###########################################################################
 
+    def _migrate_persistent_data(self):
+        """ Move the definitions saved by an older version of the workbench
+        into the state store.
+
+        Return the migrated (id, name) pairs.
+
+        """
+
+        # Older versions of the workbench still read the file, so it is left
+        # in place and the migration is recorded instead (otherwise the
+        # definitions would come back once every user perspective had been
+        # removed).
+        items = []
+        if os.path.exists( self.file_name ) and \
+           not self.state_store.get( 'workbench', MIGRATED_KEY, False ):
+            fh = open( self.file_name, 'r' )
+            for line in fh:
+                data = line.split( ':', 1 )
+                if len( data ) == 2:
+                    items.append( ( data[0].strip(), data[1].strip() ) )
+            fh.close()
+
+            with self.state_store.transaction():
+                for id, name in items:
+                    self.state_store.set( NAMESPACE, id, name )
+                self.state_store.set( 'workbench', MIGRATED_KEY, True )
+
+        return items
+
     def _update_persistent_data(self):
-        """ Update the persistent file information. """
+        """ Update the persistent information. """
 
         try:
-            fh = open( self.file_name, 'w' )
-            fh.write( '\n'.join( [ '%s: %s' % ( p.id, p.name )
-                                   for p in self.perspectives ] ) )
-            fh.close()
+            # Replace all of the definitions in a single transaction so that
+            # they are never left half written.
+            with self.state_store.transaction():
+                self.state_store.clear( NAMESPACE )
+                for p in self.perspectives:
+                    self.state_store.set( NAMESPACE, p.id, p.name )
 
         except:
-            logger.error( "Could not write the user defined perspective "
-                          "definition file: " + self.file_name )
+            logger.exception( "Could not write the user defined perspective "
+                              "definitions" )
 
         return
 
@@ -9,15 +9,18 @@ import os
 # Enthought library imports.
 from traits.etsconfig.api import ETSConfig
 from pyface.api import NO
-from traits.api import Bool, Callable, Event, HasTraits, provides
-from traits.api import Instance, List, Unicode, Vetoable
+from pyface.state_store import StateStore, get_state_store
+from traits.api import Any, Bool, Callable, Event, Float, HasTraits
+from traits.api import Instance, List, Unicode, Vetoable, provides
 from traits.api import VetoableEvent
 
 # Local imports.
 from .i_editor_manager import IEditorManager
 from .i_workbench import IWorkbench
+from .state_writer import StateWriter
 from .user_perspective_manager import UserPerspectiveManager
 from .workbench_window import WorkbenchWindow
+from .workbench_window_memento import WorkbenchWindowMemento
 from .window_event import WindowEvent, VetoableWindowEvent
 
 
@@ -95,8 +98,33 @@ class Workbench(HasTraits):
     # method then you obviously don't need to set this trait!
     window_factory = Callable
 
+    # The interval (in seconds) between periodic saves of the active window's
+    # layout. If zero then the layout is only saved when the last window is
+    # closed.
+    autosave_interval = Float(0)
+
+    # The time (in seconds) that a periodic save is held back so that a newer
+    # one can replace it.
+    autosave_delay = Float(1)
+
+    # The store in which window layouts and user perspectives are persisted.
+    # By default this is a database in the 'state_location' directory.
+    state_store = Instance(StateStore)
+
+    # The writer used to save state in the background.
+    state_writer = Instance(StateWriter, ())
+
+    # The longest time (in seconds) that closing the last window waits for the
+    # state writer to save the window's layout. Anything still pending after
+    # that is written when the process exits.
+    exit_flush_timeout = Float(5)
+
     #### Private interface ####################################################
 
+    # The timer that drives periodic saves (None if they are disabled or no
+    # window is open).
+    _autosave_timer = Any
+
     # An 'explicit' exit is when the the 'exit' method is called.
     # An 'implicit' exit is when the user closes the last open window.
     _explicit_exit = Bool(False)
@@ -252,6 +280,11 @@ class Workbench(HasTraits):
 
         return state_location
 
+    def _state_store_default(self):
+        """ Trait initializer. """
+
+        return get_state_store(os.path.join(self.state_location, 'state.db'))
+
     def _undo_manager_default(self):
         """ Trait initializer. """
 
@@ -266,7 +299,10 @@ class Workbench(HasTraits):
     def _user_perspective_manager_default(self):
         """ Trait initializer. """
 
-        return UserPerspectiveManager(state_location=self.state_location)
+        return UserPerspectiveManager(
+            state_location = self.state_location,
+            state_store    = self.state_store
+        )
 
     ###########################################################################
     # Protected 'Workbench' interface.
@@ -309,39 +345,129 @@ class Workbench(HasTraits):
     def _restore_window_layout(self, window):
         """ Restore the window layout. """
 
-        filename = os.path.join(self.state_location, 'window_memento')
-        if os.path.exists(filename):
-            try:
-                # If the memento class itself has been modified then there
-                # is a chance that the unpickle will fail. If so then we just
-                # carry on as if there was no memento!
-                f = open(filename, 'rb')
-                memento = cPickle.load(f)
-                f.close()
-
-                # The memento doesn't actually get used until the window is
-                # opened, so there is nothing to go wrong in this step!
+        # Make sure that we read the latest layout that has been saved.
+        self.state_writer.flush()
+
+        try:
+            # If the memento class itself has been modified then there is a
+            # chance that the unpickle will fail. If so then we just carry on
+            # as if there was no memento!
+            memento = self.state_store.get('workbench', 'window_memento')
+            if memento is None:
+                memento = self._migrate_window_layout()
+
+            # The memento doesn't actually get used until the window is
+            # opened, so there is nothing to go wrong in this step!
+            if memento is not None:
                 window.set_memento(memento)
 
-            # If *anything* goes wrong then simply log the error and carry on
-            # with no memento!
-            except:
-                logger.exception('restoring window layout from %s', filename)
+        # If *anything* goes wrong then simply log the error and carry on with
+        # no memento!
+        except:
+            logger.exception('restoring window layout')
+
+        return
+
+    def _migrate_window_layout(self):
+        """ Move a window layout saved by an older version of the workbench
+        into the state store.
+
+        Return the memento, or None if there is nothing to migrate.
+
+        """
+
+        filename = os.path.join(self.state_location, 'window_memento')
+        if not os.path.exists(filename):
+            return None
+
+        f = open(filename, 'rb')
+        try:
+            memento = cPickle.load(f)
+
+        finally:
+            f.close()
+
+        # The file is left in place so that older versions of the workbench
+        # still find the layout (it is not migrated again once the memento is
+        # in the store).
+        self.state_store.set('workbench', 'window_memento', memento)
+
+        return memento
+
+    def _save_window_layout(self, window, delay=0):
+        """ Save the window layout.
+
+        The memento is snapshotted here (on the GUI thread) but it is pickled
+        and saved in the state store by the state writer in the background.
+
+        """
+
+        self.state_writer.write_state(
+            self.state_store, 'workbench', 'window_memento',
+            self._snapshot_memento(window.get_memento()), delay
+        )
+
+        return
+
+    def _snapshot_memento(self, memento):
+        """ Return a copy of a window memento that is safe to hand over to
+        the state writer.
+
+        The toolkit-specific mementos are created afresh every time the
+        window's memento is taken (and are never modified afterwards) so we
+        only need to copy the memento itself and its containers.
+
+        """
+
+        return WorkbenchWindowMemento(
+            active_perspective_id = memento.active_perspective_id,
+            editor_area_memento   = memento.editor_area_memento,
+            perspective_mementos  = dict(memento.perspective_mementos),
+            position              = memento.position,
+            size                  = memento.size,
+            toolkit_data          = memento.toolkit_data
+        )
+
+    def _autosave(self):
+        """ Save the layout of the active window (called periodically). """
+
+        if self.active_window is not None:
+            self._save_window_layout(self.active_window, self.autosave_delay)
+
+        return
+
+    def _start_autosave(self):
+        """ Start periodic saves (if they are enabled). """
+
+        self._stop_autosave()
+
+        if self.autosave_interval > 0 and len(self.windows) > 0:
+            from pyface.timer.api import Timer
+
+            self._autosave_timer = Timer(
+                int(self.autosave_interval * 1000), self._autosave
+            )
 
         return
 
-    def _save_window_layout(self, window):
-        """ Save the window layout. """
+    def _stop_autosave(self):
+        """ Stop periodic saves. """
 
-        # Save the window layout.
-        f = open(os.path.join(self.state_location, 'window_memento'), 'wb')
-        cPickle.dump(window.get_memento(), f)
-        f.close()
+        if self._autosave_timer is not None:
+            self._autosave_timer.Stop()
+            self._autosave_timer = None
 
         return
 
     #### Trait change handlers ################################################
 
+    def _autosave_interval_changed(self):
+        """ Static trait change handler. """
+
+        self._start_autosave()
+
+        return
+
     def _on_window_activated(self, window, trait_name, event):
         """ Dynamic trait change handler. """
 
@@ -373,6 +499,10 @@ class Workbench(HasTraits):
         # window comes from lower in the stack to be the active window.
         self.active_window = window
 
+        # Start periodic saves when the first window opens.
+        if self._autosave_timer is None:
+            self._start_autosave()
+
         # Event notification.
         self.window_opened = WindowEvent(window=window)
 
@@ -414,6 +544,13 @@ class Workbench(HasTraits):
 
         # Was this the last window?
         if len(self.windows) == 0:
+            self._stop_autosave()
+
+            # The window has gone, so give its layout the chance to reach the
+            # disk before anything gets the chance to end the process (but
+            # don't hang the GUI if the disk or the state store is slow).
+            self.state_writer.flush(timeout=self.exit_flush_timeout)
+
             # Event notification.
             self.exited = self
 
@@ -6,7 +6,7 @@ import logging
 
 # Enthought library imports.
 from pyface.api import ApplicationWindow, GUI
-from traits.api import Callable, Constant, Delegate, Event, Instance
+from traits.api import Bool, Callable, Constant, Delegate, Event, Instance
 from traits.api import List, Str, Tuple, Unicode, Vetoable
 from traits.api import on_trait_change, provides
 
@@ -16,6 +16,7 @@ from .i_editor_manager import IEditorManager
 from .i_perspective import IPerspective
 from .i_view import IView
 from .i_workbench_part import IWorkbenchPart
+from .list_index import ListIndex
 from .perspective import Perspective
 from .workbench_window_layout import WorkbenchWindowLayout
 from .workbench_window_memento import WorkbenchWindowMemento
@@ -116,11 +117,28 @@ class WorkbenchWindow(ApplicationWindow):
     # editors etc).
     layout = Instance(WorkbenchWindowLayout)
 
+    # If True then the controls of views that start off hidden (e.g. those
+    # stacked behind other views in a tab group) are not created until the
+    # views are first shown, and the dock widgets of views that are not part
+    # of the active perspective are kept for reuse. This can make showing and
+    # switching between perspectives with many views much faster, but views
+    # must cope with their control being None while they are hidden. Not all
+    # toolkits support this.
+    lazy_views = Bool(False)
+
     #### 'Private' interface ##################################################
 
     # The state of the window suitable for pickling etc.
     _memento = Instance(WorkbenchWindowMemento)
 
+    # Indexes of the editors, views and perspectives keyed by their Ids (None
+    # if an index has not been built yet). Once built, an index is kept up to
+    # date as parts are added and removed, and is only rebuilt if the whole
+    # list is replaced.
+    _editors_by_id = Instance(ListIndex)
+    _views_by_id = Instance(ListIndex)
+    _perspectives_by_id = Instance(ListIndex)
+
     ###########################################################################
     # 'Window' interface.
     ###########################################################################
@@ -393,14 +411,10 @@ class WorkbenchWindow(ApplicationWindow):
 
         """
 
-        for editor in self.editors:
-            if editor.id == id:
-                break
-
-        else:
-            editor = None
+        if self._editors_by_id is None:
+            self._editors_by_id = self._index_by_id(self.editors)
 
-        return editor
+        return self._editors_by_id.get_first(id)
 
     def get_part_by_id(self, id):
         """ Return the workbench part with the specified Id.
@@ -418,16 +432,12 @@ class WorkbenchWindow(ApplicationWindow):
 
         """
 
-        for perspective in self.perspectives:
-            if perspective.id == id:
-                break
-
-        else:
-            if id == Perspective.DEFAULT_ID:
-                perspective = Perspective()
+        if self._perspectives_by_id is None:
+            self._perspectives_by_id = self._index_by_id(self.perspectives)
 
-            else:
-                perspective = None
+        perspective = self._perspectives_by_id.get_first(id)
+        if perspective is None and id == Perspective.DEFAULT_ID:
+            perspective = Perspective()
 
         return perspective
 
@@ -454,14 +464,10 @@ class WorkbenchWindow(ApplicationWindow):
 
         """
 
-        for view in self.views:
-            if view.id == id:
-                break
-
-        else:
-            view = None
+        if self._views_by_id is None:
+            self._views_by_id = self._index_by_id(self.views)
 
-        return view
+        return self._views_by_id.get_first(id)
 
     def hide_editor_area(self):
         """ Hide the editor area. """
@@ -784,6 +790,41 @@ class WorkbenchWindow(ApplicationWindow):
 
         return
 
+    def _index_by_id(self, parts):
+        """ Return an index of parts keyed by their Ids.
+
+        If more than one part has the same Id then the first one wins (just as
+        it would in a linear search).
+
+        """
+
+        return ListIndex(parts, key=lambda part: part.id)
+
+    def _update_index_by_id(self, index_name, parts, name, new):
+        """ Update an index of parts when the parts change. """
+
+        index = getattr(self, index_name)
+        if index is not None:
+            # Parts that are added or removed are simply added to or removed
+            # from the index. Only a new list of parts requires it to be
+            # rebuilt (which is done the next time that it is used).
+            if name.endswith('_items'):
+                index.update(new, parts)
+
+            else:
+                setattr(self, index_name, None)
+
+        return
+
+    def _move_in_index_by_id(self, index_name, parts, part, old, new):
+        """ Move a part whose Id has changed in an index of parts. """
+
+        index = getattr(self, index_name)
+        if index is not None:
+            index.move(part, old, new, parts)
+
+        return
+
     def _restore_contents(self):
         """ Restore the contents of the window. """
 
@@ -898,6 +939,60 @@ class WorkbenchWindow(ApplicationWindow):
 
         return
 
+    @on_trait_change('editors, editors_items')
+    def _update_editors_by_id(self, name, new):
+        """ Dynamic trait change handler. """
+
+        self._update_index_by_id('_editors_by_id', self.editors, name, new)
+
+        return
+
+    @on_trait_change('editors:id')
+    def _move_editor_by_id(self, editor, name, old, new):
+        """ Dynamic trait change handler. """
+
+        self._move_in_index_by_id(
+            '_editors_by_id', self.editors, editor, old, new
+        )
+
+        return
+
+    @on_trait_change('views, views_items')
+    def _update_views_by_id(self, name, new):
+        """ Dynamic trait change handler. """
+
+        self._update_index_by_id('_views_by_id', self.views, name, new)
+
+        return
+
+    @on_trait_change('views:id')
+    def _move_view_by_id(self, view, name, old, new):
+        """ Dynamic trait change handler. """
+
+        self._move_in_index_by_id('_views_by_id', self.views, view, old, new)
+
+        return
+
+    @on_trait_change('perspectives, perspectives_items')
+    def _update_perspectives_by_id(self, name, new):
+        """ Dynamic trait change handler. """
+
+        self._update_index_by_id(
+            '_perspectives_by_id', self.perspectives, name, new
+        )
+
+        return
+
+    @on_trait_change('perspectives:id')
+    def _move_perspective_by_id(self, perspective, name, old, new):
+        """ Dynamic trait change handler. """
+
+        self._move_in_index_by_id(
+            '_perspectives_by_id', self.perspectives, perspective, old, new
+        )
+
+        return
+
     @on_trait_change('editors.has_focus')
     def _on_editor_has_focus_changed(self, obj, trait_name, old, new):
         """ Dynamic trait change handler. """